@@ -31,6 +31,9 @@ class DagReportResponse(BaseModel):
     task_num: int
     dags: str
     warning_num: int
+    cpu_time: float
+    peak_rss: int
+    top_imports: dict[str, float]
 
 
 class DagReportCollectionResponse(BaseModel):
@@ -236,6 +236,37 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIHeartbeatBatchItem(TIHeartbeatInfo):
+    """Schema for the heartbeat of one TaskInstance in the batched heartbeat endpoint."""
+
+    id: uuid.UUID
+    token: str
+    """The auth token of the TaskInstance, as the token of the request is only valid for one of them."""
+
+
+class TIHeartbeatBatchPayload(StrictBaseModel):
+    """Schema for the batched TaskInstance heartbeat endpoint."""
+
+    task_instances: list[TIHeartbeatBatchItem]
+
+
+class TIHeartbeatBatchResult(BaseModel):
+    """Result of the heartbeat of one TaskInstance in the batched heartbeat endpoint."""
+
+    id: uuid.UUID
+    status_code: int
+    """The status code the single TaskInstance heartbeat endpoint would have returned."""
+    detail: dict[str, Any] | str | None = None
+    refreshed_token: str | None = None
+    """A new auth token for the TaskInstance, when its current one is about to expire."""
+
+
+class TIHeartbeatBatchResponse(BaseModel):
+    """Response of the batched TaskInstance heartbeat endpoint."""
+
+    results: list[TIHeartbeatBatchResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
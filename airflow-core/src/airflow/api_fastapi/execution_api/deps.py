@@ -113,6 +113,10 @@ class JWTReissuer:
             30,
         )
 
+    def needs_refresh(self, claims: dict[str, Any]) -> bool:
+        """Whether a token with the given claims is about to run out, and a new one should be issued."""
+        return claims["exp"] - int(time.time()) <= self.refresh_when_less_than
+
     async def __call__(
         self,
         response: Response,
@@ -152,4 +156,6 @@ class JWTReissuer:
                 log.warning("Error refreshing Task JWT", err=f"{type(e).__name__}: {e}")
 
 
-JWTRefresherDep = Depends(JWTReissuer())
+jwt_reissuer = JWTReissuer()
+
+JWTRefresherDep = Depends(jwt_reissuer)
@@ -29,7 +29,7 @@ from uuid import UUID
 import attrs
 import structlog
 from cadwyn import VersionedAPIRouter
-from fastapi import Body, HTTPException, Query, status
+from fastapi import Body, Depends, HTTPException, Query, status
 from pydantic import JsonValue
 from sqlalchemy import func, or_, tuple_, update
 from sqlalchemy.exc import NoResultFound, SQLAlchemyError
@@ -38,6 +38,7 @@ from sqlalchemy.sql import select
 from structlog.contextvars import bind_contextvars
 
 from airflow._shared.timezones import timezone
+from airflow.api_fastapi.auth.tokens import JWTGenerator, JWTValidator
 from airflow.api_fastapi.common.dagbag import DagBagDep, get_latest_version_of_dag
 from airflow.api_fastapi.common.db.common import SessionDep
 from airflow.api_fastapi.common.types import UtcDateTime
@@ -47,6 +48,10 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskStatesResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
+    TIHeartbeatBatchItem,
+    TIHeartbeatBatchPayload,
+    TIHeartbeatBatchResponse,
+    TIHeartbeatBatchResult,
     TIHeartbeatInfo,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
@@ -56,7 +61,7 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TISuccessStatePayload,
     TITerminalStatePayload,
 )
-from airflow.api_fastapi.execution_api.deps import JWTBearerTIPathDep
+from airflow.api_fastapi.execution_api.deps import DepContainer, JWTBearerTIPathDep, jwt_reissuer
 from airflow.exceptions import TaskNotFound
 from airflow.models.asset import AssetActive
 from airflow.models.dagrun import DagRun as DR
@@ -648,6 +653,114 @@ def ti_heartbeat(
     log.debug("Heartbeat updated", state=previous_state)
 
 
+@attrs.define
+class _ValidatedHeartbeats:
+    heartbeats: list[TIHeartbeatBatchItem] = attrs.field(factory=list)
+    """The heartbeats of the TaskInstances whose token is valid."""
+    refreshed_tokens: dict[UUID, str] = attrs.field(factory=dict)
+    rejected: dict[UUID, TIHeartbeatBatchResult] = attrs.field(factory=dict)
+
+
+async def _validate_heartbeat_tokens(
+    ti_payload: TIHeartbeatBatchPayload, services=DepContainer
+) -> _ValidatedHeartbeats:
+    """Check the token of each TaskInstance of a batch, like ``JWTBearerTIPathDep`` does for a single one."""
+    validator: JWTValidator = await services.aget(JWTValidator)
+    generator: JWTGenerator | None = None
+    validated = _ValidatedHeartbeats()
+    for heartbeat in ti_payload.task_instances:
+        try:
+            claims = await validator.avalidated_claims(
+                heartbeat.token, {"sub": {"essential": True, "value": str(heartbeat.id)}}
+            )
+        except Exception as err:
+            log.warning("Failed to validate JWT", exc_info=True, ti_id=str(heartbeat.id))
+            validated.rejected[heartbeat.id] = TIHeartbeatBatchResult(
+                id=heartbeat.id, status_code=status.HTTP_403_FORBIDDEN, detail=f"Invalid auth token: {err}"
+            )
+            continue
+        validated.heartbeats.append(heartbeat)
+        try:
+            if jwt_reissuer.needs_refresh(claims):
+                generator = generator or await services.aget(JWTGenerator)
+                validated.refreshed_tokens[heartbeat.id] = generator.generate(claims)
+        except Exception as e:
+            # Don't fail the heartbeat if there's a problem
+            log.warning("Error refreshing Task JWT", err=f"{type(e).__name__}: {e}", ti_id=str(heartbeat.id))
+    return validated
+
+
+@router.put(
+    "/heartbeats",
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"description": "Invalid payload for the heartbeats"},
+    },
+)
+def ti_heartbeat_batch(
+    validated: Annotated[_ValidatedHeartbeats, Depends(_validate_heartbeat_tokens)],
+    session: SessionDep,
+) -> TIHeartbeatBatchResponse:
+    """
+    Update the heartbeats of many TaskInstances at once, e.g. of all the tasks supervised by a worker process.
+
+    Each TaskInstance gets the result the single heartbeat endpoint would have given it, with the status code
+    and the detail of the error if any, but the state of all of them is read in one query, and the heartbeats
+    of the ones still running are updated in one statement.
+    """
+    results = validated.rejected.copy()
+    heartbeats = {heartbeat.id: heartbeat for heartbeat in validated.heartbeats}
+    log.debug("Processing heartbeats", num_tis=len(heartbeats))
+
+    alive: list[str] = []
+    if heartbeats:
+        # Lock the rows in a consistent order, so that concurrent batches cannot deadlock each other
+        current = session.execute(
+            select(TI.id, TI.state, TI.hostname, TI.pid)
+            .where(TI.id.in_([str(ti_id) for ti_id in heartbeats]))
+            .order_by(TI.id)
+            .with_for_update()
+        )
+        current_by_id = {UUID(str(ti_id)): (state, hostname, pid) for ti_id, state, hostname, pid in current}
+        for ti_id, heartbeat in heartbeats.items():
+            detail: dict[str, Any] | None = None
+            if ti_id not in current_by_id:
+                status_code = status.HTTP_404_NOT_FOUND
+                detail = {"reason": "not_found", "message": "Task Instance not found"}
+            else:
+                previous_state, hostname, pid = current_by_id[ti_id]
+                if hostname != heartbeat.hostname or pid != heartbeat.pid:
+                    status_code = status.HTTP_409_CONFLICT
+                    detail = {
+                        "reason": "running_elsewhere",
+                        "message": "TI is already running elsewhere",
+                        "current_hostname": hostname,
+                        "current_pid": pid,
+                    }
+                elif previous_state != TaskInstanceState.RUNNING:
+                    status_code = status.HTTP_409_CONFLICT
+                    detail = {
+                        "reason": "not_running",
+                        "message": "TI is no longer in the running state and task should terminate",
+                        "current_state": previous_state,
+                    }
+                else:
+                    status_code = status.HTTP_204_NO_CONTENT
+                    alive.append(str(ti_id))
+            if detail:
+                log.warning("Rejected heartbeat", ti_id=str(ti_id), **detail)
+            results[ti_id] = TIHeartbeatBatchResult(
+                id=ti_id,
+                status_code=status_code,
+                detail=detail,
+                refreshed_token=validated.refreshed_tokens.get(ti_id),
+            )
+
+    if alive:
+        session.execute(update(TI).where(TI.id.in_(alive)).values(last_heartbeat_at=timezone.utcnow()))
+    log.debug("Heartbeats updated", num_alive=len(alive))
+    return TIHeartbeatBatchResponse(results=list(results.values()))
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
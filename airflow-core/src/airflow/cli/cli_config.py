@@ -882,6 +882,11 @@ ARG_ALLOW_MULTIPLE = Arg(
     help="If passed, this command will be successful even if multiple matching alive jobs are found.",
 )
 
+ARG_LOOP_PROFILE_FILE = Arg(
+    ("--profile-file",),
+    help="The scheduler loop profile to read. Defaults to [scheduler] loop_profiling_output_file.",
+)
+
 # triggerer
 ARG_CAPACITY = Arg(
     ("--capacity",),
@@ -1748,6 +1753,17 @@ JOBS_COMMANDS = (
             "    $ airflow jobs check --job-type SchedulerJob --allow-multiple --limit 100"
         ),
     ),
+    ActionCommand(
+        name="loop-profile",
+        help="Summarize where the time of the local scheduler loop goes, by phase",
+        description=(
+            "Summarize the wall time, SQL statements and rows of each phase of the scheduler loop, "
+            "as recorded by a scheduler running with [scheduler] loop_profiling enabled. "
+            "Send SIGUSR2 to the scheduler to write its latest profiles first."
+        ),
+        func=lazy_load_command("airflow.cli.commands.jobs_command.loop_profile"),
+        args=(ARG_LOOP_PROFILE_FILE, ARG_OUTPUT, ARG_VERBOSE),
+    ),
 )
 
 DB_MANAGERS_COMMANDS = (
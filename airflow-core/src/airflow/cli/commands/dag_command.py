@@ -520,6 +520,9 @@ def dag_report(args) -> None:
             "dag_num": x.dag_num,
             "task_num": x.task_num,
             "dags": sorted(ast.literal_eval(x.dags)),
+            "cpu_time": x.cpu_time,
+            "peak_rss": x.peak_rss,
+            "top_imports": x.top_imports,
         },
     )
 
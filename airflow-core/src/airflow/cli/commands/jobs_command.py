@@ -20,7 +20,10 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import select
 
+from airflow.cli.simple_table import AirflowConsole
+from airflow.configuration import conf
 from airflow.jobs.job import Job
+from airflow.utils.cli import suppress_logs_and_warning
 from airflow.utils.net import get_hostname
 from airflow.utils.providers_configuration_loader import providers_configuration_loaded
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -60,3 +63,19 @@ def check(args, session: Session = NEW_SESSION) -> None:
         print("Found one alive job.")
     else:
         print(f"Found {count_alive_jobs} alive jobs.")
+
+
+@suppress_logs_and_warning
+@providers_configuration_loaded
+def loop_profile(args) -> None:
+    """Summarize the profile of the scheduler loop, by phase."""
+    from airflow.jobs.scheduler_loop_profiler import read_profiles, summarize
+
+    path = args.profile_file or conf.get("scheduler", "loop_profiling_output_file")
+    if not path:
+        raise SystemExit("No scheduler loop profile file configured, use --profile-file.")
+    try:
+        profiles = read_profiles(path)
+    except FileNotFoundError:
+        raise SystemExit(f"No scheduler loop profile found at {path}. Is [scheduler] loop_profiling enabled?")
+    AirflowConsole().print_as(data=summarize(profiles), output=args.output)
@@ -415,11 +415,14 @@ class AirflowConfigParser(ConfigParser):
         ("core", "default_task_weight_rule"): sorted(WeightRule.all_weight_rules()),
         ("core", "dag_ignore_file_syntax"): ["regexp", "glob"],
         ("core", "mp_start_method"): multiprocessing.get_all_start_methods(),
+        ("core", "serialized_dag_storage_format"): ["json", "segmented"],
         ("dag_processor", "file_parsing_sort_mode"): [
             "modified_time",
             "random_seeded_by_host",
             "alphabetical",
+            "parse_cost",
         ],
+        ("scheduler", "critical_section_query_mode"): ["iterative", "windowed"],
         ("logging", "logging_level"): _available_logging_levels,
         ("logging", "fab_logging_level"): _available_logging_levels,
         # celery_logging_level can be empty, which uses logging_level as fallback
@@ -0,0 +1,140 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Event driven detection of the changes to the files of a local DAG bundle."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from watchfiles import Change
+
+log = logging.getLogger(__name__)
+
+
+class BundleChanges(NamedTuple):
+    """Changes to the files of a bundle since they were last read."""
+
+    modified: set[Path]
+    """Paths, relative to the bundle, of the files that were modified."""
+    deleted: set[Path]
+    """Paths, relative to the bundle, of the files and directories that were deleted."""
+    rescan: bool
+    """Whether the bundle must be listed again, e.g. because files were added, or its ignore rules changed."""
+
+
+class BundleFileWatcher:
+    """
+    Watch the files of a local DAG bundle for changes, in a background thread.
+
+    This uses the native file system notifications of the platform (e.g. inotify on Linux), through the
+    ``watchfiles`` library. Changes are accumulated until ``get_changes`` is called.
+
+    :param path: the root directory of the bundle
+    """
+
+    # How often, in milliseconds, the background thread wakes up when no change happens
+    WAKE_UP_INTERVAL_MS = 250
+    # How long to wait, in seconds, for the files of the bundle to be watched when starting
+    START_TIMEOUT = 30.0
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).resolve()
+        self._lock = threading.Lock()
+        self._modified: set[Path] = set()
+        self._deleted: set[Path] = set()
+        self._rescan = False
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> bool:
+        """
+        Start watching the bundle. Returns False if file system notifications are not available.
+
+        This returns once the files of the bundle are watched, so that the changes made after it returns
+        are all seen.
+        """
+        try:
+            import watchfiles  # noqa: F401
+        except ImportError:
+            log.warning("Cannot watch the files of DAG bundles, watchfiles is not installed")
+            return False
+        self._thread = threading.Thread(target=self._watch, name=f"bundle-watcher-{self.path}", daemon=True)
+        self._thread.start()
+        # The stop event is set when the watcher stops on its own, e.g. when the bundle does not exist
+        if not self._ready.wait(self.START_TIMEOUT) or self._stop_event.is_set():
+            log.warning("Cannot watch the files of %s, they are listed instead", self.path)
+            self.stop()
+            return False
+        return True
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _watch(self) -> None:
+        import watchfiles
+
+        try:
+            # The watches of the files are all registered before the first changes, or the first wake-up
+            # without changes, are yielded
+            for changes in watchfiles.watch(
+                self.path,
+                stop_event=self._stop_event,
+                rust_timeout=self.WAKE_UP_INTERVAL_MS,
+                yield_on_timeout=True,
+                raise_interrupt=False,
+                ignore_permission_denied=True,
+            ):
+                self._ready.set()
+                if changes:
+                    self._record(changes)
+        except Exception:
+            log.exception("Stopped watching the files of %s", self.path)
+        finally:
+            self._stop_event.set()
+            self._ready.set()
+
+    def _record(self, changes: set[tuple[Change, str]]) -> None:
+        from watchfiles import Change
+
+        with self._lock:
+            # Changes are not ordered within a batch: a file both modified and deleted was deleted last,
+            # or it was also added afterwards.
+            for change, path in sorted(changes, key=lambda c: c[0] == Change.deleted):
+                rel_path = Path(path).relative_to(self.path)
+                if change == Change.added or rel_path.name == ".airflowignore":
+                    self._rescan = True
+                elif change == Change.modified:
+                    self._modified.add(rel_path)
+                else:
+                    self._modified.discard(rel_path)
+                    self._deleted.add(rel_path)
+
+    def get_changes(self) -> BundleChanges:
+        """Return the changes seen since the last call, and forget them."""
+        # Changes are not seen anymore if the watcher stopped, so the bundle must always be listed
+        watching = self._thread is not None and self._thread.is_alive()
+        with self._lock:
+            changes = BundleChanges(self._modified, self._deleted, self._rescan or not watching)
+            self._modified, self._deleted, self._rescan = set(), set(), False
+        return changes
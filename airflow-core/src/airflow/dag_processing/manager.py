@@ -21,6 +21,8 @@ from __future__ import annotations
 
 import contextlib
 import functools
+import gc
+import heapq
 import importlib
 import inspect
 import logging
@@ -51,9 +53,17 @@ import airflow.models
 from airflow._shared.timezones import timezone
 from airflow.api_fastapi.execution_api.app import InProcessExecutionAPI
 from airflow.configuration import conf
+from airflow.dag_processing.bundles.local import LocalDagBundle
 from airflow.dag_processing.bundles.manager import DagBundlesManager
+from airflow.dag_processing.bundles.watcher import BundleFileWatcher
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParseProfile,
+    DagFileParseWorkerProcess,
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+)
+from airflow.dag_processing.sharding import FileShardRing, get_live_dag_processor_ids
 from airflow.exceptions import AirflowException
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
@@ -83,7 +93,9 @@ if TYPE_CHECKING:
 
     from airflow.callbacks.callback_requests import CallbackRequest
     from airflow.dag_processing.bundles.base import BaseDagBundle
+    from airflow.dag_processing.bundles.watcher import BundleChanges
     from airflow.sdk.api.client import Client
+    from airflow.serialization.serialized_objects import LazyDeserializedDAG
 
 
 class DagParsingStat(NamedTuple):
@@ -103,6 +115,12 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    source_fingerprint: str | None = None
+    bundle_imports: list[Path] | None = None
+    num_tasks: int = 0
+    last_cpu_time: float | None = None
+    last_peak_rss: int | None = None
+    last_top_imports: dict[str, float] | None = None
 
 
 @dataclass(frozen=True)
@@ -121,6 +139,51 @@ class DagFileInfo:
         return self.bundle_path / self.rel_path
 
 
+class ParsedFile(NamedTuple):
+    """The result of parsing a file, and stats about the parser process, to be written to the DB."""
+
+    file: DagFileInfo
+    run_duration: float
+    finish_time: datetime
+    run_count: int
+    bundle_version: str | None
+    parsing_result: DagFileParsingResult | None
+
+
+class _ParseCycle(NamedTuple):
+    """Files queued together for parsing, to compare how long parsing them took to the prediction."""
+
+    start: float
+    predicted_duration: float
+    files: set[DagFileInfo]
+
+
+def _predict_parse_time(durations: Iterable[float], parallelism: int) -> float:
+    """Predict how long parsing files takes, when each is started as soon as a parsing process is free."""
+    finish_times = [0.0] * max(parallelism, 1)
+    for duration in durations:
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
+
+
+@attrs.define
+class _HousekeepingSchedule:
+    """
+    When to run a housekeeping query of the parsing loop next.
+
+    The query runs on every loop while it finds something to do, and backs off exponentially, up to
+    ``max_interval`` seconds, while it does not.
+    """
+
+    max_interval: float
+    interval: float = 0
+    next_run: float = 0
+
+    def reschedule(self, found_work: bool, now: float) -> None:
+        self.interval = 0 if found_work else min(max(self.interval * 2, 0.5), self.max_interval)
+        self.next_run = now + self.interval
+
+
 def _config_int_factory(section: str, key: str):
     return functools.partial(conf.getint, section, key)
 
@@ -129,6 +192,10 @@ def _config_bool_factory(section: str, key: str):
     return functools.partial(conf.getboolean, section, key)
 
 
+def _config_float_factory(section: str, key: str):
+    return functools.partial(conf.getfloat, section, key)
+
+
 def _config_get_factory(section: str, key: str):
     return functools.partial(conf.get, section, key)
 
@@ -192,6 +259,8 @@ class DagFileProcessorManager(LoggingMixin):
 
     heartbeat: Callable[[], None] = attrs.field(default=lambda: None)
     """An overridable heartbeat called once every time around the loop"""
+    job_id: int | None = None
+    """Id of the job running this manager, which identifies it to the other DAG processors"""
 
     _file_queue: deque[DagFileInfo] = attrs.field(factory=deque, init=False)
     _file_stats: dict[DagFileInfo, DagFileStat] = attrs.field(
@@ -203,7 +272,40 @@ class DagFileProcessorManager(LoggingMixin):
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _use_parse_workers: bool = attrs.field(factory=_config_bool_factory("dag_processor", "parsing_workers"))
+    _parse_worker_max_files: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_files")
+    )
+    _parse_worker_max_memory_mb: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_memory_mb")
+    )
+    _idle_parse_workers: list[DagFileParseWorkerProcess] = attrs.field(factory=list, init=False)
+    """Parse workers waiting for their next file"""
+    _retiring_parse_workers: list[DagFileParseWorkerProcess] = attrs.field(factory=list, init=False)
+    """Parse workers that are exiting, whose output is still to be read"""
+
+    _parse_results_batch_size: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parse_results_batch_size")
+    )
+    _parse_results_batch_max_wait: float = attrs.field(
+        factory=_config_float_factory("dag_processor", "parse_results_batch_max_wait")
+    )
+    _parsed_files: dict[DagFileInfo, ParsedFile] = attrs.field(factory=dict, init=False)
+    """Parsed files whose results are still to be written to the DB"""
+    _parsed_files_since: float = attrs.field(default=0, init=False)
+
+    _shard_files: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "shard_files_across_processors")
+    )
+    _shard_refresh_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "shard_refresh_interval")
+    )
+    _shard_ring: FileShardRing | None = attrs.field(default=None, init=False)
+    """Which DAG processor parses each file, when the files are shared between several of them"""
+    _last_shard_refresh_time: float = attrs.field(default=0, init=False)
+
     _parsing_start_time: float = attrs.field(init=False)
+    _parse_cycle: _ParseCycle | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
     _callback_to_execute: dict[DagFileInfo, list[CallbackRequest]] = attrs.field(
@@ -213,6 +315,13 @@ class DagFileProcessorManager(LoggingMixin):
     max_callbacks_per_loop: int = attrs.field(
         factory=_config_int_factory("dag_processor", "max_callbacks_per_loop")
     )
+    _housekeeping_max_interval: float = attrs.field(
+        factory=_config_float_factory("dag_processor", "housekeeping_max_interval")
+    )
+    _housekeeping_schedules: dict[str, _HousekeepingSchedule] = attrs.field(factory=dict, init=False)
+    _dags_deactivated: bool = attrs.field(default=False, init=False)
+    """Whether DAGs were deactivated since the warnings of inactive DAGs were last purged"""
+    _last_stale_dags_scan_finish_time: datetime | None = attrs.field(default=None, init=False)
 
     base_log_dir: str = attrs.field(
         factory=_config_get_factory("logging", "dag_processor_child_process_log_directory")
@@ -227,6 +336,14 @@ class DagFileProcessorManager(LoggingMixin):
     _force_refresh_bundles: set[str] = attrs.field(factory=set, init=False)
     """List of bundles that need to be force refreshed in the next loop"""
 
+    _watch_local_bundles: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "watch_local_bundles")
+    )
+    _bundle_watchers: dict[str, BundleFileWatcher] = attrs.field(factory=dict, init=False)
+    """Watchers of the files of local bundles, which are then only listed again when needed"""
+    _file_mtimes: dict[DagFileInfo, float] = attrs.field(factory=dict, init=False)
+    """Modification times of the files of watched bundles, only read again when they change"""
+
     _api_server: InProcessExecutionAPI = attrs.field(init=False, factory=InProcessExecutionAPI)
     """API server to interact with Metadata DB"""
 
@@ -276,19 +393,88 @@ class DagFileProcessorManager(LoggingMixin):
 
         self._symlink_latest_log_directory()
 
+        if self._shard_files and self.job_id is None:
+            self.log.warning(
+                "Not sharing the files to parse with other DAG processors, as this one has no job"
+            )
+
         return self._run_parsing_loop()
 
+    def _refresh_file_shards(self) -> None:
+        """Take over or give up files when DAG processors sharing the files to parse start or stop."""
+        if not self._shard_files or self.job_id is None:
+            return
+        now = time.monotonic()
+        if self._shard_ring and now - self._last_shard_refresh_time < self._shard_refresh_interval:
+            return
+        self._last_shard_refresh_time = now
+        # This processor keeps parsing its files even if its own heartbeat is late
+        members = get_live_dag_processor_ids() | {self.job_id}
+        if self._shard_ring and self._shard_ring.members == members:
+            return
+        self._shard_ring = FileShardRing(members)
+        self.log.info("Sharing the files to parse between %d DAG processors", len(members))
+        Stats.gauge("dag_processing.shard_members", len(members))
+
+        # Files given up are left to their new processor. Files taken over are not known to this processor
+        # yet, so they are queued as new files.
+        self._file_queue = deque(
+            file for file in self._file_queue if self._owns_file(file) or file in self._callback_to_execute
+        )
+        for file in [file for file in self._file_stats if not self._owns_file(file)]:
+            del self._file_stats[file]
+
+    def _owns_file(self, file: DagFileInfo) -> bool:
+        """Whether this DAG processor parses a file, which is always the case unless files are sharded."""
+        if self._shard_ring is None:
+            return True
+        return self._shard_ring.get_owner(file.bundle_name, str(file.rel_path)) == self.job_id
+
+    def _run_housekeeping(self, name: str, func: Callable[[], Any], *, force: bool = False) -> Any:
+        """
+        Run a housekeeping query of the parsing loop if it is due, and return its result, or None.
+
+        A query that finds something to do, i.e. returns a truthy result, runs again on the next loop.
+        Otherwise, it backs off up to ``[dag_processor] housekeeping_max_interval`` seconds, unless forced.
+        """
+        schedule = self._housekeeping_schedules.setdefault(
+            name, _HousekeepingSchedule(self._housekeeping_max_interval)
+        )
+        if not force and time.monotonic() < schedule.next_run:
+            return None
+        with self._time_housekeeping(name):
+            result = func()
+        schedule.reschedule(bool(result), time.monotonic())
+        return result
+
+    @contextlib.contextmanager
+    def _time_housekeeping(self, name: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = (time.monotonic() - start) * 1000
+            Stats.timing(f"dag_processing.housekeeping_duration.{name}", duration)
+            Stats.timing("dag_processing.housekeeping_duration", duration, tags={"query": name})
+
     def _scan_stale_dags(self):
         """Scan and deactivate DAGs which are no longer present in files."""
         now = time.monotonic()
         elapsed_time_since_refresh = now - self._last_deactivate_stale_dags_time
         if elapsed_time_since_refresh > self.parsing_cleanup_interval:
+            self._last_deactivate_stale_dags_time = now
             last_parsed = {
                 file_info: stat.last_finish_time
                 for file_info, stat in self._file_stats.items()
                 if stat.last_finish_time
             }
-            self.deactivate_stale_dags(last_parsed=last_parsed)
+            # DAGs only go missing from files parsed since the last scan
+            last_finish_time = max(last_parsed.values(), default=None)
+            if last_finish_time is None or last_finish_time == self._last_stale_dags_scan_finish_time:
+                return
+            self._last_stale_dags_scan_finish_time = last_finish_time
+            with self._time_housekeeping("scan_stale_dags"):
+                self.deactivate_stale_dags(last_parsed=last_parsed)
             self._last_deactivate_stale_dags_time = time.monotonic()
 
     @provide_session
@@ -329,13 +515,41 @@ class DagFileProcessorManager(LoggingMixin):
             )
             deactivated = deactivated_dagmodel.rowcount
             if deactivated:
+                self._dags_deactivated = True
                 self.log.info("Deactivated %i DAGs which are no longer present in file.", deactivated)
 
+    def _preload_parsing_modules(self) -> None:
+        """
+        Import the modules of ``[dag_processor] parsing_preload_modules`` once, in this process.
+
+        DAG file processors are forked from this process, so they start with these modules already
+        imported. Objects created so far are then frozen out of garbage collection: otherwise collections
+        in the processors would write to every page shared with this process, copying them.
+        """
+        modules = [m for m in conf.getlist("dag_processor", "parsing_preload_modules", fallback="") if m]
+        if not modules:
+            return
+        start = time.monotonic()
+        preloaded = 0
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except Exception:
+                self.log.warning("Failed to preload module %s for DAG parsing", module, exc_info=True)
+            else:
+                preloaded += 1
+        gc.freeze()
+        self.log.info(
+            "Preloaded %d modules for DAG parsing in %.2f seconds", preloaded, time.monotonic() - start
+        )
+
     def _run_parsing_loop(self):
         # initialize cache to mutualize calls to Variable.get in DAGs
         # needs to be done before this process is forked to create the DAG parsing processes.
         SecretCache.init()
 
+        self._preload_parsing_modules()
+
         poll_time = 0.0
 
         known_files: dict[str, set[DagFileInfo]] = {}
@@ -345,6 +559,8 @@ class DagFileProcessorManager(LoggingMixin):
 
             self.heartbeat()
 
+            self._refresh_file_shards()
+
             self._kill_timed_out_processors()
 
             self._queue_requested_files_for_parsing()
@@ -367,10 +583,15 @@ class DagFileProcessorManager(LoggingMixin):
 
             self._collect_results()
 
-            for callback in self._fetch_callbacks():
+            for callback in self._run_housekeeping("fetch_callbacks", self._fetch_callbacks) or ():
                 self._add_callback_to_queue(callback)
             self._scan_stale_dags()
-            DagWarning.purge_inactive_dag_warnings()
+            self._run_housekeeping(
+                "purge_inactive_dag_warnings",
+                DagWarning.purge_inactive_dag_warnings,
+                force=self._dags_deactivated,
+            )
+            self._dags_deactivated = False
 
             # Update number of loop iteration.
             self._num_run += 1
@@ -389,6 +610,8 @@ class DagFileProcessorManager(LoggingMixin):
             else:
                 poll_time = 0.0
 
+        self._flush_parse_results()
+
     def _service_processor_sockets(self, timeout: float | None = 1.0):
         """
         Service subprocess events by polling sockets for activity.
@@ -415,7 +638,9 @@ class DagFileProcessorManager(LoggingMixin):
 
     def _queue_requested_files_for_parsing(self) -> None:
         """Queue any files requested for parsing as requested by users via UI/API."""
-        files = self._get_priority_files()
+        files: list[DagFileInfo] = (
+            self._run_housekeeping("get_priority_files", self._get_priority_files) or []
+        )
         bundles_to_refresh: set[str] = set()
         for file in files:
             # Try removing the file if already present
@@ -514,6 +739,16 @@ class DagFileProcessorManager(LoggingMixin):
                 except AirflowException as e:
                     self.log.exception("Error initializing bundle %s: %s", bundle.name, e)
                     continue
+            if (
+                (watcher := self._bundle_watchers.get(bundle.name))
+                and bundle.name in known_files
+                and bundle.name not in self._force_refresh_bundles
+            ):
+                changes = watcher.get_changes()
+                if not changes.rescan and self._apply_bundle_changes(bundle, changes, known_files):
+                    continue
+                self.log.info("Files of bundle %s were added or may contain new DAGs", bundle.name)
+                self._force_refresh_bundles.add(bundle.name)
             # TODO: AIP-66 test to make sure we get a fresh record from the db and it's not cached
             with create_session() as session:
                 bundle_model: DagBundleModel = session.get(DagBundleModel, bundle.name)
@@ -575,6 +810,18 @@ class DagFileProcessorManager(LoggingMixin):
 
             self._bundle_versions[bundle.name] = version_after_refresh
 
+            if (
+                self._watch_local_bundles
+                and isinstance(bundle, LocalDagBundle)
+                and bundle.name not in self._bundle_watchers
+            ):
+                # Start watching before listing the files: start() returns once the files are watched, so
+                # that no change is missed in between
+                watcher = BundleFileWatcher(bundle.path)
+                if watcher.start():
+                    self._bundle_watchers[bundle.name] = watcher
+            self._file_mtimes = {f: t for f, t in self._file_mtimes.items() if f.bundle_name != bundle.name}
+
             found_files = {
                 DagFileInfo(rel_path=p, bundle_name=bundle.name, bundle_path=bundle.path)
                 for p in self._find_files_in_bundle(bundle)
@@ -589,6 +836,95 @@ class DagFileProcessorManager(LoggingMixin):
                 observed_filelocs={str(x.rel_path) for x in found_files},  # todo: make relative
             )
 
+    def _apply_bundle_changes(
+        self, bundle: BaseDagBundle, changes: BundleChanges, known_files: dict[str, set[DagFileInfo]]
+    ) -> bool:
+        """
+        Update the known files of a watched bundle from the changes to its files, without listing them.
+
+        Modified DAG files, and the DAG files that imported a modified module, are queued to be parsed right
+        away. Returns False if the files of the bundle must be listed again, because a Python file that was
+        not a DAG file was modified and may now contain DAGs.
+        """
+        present = known_files[bundle.name]
+        safe_mode = conf.getboolean("core", "dag_discovery_safe_mode", fallback=True)
+        modified = []
+        needs_listing = False
+        for rel_path in changes.modified:
+            file = DagFileInfo(rel_path=rel_path, bundle_name=bundle.name, bundle_path=bundle.path)
+            if file in present:
+                if self._owns_file(file):
+                    modified.append(file)
+            elif not needs_listing and (rel_path.suffix == ".py" or zipfile.is_zipfile(file.absolute_path)):
+                try:
+                    needs_listing = might_contain_dag(os.fspath(file.absolute_path), safe_mode)
+                except OSError:
+                    needs_listing = True
+
+        changed_paths = changes.modified | changes.deleted
+        for rel_path in changed_paths:
+            self._file_mtimes.pop(DagFileInfo(rel_path=rel_path, bundle_name=bundle.name), None)
+        dependents = [
+            file
+            for file, stat in self._file_stats.items()
+            if file.bundle_name == bundle.name
+            and stat.bundle_imports
+            and not changed_paths.isdisjoint(stat.bundle_imports)
+        ]
+        if to_queue := list(dict.fromkeys(modified + dependents)):
+            self.log.info(
+                "%d files were modified in bundle %s, or import a modified module", len(to_queue), bundle.name
+            )
+            self._add_files_to_queue(to_queue, add_at_front=True)
+        if needs_listing:
+            return False
+
+        if deleted := {
+            file
+            for file in present
+            if any(path == file.rel_path or path in file.rel_path.parents for path in changes.deleted)
+        }:
+            self.log.info("%d files were deleted from bundle %s", len(deleted), bundle.name)
+            known_files[bundle.name] = present - deleted
+            self.handle_removed_files(known_files=known_files)
+            self.deactivate_deleted_dags(bundle_name=bundle.name, present=known_files[bundle.name])
+            self.clear_orphaned_import_errors(
+                bundle_name=bundle.name,
+                observed_filelocs={str(x.rel_path) for x in known_files[bundle.name]},
+            )
+        return True
+
+    def _get_mtime(self, file: DagFileInfo) -> float:
+        if file.bundle_name not in self._bundle_watchers:
+            return os.path.getmtime(file.absolute_path)
+        if (mtime := self._file_mtimes.get(file)) is None:
+            mtime = self._file_mtimes[file] = os.path.getmtime(file.absolute_path)
+        return mtime
+
+    def _get_imports_mtime(self, file: DagFileInfo, import_mtimes: dict[DagFileInfo, float]) -> float:
+        """
+        Return the latest modification time of the modules of its bundle that a file imported.
+
+        A file is then parsed again when a module it imports changes, even if it did not change itself.
+        """
+        stat = self._file_stats.get(file)
+        if not stat or not stat.bundle_imports:
+            return 0.0
+        latest = 0.0
+        for rel_path in stat.bundle_imports:
+            module = DagFileInfo(
+                rel_path=rel_path, bundle_name=file.bundle_name, bundle_path=file.bundle_path
+            )
+            if (mtime := import_mtimes.get(module)) is None:
+                try:
+                    mtime = self._get_mtime(module)
+                except FileNotFoundError:
+                    # The file fails to import now, which is a change too
+                    mtime = time.time()
+                import_mtimes[module] = mtime
+            latest = max(latest, mtime)
+        return latest
+
     def _find_files_in_bundle(self, bundle: BaseDagBundle) -> list[Path]:
         """Get relative paths for dag files from bundle dir."""
         # Build up a list of Python files that could contain DAGs
@@ -630,11 +966,12 @@ class DagFileProcessorManager(LoggingMixin):
                     rel_filelocs.append(str(rel_sub_path))
 
         with create_session() as session:
-            DagModel.deactivate_deleted_dags(
+            if DagModel.deactivate_deleted_dags(
                 bundle_name=bundle_name,
                 rel_filelocs=rel_filelocs,
                 session=session,
-            )
+            ):
+                self._dags_deactivated = True
             remove_references_to_deleted_dags(session=session)
 
     def print_stats(self, known_files: dict[str, set[DagFileInfo]]):
@@ -822,20 +1159,67 @@ class DagFileProcessorManager(LoggingMixin):
                 continue
             finished.append(file)
 
-            # Collect the DAGS and import errors into the DB, emit metrics etc.
-            self._file_stats[file] = process_parse_results(
+            if not self._parsed_files:
+                self._parsed_files_since = time.monotonic()
+            self._parsed_files[file] = ParsedFile(
+                file=file,
                 run_duration=time.monotonic() - proc.start_time,
                 finish_time=timezone.utcnow(),
                 run_count=self._file_stats[file].run_count,
-                bundle_name=file.bundle_name,
                 bundle_version=self._bundle_versions[file.bundle_name],
                 parsing_result=proc.parsing_result,
-                session=session,
             )
+            if proc.parsing_result is not None and proc.parsing_result.profile is not None:
+                _emit_parse_profile_metrics(file, proc.parsing_result.profile)
 
         for file in finished:
             processor = self._processors.pop(file)
-            processor.logger_filehandle.close()
+            if isinstance(processor, DagFileParseWorkerProcess):
+                self._release_parse_worker(processor)
+            else:
+                processor.logger_filehandle.close()
+
+        for worker in [w for w in self._retiring_parse_workers if w.has_exited]:
+            self._retiring_parse_workers.remove(worker)
+            worker.logger_filehandle.close()
+
+        if self._parsed_files and (
+            len(self._parsed_files) >= self._parse_results_batch_size
+            or time.monotonic() - self._parsed_files_since >= self._parse_results_batch_max_wait
+        ):
+            self._write_parse_results(session=session)
+
+    def _write_parse_results(self, session: Session) -> None:
+        """Collect the DAGs and import errors of the parsed files into the DB, several files at a time."""
+        parsed_files = list(self._parsed_files.values())
+        self._parsed_files.clear()
+        batch_size = max(self._parse_results_batch_size, 1)
+        for i in range(0, len(parsed_files), batch_size):
+            self._file_stats.update(process_parse_results_batch(parsed_files[i : i + batch_size], session))
+
+    @provide_session
+    def _flush_parse_results(self, session: Session = NEW_SESSION) -> None:
+        """Write the parse results still waiting for their batch, e.g. when stopping."""
+        if self._parsed_files:
+            self._write_parse_results(session=session)
+
+    def _release_parse_worker(self, worker: DagFileParseWorkerProcess) -> None:
+        """Make a parse worker that is done with a file available for the next one, unless it is recycled."""
+        if worker._check_subprocess_exit() is None and not worker.should_recycle(
+            self._parse_worker_max_files, self._parse_worker_max_memory_mb
+        ):
+            self._idle_parse_workers.append(worker)
+            return
+        worker.retire()
+        self._retiring_parse_workers.append(worker)
+
+    def _get_idle_parse_worker(self) -> DagFileParseWorkerProcess | None:
+        while self._idle_parse_workers:
+            worker = self._idle_parse_workers.pop()
+            if worker._check_subprocess_exit() is None:
+                return worker
+            self._retiring_parse_workers.append(worker)
+        return None
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -899,12 +1283,29 @@ class DagFileProcessorManager(LoggingMixin):
 
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
         logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
+        stat = self._file_stats.get(dag_file)
+        source_fingerprint = stat.source_fingerprint if stat else None
+
+        process_class = DagFileProcessorProcess
+        # Callbacks run user code with side effects, so they always get a process of their own
+        if self._use_parse_workers and not callback_to_execute_for_file:
+            if worker := self._get_idle_parse_worker():
+                worker.parse_file(
+                    path=dag_file.absolute_path,
+                    bundle_path=cast("Path", dag_file.bundle_path),
+                    source_fingerprint=source_fingerprint,
+                    logger=logger,
+                    logger_filehandle=logger_filehandle,
+                )
+                return worker
+            process_class = DagFileParseWorkerProcess
 
-        return DagFileProcessorProcess.start(
+        return process_class.start(
             id=id,
             path=dag_file.absolute_path,
             bundle_path=cast("Path", dag_file.bundle_path),
             callbacks=callback_to_execute_for_file,
+            source_fingerprint=source_fingerprint,
             selector=self.selector,
             logger=logger,
             logger_filehandle=logger_filehandle,
@@ -916,7 +1317,7 @@ class DagFileProcessorManager(LoggingMixin):
         while self._parallelism > len(self._processors) and self._file_queue:
             file = self._file_queue.popleft()
             # Stop creating duplicate processor i.e. processor with the same filepath
-            if file in self._processors:
+            if file in self._processors or file in self._parsed_files:
                 continue
 
             processor = self._create_process(file)
@@ -928,7 +1329,8 @@ class DagFileProcessorManager(LoggingMixin):
     def add_files_to_queue(self, known_files: dict[str, set[DagFileInfo]]):
         for files in known_files.values():
             for file in files:
-                if file not in self._file_stats:  # todo: store stats by bundle also?
+                # todo: store stats by bundle also?
+                if file not in self._file_stats and self._owns_file(file):
                     # We found new file after refreshing dir. add to parsing queue at start
                     self.log.info("Adding new file %s to parsing queue", file)
                     self._file_queue.appendleft(file)
@@ -936,9 +1338,10 @@ class DagFileProcessorManager(LoggingMixin):
     def _sort_by_mtime(self, files: Iterable[DagFileInfo]):
         files_with_mtime: dict[DagFileInfo, float] = {}
         changed_recently = set()
+        import_mtimes: dict[DagFileInfo, float] = {}
         for file in files:
             try:
-                modified_timestamp = os.path.getmtime(file.absolute_path)
+                modified_timestamp = max(self._get_mtime(file), self._get_imports_mtime(file, import_mtimes))
                 modified_datetime = datetime.fromtimestamp(modified_timestamp, tz=timezone.utc)
                 files_with_mtime[file] = modified_timestamp
                 last_time = self._file_stats[file].last_finish_time
@@ -953,6 +1356,57 @@ class DagFileProcessorManager(LoggingMixin):
         file_infos = [info for info, ts in sorted(files_with_mtime.items(), key=itemgetter(1), reverse=True)]
         return file_infos, changed_recently
 
+    def _sort_by_parse_cost(self, files: Iterable[DagFileInfo]):
+        """
+        Sort files to parse the changed ones first, and the others in as little wall time as possible.
+
+        Files that changed since they were last parsed, or were never parsed, come first, the fastest to
+        parse first. The other files come the slowest to parse first, so that short files fill the gaps
+        left on the parsing processes by long ones at the end of the queue.
+        """
+        files, changed_recently = self._sort_by_mtime(files=files)
+        durations = {
+            file: stat.last_duration
+            for file in files
+            if (stat := self._file_stats.get(file)) and stat.last_duration is not None
+        }
+        fresh = sorted(
+            (file for file in files if file in changed_recently or file not in durations),
+            key=lambda file: durations.get(file, 0),
+        )
+        others = sorted(
+            (file for file in files if file not in changed_recently and file in durations),
+            key=durations.__getitem__,
+            reverse=True,
+        )
+        return fresh + others, changed_recently
+
+    def _predict_cycle_time(self, files: list[DagFileInfo]) -> float:
+        """Predict how long parsing files takes, from how long they took to parse the last time."""
+        durations = [stat.last_duration if (stat := self._file_stats.get(file)) else None for file in files]
+        known = [duration for duration in durations if duration is not None]
+        # Files never parsed are assumed to take as long as the average file
+        average = sum(known) / len(known) if known else 0
+        return _predict_parse_time((average if d is None else d for d in durations), self._parallelism)
+
+    def _end_parse_cycle(self) -> None:
+        """Report how long parsing the files of the current cycle took, once none is left to parse."""
+        if self._parse_cycle is None:
+            return
+        pending = set(self._processors).union(self._parsed_files, self._file_queue)
+        if not self._parse_cycle.files.isdisjoint(pending):
+            return
+        duration = time.monotonic() - self._parse_cycle.start
+        self.log.info(
+            "Parsed %d files in %.2f seconds, predicted %.2f seconds",
+            len(self._parse_cycle.files),
+            duration,
+            self._parse_cycle.predicted_duration,
+        )
+        Stats.gauge("dag_processing.parse_cycle_time", duration)
+        Stats.gauge("dag_processing.predicted_parse_cycle_time", self._parse_cycle.predicted_duration)
+        self._parse_cycle = None
+
     def processed_recently(self, now, file):
         last_time = self._file_stats[file].last_finish_time
         if not last_time:
@@ -969,9 +1423,10 @@ class DagFileProcessorManager(LoggingMixin):
         Note this method is only called when the file path queue is empty
         """
         self._parsing_start_time = time.perf_counter()
+        self._end_parse_cycle()
         # If the file path is already being processed, or if a file was
         # processed recently, wait until the next batch
-        in_progress = set(self._processors)
+        in_progress = set(self._processors).union(self._parsed_files)
         now = timezone.utcnow()
 
         # Sort the file paths by the parsing order mode
@@ -981,6 +1436,8 @@ class DagFileProcessorManager(LoggingMixin):
 
         for bundle_files in known_files.values():
             for file in bundle_files:
+                if not self._owns_file(file):
+                    continue
                 files.append(file)
                 if self.processed_recently(now, file):
                     recently_processed.add(file)
@@ -994,6 +1451,8 @@ class DagFileProcessorManager(LoggingMixin):
             # Shuffle the list seeded by hostname so multiple DAG processors can work on different
             # set of files. Since we set the seed, the sort order will remain same per host
             random.Random(get_hostname()).shuffle(files)
+        elif list_mode == "parse_cost":
+            files, changed_recently = self._sort_by_parse_cost(files=files)
 
         at_run_limit = [info for info, stat in self._file_stats.items() if stat.run_count == self.max_runs]
         to_exclude = in_progress.union(at_run_limit)
@@ -1017,6 +1476,10 @@ class DagFileProcessorManager(LoggingMixin):
             )
         self._add_files_to_queue(to_queue, False)
         Stats.incr("dag_processing.file_path_queue_update_count")
+        if to_queue and self._parse_cycle is None:
+            self._parse_cycle = _ParseCycle(
+                time.monotonic(), self._predict_cycle_time(to_queue), set(to_queue)
+            )
 
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
@@ -1076,10 +1539,22 @@ class DagFileProcessorManager(LoggingMixin):
             Stats.decr("dag_processing.processes", tags={"file_path": file, "action": "terminate"})
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
+        for worker in (*self._idle_parse_workers, *self._retiring_parse_workers):
+            worker.kill(signal.SIGTERM, escalation_delay=5.0)
+        for watcher in self._bundle_watchers.values():
+            watcher.stop()
+        self._bundle_watchers.clear()
+        try:
+            self._flush_parse_results()
+        except Exception:
+            self.log.exception("Failed to write the results of %d parsed files", len(self._parsed_files))
 
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
-        pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill = [
+            p.pid
+            for p in (*self._processors.values(), *self._idle_parse_workers, *self._retiring_parse_workers)
+        ]
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
@@ -1139,11 +1614,93 @@ def process_parse_results(
     session: Session,
 ) -> DagFileStat:
     """Take the parsing result and stats about the parser process and convert it into a DagFileState."""
+    if parsing_result is not None and parsing_result.unchanged_dag_ids is None:
+        _write_parsing_results(bundle_name, bundle_version, [parsing_result], session=session)
+    return _get_file_stat(
+        run_duration, finish_time, run_count, bundle_name, bundle_version, parsing_result, session=session
+    )
+
+
+def process_parse_results_batch(
+    parsed_files: Iterable[ParsedFile], session: Session
+) -> dict[DagFileInfo, DagFileStat]:
+    """
+    Take the parsing results of several files and convert them into DagFileStats.
+
+    The DAGs, import errors and warnings of all the files of a bundle version are written to the DB in a
+    single pass, rather than one file at a time.
+    """
+    parsed_files = list(parsed_files)
+    to_write: dict[tuple[str, str | None], list[DagFileParsingResult]] = defaultdict(list)
+    for parsed in parsed_files:
+        if parsed.parsing_result is not None and parsed.parsing_result.unchanged_dag_ids is None:
+            to_write[(parsed.file.bundle_name, parsed.bundle_version)].append(parsed.parsing_result)
+    for (bundle_name, bundle_version), parsing_results in to_write.items():
+        _write_parsing_results(bundle_name, bundle_version, parsing_results, session=session)
+    return {
+        parsed.file: _get_file_stat(
+            parsed.run_duration,
+            parsed.finish_time,
+            parsed.run_count,
+            parsed.file.bundle_name,
+            parsed.bundle_version,
+            parsed.parsing_result,
+            session=session,
+        )
+        for parsed in parsed_files
+    }
+
+
+def _write_parsing_results(
+    bundle_name: str,
+    bundle_version: str | None,
+    parsing_results: list[DagFileParsingResult],
+    *,
+    session: Session,
+) -> None:
+    """Record the DAGs and import errors of parsed files of a bundle to the database."""
+    dags: dict[str, LazyDeserializedDAG] = {}
+    import_errors: dict[tuple[str, str], str] = {}
+    warnings: set[DagWarning] = set()
+    for parsing_result in parsing_results:
+        # The same DAG id defined by several files: the last file parsed wins, as if written one by one
+        dags.update((dag.dag_id, dag) for dag in parsing_result.serialized_dags)
+        if parsing_result.import_errors:
+            import_errors.update(
+                ((bundle_name, rel_path), error) for rel_path, error in parsing_result.import_errors.items()
+            )
+        warnings.update(parsing_result.warnings or [])
+    update_dag_parsing_results_in_db(
+        bundle_name=bundle_name,
+        bundle_version=bundle_version,
+        dags=list(dags.values()),
+        import_errors=import_errors,
+        warnings=warnings,
+        session=session,
+    )
+
+
+def _get_file_stat(
+    run_duration: float,
+    finish_time: datetime,
+    run_count: int,
+    bundle_name: str,
+    bundle_version: str | None,
+    parsing_result: DagFileParsingResult | None,
+    *,
+    session: Session,
+) -> DagFileStat:
     stat = DagFileStat(
         last_finish_time=finish_time,
         last_duration=run_duration,
         run_count=run_count + 1,
+        bundle_imports=parsing_result.bundle_imports if parsing_result else None,
     )
+    if parsing_result is not None and (profile := parsing_result.profile) is not None:
+        stat.num_tasks = profile.task_num
+        stat.last_cpu_time = profile.cpu_time
+        stat.last_peak_rss = profile.peak_rss
+        stat.last_top_imports = profile.top_imports
 
     # TODO: AIP-66 emit metrics
     # file_name = Path(dag_file.path).stem
@@ -1152,22 +1709,47 @@ def process_parse_results(
 
     if parsing_result is None:
         stat.import_errors = 1
+    elif parsing_result.unchanged_dag_ids is not None:
+        stat.num_dags = len(parsing_result.unchanged_dag_ids)
+        if _touch_unchanged_dags(
+            bundle_name, bundle_version, parsing_result.unchanged_dag_ids, session=session
+        ):
+            stat.source_fingerprint = parsing_result.source_fingerprint
+            Stats.incr("dag_processing.unchanged_files")
     else:
-        # record DAGs and import errors to database
-        import_errors = {}
-        if parsing_result.import_errors:
-            import_errors = {
-                (bundle_name, rel_path): error for rel_path, error in parsing_result.import_errors.items()
-            }
-        update_dag_parsing_results_in_db(
-            bundle_name=bundle_name,
-            bundle_version=bundle_version,
-            dags=parsing_result.serialized_dags,
-            import_errors=import_errors,
-            warnings=set(parsing_result.warnings or []),
-            session=session,
-        )
         stat.num_dags = len(parsing_result.serialized_dags)
         if parsing_result.import_errors:
             stat.import_errors = len(parsing_result.import_errors)
+        else:
+            stat.source_fingerprint = parsing_result.source_fingerprint
     return stat
+
+
+def _emit_parse_profile_metrics(file: DagFileInfo, profile: DagFileParseProfile) -> None:
+    file_name = Path(file.rel_path).stem
+    tags = {"file_name": file_name, "bundle_name": file.bundle_name}
+    Stats.timing(f"dag_processing.last_cpu_time.{file_name}", profile.cpu_time * 1000)
+    Stats.timing("dag_processing.last_cpu_time", profile.cpu_time * 1000, tags=tags)
+    Stats.gauge(f"dag_processing.last_peak_rss.{file_name}", profile.peak_rss)
+    Stats.gauge("dag_processing.last_peak_rss", profile.peak_rss, tags=tags)
+
+
+def _touch_unchanged_dags(
+    bundle_name: str, bundle_version: str | None, dag_ids: list[str], *, session: Session
+) -> bool:
+    """
+    Mark the DAGs of a file whose sources are unchanged as parsed, without writing them again.
+
+    Their bundle version is updated like when they are written, so that new DAG runs use the version the
+    file was just parsed from.
+
+    Returns False if any of the DAGs is not active anymore (e.g. it was deleted in the meantime), in which
+    case the file must be fully parsed again to restore it.
+    """
+    num_updated = session.execute(
+        update(DagModel)
+        .where(DagModel.bundle_name == bundle_name, DagModel.dag_id.in_(dag_ids), ~DagModel.is_stale)
+        .values(last_parsed_time=timezone.utcnow(), bundle_version=bundle_version)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    return num_updated == len(dag_ids)
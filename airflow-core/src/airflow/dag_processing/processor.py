@@ -19,15 +19,19 @@ from __future__ import annotations
 import contextlib
 import importlib
 import os
+import socket
 import sys
+import time
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
+from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, cast
 
 import attrs
+import psutil
 from pydantic import BaseModel, Field, TypeAdapter
 
+from airflow import __version__ as airflow_version
 from airflow.callbacks.callback_requests import (
     CallbackRequest,
     DagCallbackRequest,
@@ -54,6 +58,7 @@ from airflow.sdk.execution_time.task_runner import RuntimeTaskInstance
 from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedDAG
 from airflow.stats import Stats
 from airflow.utils.file import iter_airflow_imports
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
@@ -79,9 +84,26 @@ class DagFileParseRequest(BaseModel):
     """Passing bundle path around lets us figure out relative file path."""
 
     callback_requests: list[CallbackRequest] = Field(default_factory=list)
+
+    source_fingerprint: str | None = None
+    """Fingerprint of the sources of the file when its DAGs were last written to the DB, if known."""
+
     type: Literal["DagFileParseRequest"] = "DagFileParseRequest"
 
 
+class DagFileParseProfile(BaseModel):
+    """Resources used by the DAG processor to parse a DAG file, and what it produced."""
+
+    cpu_time: float
+    """CPU time, in seconds, spent importing the file."""
+    peak_rss: int
+    """Peak resident memory, in bytes, of the parsing process while importing the file."""
+    top_imports: dict[str, float]
+    """Seconds spent importing the slowest modules imported by the file, slowest first."""
+    dag_num: int
+    task_num: int
+
+
 class DagFileParsingResult(BaseModel):
     """
     Result of DAG File Parsing.
@@ -94,6 +116,16 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    source_fingerprint: str | None = None
+    unchanged_dag_ids: list[str] | None = None
+    """
+    Ids of the DAGs of the file, if its sources are unchanged since they were last written to the DB.
+
+    The DAGs are not serialized in this case, and ``serialized_dags`` is empty.
+    """
+    bundle_imports: list[Path] | None = None
+    """Paths, relative to the bundle, of the modules of the bundle imported while parsing the file."""
+    profile: DagFileParseProfile | None = None
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
@@ -168,21 +200,107 @@ def _parse_file_entrypoint():
         comms_decoder.send(result)
 
 
+def _parse_worker_entrypoint():
+    import structlog
+
+    from airflow.sdk.execution_time import comms, task_runner
+
+    comms_decoder = comms.CommsDecoder[ToDagProcessor, ToManager](
+        body_decoder=TypeAdapter[ToDagProcessor](ToDagProcessor),
+    )
+    task_runner.SUPERVISOR_COMMS = comms_decoder
+    log = structlog.get_logger(logger_name="task")
+
+    while True:
+        try:
+            msg = comms_decoder._get_response()
+        except EOFError:
+            # The manager does not have any more files for this worker
+            return
+        if not isinstance(msg, DagFileParseRequest) or msg.callback_requests:
+            raise RuntimeError(f"Required a DagFileParseRequest without callbacks, it was {msg}")
+
+        with _isolate_bundle_modules(msg.bundle_path):
+            result = _parse_file(msg, log)
+        # Everything logged about this file must be sent before its result, see
+        # ``DagFileParseWorkerProcess.parse_file``
+        sys.stdout.flush()
+        sys.stderr.flush()
+        comms_decoder.send(result)
+
+
+@contextlib.contextmanager
+def _isolate_bundle_modules(bundle_path: Path) -> Iterator[None]:
+    """
+    Put the bundle root on sys.path, and forget the modules imported from the bundle afterwards.
+
+    Otherwise, the next file parsed by the same worker would use these modules as they were when they
+    were first imported, instead of their current sources.
+    """
+    bundle_root = os.fspath(bundle_path)
+    added_to_path = bundle_root not in sys.path
+    if added_to_path:
+        sys.path.append(bundle_root)
+    modules_before_parsing = set(sys.modules)
+    try:
+        yield
+    finally:
+        resolved_root = Path(bundle_root).resolve()
+        for name in set(sys.modules) - modules_before_parsing:
+            module = sys.modules[name]
+            locations = [getattr(module, "__file__", None), *getattr(module, "__path__", ())]
+            if any(
+                location and Path(location).resolve().is_relative_to(resolved_root) for location in locations
+            ):
+                del sys.modules[name]
+        if added_to_path:
+            with contextlib.suppress(ValueError):
+                sys.path.remove(bundle_root)
+
+
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
     # TODO: Set known_pool names on DagBag!
 
+    modules_before_parsing = set(sys.modules)
     bag = DagBag(
         dag_folder=msg.file,
         bundle_path=msg.bundle_path,
         include_examples=False,
         load_op_links=False,
+        profile_parsing=True,
     )
     if msg.callback_requests:
         # If the request is for callback, we shouldn't serialize the DAGs
         _execute_callbacks(bag, msg.callback_requests, log)
         return None
 
+    bundle_root = Path(msg.bundle_path).resolve()
+    file_path = Path(msg.file).resolve()
+    bundle_modules = _find_bundle_modules(bundle_root, set(sys.modules) - modules_before_parsing)
+    bundle_modules.discard(file_path)
+    # Modules imported from a zip file are left out, their changes are seen as changes of the zip file
+    bundle_imports = sorted(path.relative_to(bundle_root) for path in bundle_modules if path.is_file())
+    profile = _get_parse_profile(bag)
+
+    source_fingerprint = None
+    if conf.getboolean("dag_processor", "skip_unchanged_dag_files") and not bag.import_errors:
+        source_fingerprint = _fingerprint_sources({file_path, *bundle_modules})
+        if source_fingerprint is not None and source_fingerprint == msg.source_fingerprint:
+            log.info("DAG file sources are unchanged, skipping serialization", fingerprint=source_fingerprint)
+            return DagFileParsingResult(
+                fileloc=msg.file,
+                serialized_dags=[],
+                import_errors={},
+                warnings=[],
+                source_fingerprint=source_fingerprint,
+                unchanged_dag_ids=list(bag.dags),
+                bundle_imports=bundle_imports,
+                profile=profile,
+            )
+
     serialized_dags, serialization_import_errors = _serialize_dags(bag, log)
+    if serialization_import_errors:
+        source_fingerprint = None
     bag.import_errors.update(serialization_import_errors)
     dags = [LazyDeserializedDAG(data=serdag) for serdag in serialized_dags]
     result = DagFileParsingResult(
@@ -191,10 +309,54 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         import_errors=bag.import_errors,
         # TODO: Make `bag.dag_warnings` not return SQLA model objects
         warnings=[],
+        source_fingerprint=source_fingerprint,
+        bundle_imports=bundle_imports,
+        profile=profile,
     )
     return result
 
 
+def _get_parse_profile(bag: DagBag) -> DagFileParseProfile | None:
+    """Return the profile of the parsing of the single file of a DagBag, if it was loaded."""
+    if not bag.dagbag_stats:
+        return None
+    stat = bag.dagbag_stats[0]
+    return DagFileParseProfile(
+        cpu_time=stat.cpu_time,
+        peak_rss=stat.peak_rss,
+        top_imports=stat.top_imports,
+        dag_num=stat.dag_num,
+        task_num=stat.task_num,
+    )
+
+
+def _find_bundle_modules(bundle_root: Path, module_names: Iterable[str]) -> set[Path]:
+    """Return the resolved paths of the given imported modules whose source is in the bundle."""
+    paths = set()
+    for name in module_names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file and (path := Path(module_file).resolve()).is_relative_to(bundle_root):
+            paths.add(path)
+    return paths
+
+
+def _fingerprint_sources(paths: Iterable[Path]) -> str | None:
+    """
+    Fingerprint the content of a DAG file and of the modules of its bundle it imported.
+
+    Returns None if a source cannot be read, e.g. a module imported from a zip file.
+    """
+    fingerprint = md5(airflow_version.encode())
+    try:
+        for path in sorted(paths):
+            fingerprint.update(os.fsencode(path))
+            fingerprint.update(b"\0")
+            fingerprint.update(path.read_bytes())
+    except OSError:
+        return None
+    return fingerprint.hexdigest()
+
+
 def _serialize_dags(bag: DagBag, log: FilteringBoundLogger) -> tuple[list[dict], dict[str, str]]:
     serialization_import_errors = {}
     serialized_dags = []
@@ -366,6 +528,7 @@ class DagFileProcessorProcess(WatchedSubprocess):
         callbacks: list[CallbackRequest],
         target: Callable[[], None] = _parse_file_entrypoint,
         client: Client,
+        source_fingerprint: str | None = None,
         **kwargs,
     ) -> Self:
         logger = kwargs["logger"]
@@ -373,7 +536,7 @@ class DagFileProcessorProcess(WatchedSubprocess):
         _pre_import_airflow_modules(os.fspath(path), logger)
 
         proc: Self = super().start(target=target, client=client, **kwargs)
-        proc._on_child_started(callbacks, path, bundle_path)
+        proc._on_child_started(callbacks, path, bundle_path, source_fingerprint)
         return proc
 
     def _on_child_started(
@@ -381,11 +544,13 @@ class DagFileProcessorProcess(WatchedSubprocess):
         callbacks: list[CallbackRequest],
         path: str | os.PathLike[str],
         bundle_path: Path,
+        source_fingerprint: str | None = None,
     ) -> None:
         msg = DagFileParseRequest(
             file=os.fspath(path),
             bundle_path=bundle_path,
             callback_requests=callbacks,
+            source_fingerprint=source_fingerprint,
         )
         self.send_msg(msg, request_id=0)
 
@@ -450,3 +615,99 @@ class DagFileProcessorProcess(WatchedSubprocess):
 
     def wait(self) -> int:
         raise NotImplementedError(f"Don't call wait on {type(self).__name__} objects")
+
+
+class _CurrentFileLogger:
+    """Forward the logs of a parse worker to the logger of the file it is parsing."""
+
+    def __init__(self, logger: FilteringBoundLogger) -> None:
+        self.logger = logger
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.logger, name)
+
+
+@attrs.define(kw_only=True)
+class DagFileParseWorkerProcess(DagFileProcessorProcess):
+    """
+    Long-lived process that parses DAG files one after the other.
+
+    It is started with a first file like ``DagFileProcessorProcess``, but once a file is parsed, it waits
+    for the next one instead of exiting. Modules imported from the bundle of a file are forgotten once the
+    file is parsed. Callbacks are never sent to a parse worker.
+    """
+
+    files_parsed: int = 1
+
+    @classmethod
+    def start(  # type: ignore[override]
+        cls,
+        *,
+        target: Callable[[], None] = _parse_worker_entrypoint,
+        logger: FilteringBoundLogger,
+        **kwargs,
+    ) -> Self:
+        return super().start(
+            target=target, logger=cast("FilteringBoundLogger", _CurrentFileLogger(logger)), **kwargs
+        )
+
+    def parse_file(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        source_fingerprint: str | None,
+        logger: FilteringBoundLogger,
+        logger_filehandle: BinaryIO,
+    ) -> None:
+        """Send the next file to parse to the worker, once it is done with the previous one."""
+        # The worker sent all the logs of the previous file before its result, but on other sockets, which
+        # may not all have been read yet.
+        self._read_pending_output()
+        self.logger_filehandle.close()
+        cast("_CurrentFileLogger", self.process_log).logger = logger
+        self.logger_filehandle = logger_filehandle
+        self.parsing_result = None
+        self.start_time = time.monotonic()
+        self.files_parsed += 1
+        self._on_child_started([], path, bundle_path, source_fingerprint)
+
+    def _read_pending_output(self) -> None:
+        for sock, socket_type in list(self._open_sockets.items()):
+            if socket_type == "requests":
+                continue
+            socket_handler, on_close = self.selector.get_key(sock).data
+            sock.setblocking(False)
+            try:
+                while socket_handler(sock):
+                    pass
+            except BlockingIOError:
+                sock.setblocking(True)
+                continue
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            on_close(sock)
+            sock.close()
+
+    def should_recycle(self, max_files: int, max_memory_mb: int) -> bool:
+        """Whether the worker parsed enough files, or uses enough memory, to be replaced by a new one."""
+        if max_files and self.files_parsed >= max_files:
+            return True
+        if max_memory_mb:
+            with contextlib.suppress(psutil.Error):
+                return self._process.memory_info().rss > max_memory_mb * 1024 * 1024
+        return False
+
+    def retire(self) -> None:
+        """Let the worker exit, once it is done with the current file."""
+        with contextlib.suppress(OSError):
+            self.stdin.shutdown(socket.SHUT_WR)
+
+    @property
+    def has_exited(self) -> bool:
+        """Whether the worker exited, and all its output was read."""
+        return super().is_ready
+
+    @property
+    def is_ready(self) -> bool:
+        return self.parsing_result is not None or self.has_exited
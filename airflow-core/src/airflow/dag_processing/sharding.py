@@ -0,0 +1,74 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Sharing the DAG files to parse between several DAG processors."""
+
+from __future__ import annotations
+
+import bisect
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+from airflow.jobs.dag_processor_job_runner import DagProcessorJobRunner
+from airflow.jobs.job import Job
+from airflow.utils.hashlib_wrapper import md5
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.state import JobState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.orm import Session
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(md5(key.encode()).digest()[:8], "big")
+
+
+class FileShardRing:
+    """
+    Consistent hash ring assigning DAG files to DAG processors.
+
+    Each processor is placed at ``replicas`` points of the ring, and a file belongs to the processor of
+    the first point after the hash of its bundle name and relative path. When a processor joins or
+    leaves, only the files of the segments of the ring it takes over or gives up change processor.
+
+    :param members: the ids of the DAG processors sharing the files
+    :param replicas: number of points of the ring per processor; more points share the files more evenly
+    """
+
+    def __init__(self, members: Iterable[int], replicas: int = 100) -> None:
+        self.members = frozenset(members)
+        points = sorted((_hash(f"{member}:{i}"), member) for member in self.members for i in range(replicas))
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def get_owner(self, bundle_name: str, rel_path: str) -> int | None:
+        """Return the id of the DAG processor parsing a file, or None if the ring has no member."""
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(f"{bundle_name}:{rel_path}")) % len(self._hashes)
+        return self._owners[index]
+
+
+@provide_session
+def get_live_dag_processor_ids(session: Session = NEW_SESSION) -> set[int]:
+    """Return the job ids of the DAG processors that are running, and recently heartbeated."""
+    jobs = session.scalars(
+        select(Job).where(Job.job_type == DagProcessorJobRunner.job_type, Job.state == JobState.RUNNING)
+    )
+    return {job.id for job in jobs if job.is_alive()}
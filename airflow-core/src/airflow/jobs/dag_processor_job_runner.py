@@ -57,6 +57,7 @@ class DagProcessorJobRunner(BaseJobRunner, LoggingMixin):
 
     def _execute(self) -> int | None:
         self.log.info("Starting the Dag Processor Job")
+        self.processor.job_id = self.job.id
         try:
             self.processor.run()
         except Exception:
@@ -26,13 +26,13 @@ import sys
 import time
 from collections import Counter, defaultdict, deque
 from collections.abc import Callable, Collection, Iterable, Iterator
-from contextlib import ExitStack
+from contextlib import AbstractContextManager, ExitStack, nullcontext
 from datetime import date, datetime, timedelta
 from functools import lru_cache, partial
 from itertools import groupby
 from typing import TYPE_CHECKING, Any, cast
 
-from sqlalchemy import and_, delete, desc, exists, func, inspect, or_, select, text, tuple_, update
+from sqlalchemy import and_, case, delete, desc, exists, func, inspect, or_, select, text, tuple_, update
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import joinedload, lazyload, load_only, make_transient, selectinload
 from sqlalchemy.sql import expression
@@ -46,6 +46,7 @@ from airflow.dag_processing.bundles.base import BundleUsageTrackingManager
 from airflow.executors import workloads
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import Job, perform_heartbeat
+from airflow.jobs.scheduler_loop_profiler import SchedulerLoopProfiler
 from airflow.models import Deadline, Log
 from airflow.models.asset import (
     AssetActive,
@@ -88,10 +89,12 @@ if TYPE_CHECKING:
 
     from pendulum.datetime import DateTime
     from sqlalchemy.orm import Query, Session
+    from sqlalchemy.sql import ColumnElement, Select
 
     from airflow.executors.base_executor import BaseExecutor
     from airflow.executors.executor_utils import ExecutorName
     from airflow.models.mappedoperator import MappedOperator
+    from airflow.models.pool import PoolStats
     from airflow.models.taskinstance import TaskInstanceKey
     from airflow.serialization.serialized_objects import SerializedBaseOperator
     from airflow.utils.sqlalchemy import CommitProhibitorGuard
@@ -119,17 +122,33 @@ class ConcurrencyMap:
     It contains a map from (dag_id, task_id) to # of task instances, a map from (dag_id, task_id)
     to # of task instances in the given state list and a map from (dag_id, run_id, task_id)
     to # of task instances in the given state list in each DAG run.
+
+    When ``incremental`` is True, the map is kept up to date between loads with :meth:`add` and
+    :meth:`remove` instead of being reloaded from the database on every scheduler loop. The task instances
+    added since the last load are remembered one by one; those counted by the load are only known by their
+    number per task and DAG run.
     """
 
-    def __init__(self):
+    def __init__(self, incremental: bool = False):
         self.dag_run_active_tasks_map: Counter[tuple[str, str]] = Counter()
         self.task_concurrency_map: Counter[tuple[str, str]] = Counter()
         self.task_dagrun_concurrency_map: Counter[tuple[str, str, str]] = Counter()
+        self.incremental = incremental
+        # (dag_id, task_id, run_id, map_index) of the task instances added since the last load
+        self._added_tis: set[tuple[str, str, str, int]] = set()
+        # Task instances added since the last commit, which are not counted anymore on rollback
+        self._uncommitted_tis: list[tuple[str, str, str, int]] = []
+        # (dag_id, run_id, task_id) to # of the task instances counted by the last load not removed since
+        self._loaded_tis: Counter[tuple[str, str, str]] = Counter()
+        self.loaded_at: float | None = None
+        self._loaded_at_date: datetime | None = None
 
     def load(self, session: Session) -> None:
         self.dag_run_active_tasks_map.clear()
         self.task_concurrency_map.clear()
         self.task_dagrun_concurrency_map.clear()
+        self._added_tis.clear()
+        self._uncommitted_tis.clear()
         query = session.execute(
             select(TI.dag_id, TI.task_id, TI.run_id, func.count("*"))
             .where(TI.state.in_(EXECUTION_STATES))
@@ -139,6 +158,72 @@ class ConcurrencyMap:
             self.dag_run_active_tasks_map[dag_id, run_id] += c
             self.task_concurrency_map[(dag_id, task_id)] += c
             self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += c
+        if self.incremental:
+            self._loaded_tis = self.task_dagrun_concurrency_map.copy()
+        self.loaded_at = time.monotonic()
+        # Taken after the query, so that a task instance finished before it was not counted by the load
+        self._loaded_at_date = timezone.utcnow()
+
+    def needs_reload(self, reconcile_interval: float) -> bool:
+        """Whether the map has never been loaded, or was last loaded more than the interval ago."""
+        if self.loaded_at is None:
+            return True
+        return time.monotonic() - self.loaded_at >= reconcile_interval
+
+    def add(self, dag_id: str, task_id: str, run_id: str, map_index: int) -> None:
+        """Count a task instance that entered one of the execution states."""
+        key = (dag_id, task_id, run_id, map_index)
+        if key in self._added_tis:
+            return
+        self._added_tis.add(key)
+        self._uncommitted_tis.append(key)
+        self.dag_run_active_tasks_map[dag_id, run_id] += 1
+        self.task_concurrency_map[(dag_id, task_id)] += 1
+        self.task_dagrun_concurrency_map[(dag_id, run_id, task_id)] += 1
+
+    def remove(
+        self, dag_id: str, task_id: str, run_id: str, map_index: int, *, end_date: datetime | None = None
+    ) -> None:
+        """
+        Stop counting a task instance that left the execution states.
+
+        :param end_date: when the task instance finished, if known. A task instance that finished before the
+            last load was not counted by it.
+        """
+        key = (dag_id, task_id, run_id, map_index)
+        if key in self._added_tis:
+            self._added_tis.remove(key)
+        else:
+            loaded_key = (dag_id, run_id, task_id)
+            if self._loaded_tis[loaded_key] <= 0:
+                return
+            if end_date and self._loaded_at_date and end_date < self._loaded_at_date:
+                return
+            self._loaded_tis[loaded_key] -= 1
+        self._decrement(dag_id, task_id, run_id)
+
+    def commit(self) -> None:
+        """Keep counting the task instances added since the last commit, their new state was committed."""
+        self._uncommitted_tis.clear()
+
+    def rollback(self) -> None:
+        """Stop counting the task instances added since the last commit, their new state was rolled back."""
+        for key in self._uncommitted_tis:
+            if key in self._added_tis:
+                self._added_tis.remove(key)
+                dag_id, task_id, run_id, _ = key
+                self._decrement(dag_id, task_id, run_id)
+        self._uncommitted_tis.clear()
+
+    def _decrement(self, dag_id: str, task_id: str, run_id: str) -> None:
+        for counter, counter_key in (
+            (self.dag_run_active_tasks_map, (dag_id, run_id)),
+            (self.task_concurrency_map, (dag_id, task_id)),
+            (self.task_dagrun_concurrency_map, (dag_id, run_id, task_id)),
+        ):
+            counter[counter_key] -= 1
+            if counter[counter_key] <= 0:
+                del counter[counter_key]
 
 
 def _is_parent_process() -> bool:
@@ -195,6 +280,22 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._dag_stale_not_seen_duration = conf.getint("scheduler", "dag_stale_not_seen_duration")
         self._task_queued_timeout = conf.getfloat("scheduler", "task_queued_timeout")
         self._enable_tracemalloc = conf.getboolean("scheduler", "enable_tracemalloc")
+        self._critical_section_query_mode = conf.get("scheduler", "critical_section_query_mode")
+        self._concurrency_map_reconcile_interval = conf.getfloat(
+            "scheduler", "concurrency_map_reconcile_interval"
+        )
+        # When enabled, the concurrency map survives across scheduler loops and is updated from the task
+        # instances this scheduler queues and the executor events it receives, and fully reloaded from
+        # the database every ``concurrency_map_reconcile_interval`` seconds.
+        self._concurrency_map: ConcurrencyMap | None = (
+            ConcurrencyMap(incremental=True) if self._concurrency_map_reconcile_interval > 0 else None
+        )
+        self._loop_profiler: SchedulerLoopProfiler | None = None
+        if conf.getboolean("scheduler", "loop_profiling"):
+            self._loop_profiler = SchedulerLoopProfiler(
+                buffer_size=conf.getint("scheduler", "loop_profiling_buffer_size"),
+                output_file=conf.get("scheduler", "loop_profiling_output_file") or None,
+            )
 
         # this param is intentionally undocumented
         self._num_stuck_queued_retries = conf.getint(
@@ -211,7 +312,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if log:
             self._log = log
 
-        self.scheduler_dag_bag = DBDagBag(load_op_links=False)
+        self.scheduler_dag_bag = DBDagBag(
+            load_op_links=False,
+            cache_size=conf.getint("scheduler", "dag_cache_size"),
+            cache_max_bytes=conf.getint("scheduler", "dag_cache_max_bytes"),
+        )
 
     @provide_session
     def heartbeat_callback(self, session: Session = NEW_SESSION) -> None:
@@ -282,6 +387,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             executor.debug_dump()
             self.log.info("-" * 80)
 
+        if self._loop_profiler:
+            self.log.info("Scheduler loop profile:\n%s", self._loop_profiler.format_summary())
+            self._loop_profiler.write()
+            self.log.info("-" * 80)
+
         id2name = {th.ident: th.name for th in threading.enumerate()}
         for threadId, stack in sys._current_frames().items():
             self.log.info("Stack Trace for Scheduler Job Runner on thread: %s", id2name[threadId])
@@ -341,8 +451,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         starved_pools = {pool_name for pool_name, stats in pools.items() if stats["open"] <= 0}
 
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
+        if self._concurrency_map is not None:
+            concurrency_map = self._concurrency_map
+            if concurrency_map.needs_reload(self._concurrency_map_reconcile_interval):
+                concurrency_map.load(session=session)
+        else:
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
 
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
@@ -360,34 +475,42 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             num_starved_tasks = len(starved_tasks)
             num_starved_tasks_task_dagrun_concurrency = len(starved_tasks_task_dagrun_concurrency)
 
-            query = (
-                select(TI)
-                .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
-                .join(TI.dag_run)
-                .where(DR.state == DagRunState.RUNNING)
-                .join(TI.dag_model)
-                .where(~DM.is_paused)
-                .where(TI.state == TaskInstanceState.SCHEDULED)
-                .where(DM.bundle_name.is_not(None))
-                .options(selectinload(TI.dag_model))
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
-            )
-
+            starved_filters: list[ColumnElement[bool]] = []
             if starved_pools:
-                query = query.where(TI.pool.not_in(starved_pools))
+                starved_filters.append(TI.pool.not_in(starved_pools))
 
             if starved_dags:
-                query = query.where(TI.dag_id.not_in(starved_dags))
+                starved_filters.append(TI.dag_id.not_in(starved_dags))
 
             if starved_tasks:
-                query = query.where(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
+                starved_filters.append(tuple_(TI.dag_id, TI.task_id).not_in(starved_tasks))
 
             if starved_tasks_task_dagrun_concurrency:
-                query = query.where(
+                starved_filters.append(
                     tuple_(TI.dag_id, TI.run_id, TI.task_id).not_in(starved_tasks_task_dagrun_concurrency)
                 )
 
-            query = query.limit(max_tis)
+            if self._critical_section_query_mode == "windowed":
+                if executable_tis:
+                    # Still scheduled in the DB until the end of the loop
+                    starved_filters.append(TI.id.not_in([ti.id for ti in executable_tis]))
+                query = self._windowed_executable_task_instances_query(pools, starved_filters)
+            else:
+                query = (
+                    select(TI)
+                    .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
+                    .join(TI.dag_run)
+                    .where(DR.state == DagRunState.RUNNING)
+                    .join(TI.dag_model)
+                    .where(~DM.is_paused)
+                    .where(TI.state == TaskInstanceState.SCHEDULED)
+                    .where(DM.bundle_name.is_not(None))
+                    .where(*starved_filters)
+                    .options(selectinload(TI.dag_model))
+                    .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
+                )
+
+            query = query.limit(max_tis - len(executable_tis))
 
             timer = Stats.timer("scheduler.critical_section_query_duration")
             timer.start()
@@ -585,15 +708,16 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
                 executable_tis.append(task_instance)
                 open_slots -= task_instance.pool_slots
-                concurrency_map.dag_run_active_tasks_map[dag_run_key] += 1
-                concurrency_map.task_concurrency_map[(task_instance.dag_id, task_instance.task_id)] += 1
-                concurrency_map.task_dagrun_concurrency_map[
-                    (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
-                ] += 1
+                concurrency_map.add(*task_instance.key.primary)
 
                 pool_stats["open"] = open_slots
 
-            is_done = executable_tis or len(task_instances_to_examine) < max_tis
+            if self._critical_section_query_mode == "windowed":
+                # The query leaves out the TIs ranked behind the ones found blocked above, so a short result
+                # does not mean that there are no more candidates: query again while new TIs are blocked.
+                is_done = len(executable_tis) >= max_tis
+            else:
+                is_done = executable_tis or len(task_instances_to_examine) < max_tis
             # Check this to avoid accidental infinite loops
             found_new_filters = (
                 len(starved_pools) > num_starved_pools
@@ -645,6 +769,107 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             make_transient(ti)
         return executable_tis
 
+    @staticmethod
+    def _windowed_executable_task_instances_query(
+        pools: dict[str, PoolStats], starved_filters: list[ColumnElement[bool]]
+    ) -> Select:
+        """
+        Build a query selecting the scheduled TIs that fit in their pool and DAG run limits.
+
+        Candidates are ranked in scheduling order with window functions: first a row number per DAG run,
+        keeping the TIs that fit in the remaining ``max_active_tasks`` of their DAG run, then a running
+        total of requested pool slots per pool, keeping the TIs that fit in the open slots of their pool.
+        This lets the database discard TIs blocked by pool or DAG run limits in a single query, instead
+        of re-querying with a growing list of starved pools and DAGs.
+
+        The ranking does not know about the other limits checked by the caller (task concurrency,
+        executor slots). The TIs the caller found blocked by them are excluded by ``starved_filters``
+        before ranking, so that they do not keep the room of lower priority TIs on the next query.
+        """
+        priority_order = (-TI.priority_weight, DR.logical_date, TI.map_index)
+        active_tis_per_dag_run = (
+            select(TI.dag_id, TI.run_id, func.count("*").label("active"))
+            .where(TI.state.in_(EXECUTION_STATES))
+            .group_by(TI.dag_id, TI.run_id)
+            .subquery()
+        )
+        # Rank candidates within their DAG run first, so that TIs blocked by their DAG run limit do not
+        # take up room in the pool ranking below.
+        ranked_per_dag_run = (
+            select(
+                TI.id.label("ti_id"),
+                TI.pool.label("pool"),
+                TI.pool_slots.label("pool_slots"),
+                TI.priority_weight.label("priority_weight"),
+                DR.logical_date.label("logical_date"),
+                TI.map_index.label("map_index"),
+                func.row_number()
+                .over(partition_by=(TI.dag_id, TI.run_id), order_by=priority_order)
+                .label("dag_run_rank"),
+                (DM.max_active_tasks - func.coalesce(active_tis_per_dag_run.c.active, 0)).label(
+                    "dag_run_open_slots"
+                ),
+            )
+            .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
+            .join(TI.dag_run)
+            .where(DR.state == DagRunState.RUNNING)
+            .join(TI.dag_model)
+            .where(~DM.is_paused)
+            .where(TI.state == TaskInstanceState.SCHEDULED)
+            .where(DM.bundle_name.is_not(None))
+            .where(*starved_filters)
+            .outerjoin(
+                active_tis_per_dag_run,
+                and_(
+                    active_tis_per_dag_run.c.dag_id == TI.dag_id,
+                    active_tis_per_dag_run.c.run_id == TI.run_id,
+                ),
+            )
+            .subquery()
+        )
+        ranked_per_pool = (
+            select(
+                ranked_per_dag_run.c.ti_id,
+                ranked_per_dag_run.c.pool,
+                func.sum(ranked_per_dag_run.c.pool_slots)
+                .over(
+                    partition_by=ranked_per_dag_run.c.pool,
+                    order_by=(
+                        -ranked_per_dag_run.c.priority_weight,
+                        ranked_per_dag_run.c.logical_date,
+                        ranked_per_dag_run.c.map_index,
+                    ),
+                    rows=(None, 0),
+                )
+                .label("requested_pool_slots"),
+            )
+            .where(ranked_per_dag_run.c.dag_run_rank <= ranked_per_dag_run.c.dag_run_open_slots)
+            .subquery()
+        )
+        query = (
+            select(TI)
+            .join(ranked_per_pool, ranked_per_pool.c.ti_id == TI.id)
+            .join(TI.dag_run)
+            .options(selectinload(TI.dag_model))
+            .order_by(*priority_order)
+        )
+        # Unlimited pools, and pools that do not exist (reported by the caller), are not filtered here.
+        open_slots_per_pool = {
+            pool_name: int(stats["open"])
+            for pool_name, stats in pools.items()
+            if stats["open"] != float("inf")
+        }
+        if open_slots_per_pool:
+            query = query.where(
+                ranked_per_pool.c.requested_pool_slots
+                <= case(
+                    open_slots_per_pool,
+                    value=ranked_per_pool.c.pool,
+                    else_=ranked_per_pool.c.requested_pool_slots,
+                )
+            )
+        return query
+
     def _enqueue_task_instances_with_queued_state(
         self, task_instances: list[TI], executor: BaseExecutor, session: Session
     ) -> None:
@@ -741,11 +966,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             job_id=self.job.id,
             scheduler_dag_bag=self.scheduler_dag_bag,
             session=session,
+            concurrency_map=self._concurrency_map,
         )
 
     @classmethod
     def process_executor_events(
-        cls, executor: BaseExecutor, job_id: str | None, scheduler_dag_bag: DBDagBag, session: Session
+        cls,
+        executor: BaseExecutor,
+        job_id: str | None,
+        scheduler_dag_bag: DBDagBag,
+        session: Session,
+        concurrency_map: ConcurrencyMap | None = None,
     ) -> int:
         """
         Respond to executor events.
@@ -753,10 +984,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         This is a classmethod because this is also used in `dag.test()`.
         `dag.test` execute DAGs with no scheduler, therefore it needs to handle the events pushed by the
         executors as well.
+
+        If a ``concurrency_map`` is passed, task instances reported as no longer running or queued are
+        removed from it.
         """
         ti_primary_key_to_try_number_map: dict[tuple[str, str, str, int], int] = {}
         event_buffer = executor.get_event_buffer()
         tis_with_right_state: list[TaskInstanceKey] = []
+        # Finished task instances to remove from the concurrency map once their end date is known
+        finished_ti_keys: set[tuple[str, str, str, int]] = set()
 
         # Report execution
         for ti_key, (state, _) in event_buffer.items():
@@ -764,6 +1000,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             ti_primary_key_to_try_number_map[ti_key.primary] = ti_key.try_number
 
             cls.logger().info("Received executor event with state %s for task instance %s", state, ti_key)
+            if concurrency_map is not None and state not in EXECUTION_STATES:
+                if state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS):
+                    finished_ti_keys.add(ti_key.primary)
+                else:
+                    concurrency_map.remove(*ti_key.primary)
             if state in (
                 TaskInstanceState.FAILED,
                 TaskInstanceState.SUCCESS,
@@ -789,7 +1030,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
         # multi-schedulers
         tis_query: Query = with_row_locks(query, of=TI, session=session, skip_locked=True)
-        tis: Iterator[TI] = session.scalars(tis_query)
+        tis = session.scalars(tis_query).all()
+        if concurrency_map is not None:
+            for ti in tis:
+                if ti.key.primary in finished_ti_keys:
+                    finished_ti_keys.remove(ti.key.primary)
+                    concurrency_map.remove(*ti.key.primary, end_date=ti.end_date)
+            # Locked by another scheduler, or deleted
+            for ti_primary_key in finished_ti_keys:
+                concurrency_map.remove(*ti_primary_key)
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -976,6 +1225,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             DagRun.set_active_spans(active_spans=self.active_spans)
             BaseExecutor.set_active_spans(active_spans=self.active_spans)
 
+            if conf.getboolean("scheduler", "dag_cache_prewarm"):
+                self._prewarm_dag_cache()
+
+            if self._loop_profiler:
+                self._loop_profiler.install(settings.engine)
+
             self._run_scheduler_loop()
 
             settings.Session.remove()
@@ -983,6 +1238,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.exception("Exception when executing SchedulerJob._run_scheduler_loop")
             raise
         finally:
+            if self._loop_profiler:
+                self._loop_profiler.uninstall()
+                self._loop_profiler.write()
+
             for executor in self.job.executors:
                 try:
                     executor.end()
@@ -995,6 +1254,17 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             self.log.info("Exited execute loop")
         return None
 
+    def _prewarm_dag_cache(self) -> None:
+        try:
+            with create_session() as session:
+                self.scheduler_dag_bag.prewarm(
+                    batch_size=conf.getint("scheduler", "dag_cache_prewarm_batch_size"),
+                    processes=conf.getint("scheduler", "dag_cache_prewarm_processes"),
+                    session=session,
+                )
+        except Exception:  # should not fail the scheduler, the DAGs are loaded when needed instead
+            self.log.exception("Failed to pre-warm the DAG cache")
+
     @provide_session
     def _update_dag_run_state_for_paused_dags(self, session: Session = NEW_SESSION) -> None:
         try:
@@ -1249,6 +1519,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             with (
                 DebugTrace.start_span(span_name="scheduler_job_loop", component="SchedulerJobRunner") as span,
                 Stats.timer("scheduler.scheduler_loop_duration") as timer,
+                self._loop_profiler.loop(loop_count) if self._loop_profiler else nullcontext(),
             ):
                 span.set_attributes(
                     {
@@ -1269,24 +1540,26 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Heartbeat all executors, even if they're not receiving new tasks this loop. It will be
                 # either a no-op, or they will check-in on currently running tasks and send out new
                 # events to be processed below.
-                for executor in self.job.executors:
-                    executor.heartbeat()
+                with self._profile_phase("executor_heartbeat"):
+                    for executor in self.job.executors:
+                        executor.heartbeat()
 
-                with create_session() as session:
+                with self._profile_phase("executor_events"), create_session() as session:
                     num_finished_events = 0
                     for executor in self.job.executors:
                         num_finished_events += self._process_executor_events(
                             executor=executor, session=session
                         )
 
-                for executor in self.job.executors:
-                    try:
-                        with create_session() as session:
-                            self._process_task_event_logs(executor._task_event_logs, session)
-                    except Exception:
-                        self.log.exception("Something went wrong when trying to save task event logs.")
+                with self._profile_phase("task_event_logs"):
+                    for executor in self.job.executors:
+                        try:
+                            with create_session() as session:
+                                self._process_task_event_logs(executor._task_event_logs, session)
+                        except Exception:
+                            self.log.exception("Something went wrong when trying to save task event logs.")
 
-                with create_session() as session:
+                with self._profile_phase("deadlines"), create_session() as session:
                     # Only retrieve expired deadlines that haven't been processed yet.
                     # `callback_state` is null/None by default until the handler set it.
                     for deadline in session.scalars(
@@ -1297,12 +1570,14 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         deadline.handle_miss(session)
 
                 # Heartbeat the scheduler periodically
-                perform_heartbeat(
-                    job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
-                )
+                with self._profile_phase("job_heartbeat"):
+                    perform_heartbeat(
+                        job=self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True
+                    )
 
                 # Run any pending timed events
-                next_event = timers.run(blocking=False)
+                with self._profile_phase("timed_events"):
+                    next_event = timers.run(blocking=False)
                 self.log.debug("Next timed event is in %f", next_event)
 
             self.log.debug("Ran scheduling loop in %.2f seconds", timer.duration)
@@ -1330,6 +1605,11 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     span.add_event("Exiting scheduler loop as requested number of runs has been reached")
                 break
 
+    def _profile_phase(self, name: str) -> AbstractContextManager[None]:
+        if self._loop_profiler is None:
+            return nullcontext()
+        return self._loop_profiler.phase(name)
+
     def _do_scheduling(self, session: Session) -> int:
         """
         Make the main scheduling decisions.
@@ -1363,29 +1643,33 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if settings.USE_JOB_SCHEDULE:
-                self._create_dagruns_for_dags(guard, session)
+                with self._profile_phase("create_dagruns"):
+                    self._create_dagruns_for_dags(guard, session)
 
-            self._start_queued_dagruns(session)
-            guard.commit()
+            with self._profile_phase("start_queued_dagruns"):
+                self._start_queued_dagruns(session)
+                guard.commit()
 
-            # Bulk fetch the currently active dag runs for the dags we are
-            # examining, rather than making one query per DagRun
-            dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
+            with self._profile_phase("schedule_dagruns"):
+                # Bulk fetch the currently active dag runs for the dags we are
+                # examining, rather than making one query per DagRun
+                dag_runs = DagRun.get_running_dag_runs_to_examine(session=session)
 
-            callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
+                callback_tuples = self._schedule_all_dag_runs(guard, dag_runs, session)
 
         # Send the callbacks after we commit to ensure the context is up to date when it gets run
         # cache saves time during scheduling of many dag_runs for same dag
         cached_get_dag: Callable[[DagRun], DAG | None] = lru_cache()(
             partial(self.scheduler_dag_bag.get_dag_for_run, session=session)
         )
-        for dag_run, callback_to_run in callback_tuples:
-            dag = cached_get_dag(dag_run)
-            if dag:
-                # Sending callbacks to the database, so it must be done outside of prohibit_commit.
-                self._send_dag_callbacks_to_processor(dag, callback_to_run)
-            else:
-                self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
+        with self._profile_phase("dag_callbacks"):
+            for dag_run, callback_to_run in callback_tuples:
+                dag = cached_get_dag(dag_run)
+                if dag:
+                    # Sending callbacks to the database, so it must be done outside of prohibit_commit.
+                    self._send_dag_callbacks_to_processor(dag, callback_to_run)
+                else:
+                    self.log.error("DAG '%s' not found in serialized_dag table", dag_run.dag_id)
 
         with prohibit_commit(session) as guard:
             # Without this, the session has an invalid view of the DB
@@ -1404,13 +1688,15 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.start()
 
                     # Find any TIs in state SCHEDULED, try to QUEUE them (send it to the executors)
-                    num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
+                    with self._profile_phase("critical_section"):
+                        num_queued_tis = self._critical_section_enqueue_task_instances(session=session)
 
                     # Make sure we only sent this metric if we obtained the lock, otherwise we'll skew the
                     # metric, way down
                     timer.stop(send=True)
                 except OperationalError as e:
                     timer.stop(send=False)
+                    self._rollback_concurrency_map()
 
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
@@ -1418,11 +1704,25 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                         session.rollback()
                         return 0
                     raise
+                except Exception:
+                    self._rollback_concurrency_map()
+                    raise
 
-            guard.commit()
+            try:
+                guard.commit()
+            except Exception:
+                self._rollback_concurrency_map()
+                raise
+            if self._concurrency_map is not None:
+                self._concurrency_map.commit()
 
         return num_queued_tis
 
+    def _rollback_concurrency_map(self) -> None:
+        """Stop counting the task instances queued by a critical section whose transaction failed."""
+        if self._concurrency_map is not None:
+            self._concurrency_map.rollback()
+
     @retry_db_transaction
     def _create_dagruns_for_dags(self, guard: CommitProhibitorGuard, session: Session) -> None:
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError."""
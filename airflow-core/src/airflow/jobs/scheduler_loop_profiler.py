@@ -0,0 +1,211 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Per-phase profiling of the scheduler loop."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import statistics
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from sqlalchemy import event
+from tabulate import tabulate
+
+from airflow.stats import Stats
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from sqlalchemy.engine import Engine
+
+log = logging.getLogger(__name__)
+
+
+class PhaseProfile(NamedTuple):
+    """Resources used by one phase of one scheduler loop."""
+
+    name: str
+    duration: float
+    """Wall time, in seconds."""
+    statements: int
+    """Number of SQL statements executed."""
+    rows: int
+    """Number of rows fetched or affected, as reported by the database driver."""
+
+
+class LoopProfile(NamedTuple):
+    """Resources used by one scheduler loop, broken down by phase."""
+
+    loop_count: int
+    start: float
+    """Unix timestamp of the start of the loop."""
+    duration: float
+    phases: list[PhaseProfile]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**self._asdict(), "phases": [phase._asdict() for phase in self.phases]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LoopProfile:
+        return cls(**{**data, "phases": [PhaseProfile(**phase) for phase in data["phases"]]})
+
+
+def summarize(profiles: Iterable[LoopProfile]) -> list[dict[str, Any]]:
+    """
+    Aggregate loop profiles by phase, in the order the phases ran.
+
+    Durations are in milliseconds. Phases that did not run in a loop are not counted for that loop.
+    """
+    by_phase: dict[str, list[PhaseProfile]] = {"loop": []}
+    for profile in profiles:
+        by_phase["loop"].append(
+            PhaseProfile(
+                "loop",
+                profile.duration,
+                sum(p.statements for p in profile.phases),
+                sum(p.rows for p in profile.phases),
+            )
+        )
+        for phase in profile.phases:
+            by_phase.setdefault(phase.name, []).append(phase)
+
+    summary = []
+    for name, phases in by_phase.items():
+        if not phases:
+            continue
+        durations = sorted(phase.duration * 1000 for phase in phases)
+        summary.append(
+            {
+                "phase": name,
+                "count": len(phases),
+                "mean_ms": round(statistics.fmean(durations), 3),
+                "p95_ms": round(durations[min(len(durations) - 1, int(len(durations) * 0.95))], 3),
+                "max_ms": round(durations[-1], 3),
+                "mean_statements": round(statistics.fmean(phase.statements for phase in phases), 1),
+                "mean_rows": round(statistics.fmean(phase.rows for phase in phases), 1),
+            }
+        )
+    return summary
+
+
+def read_profiles(path: str | os.PathLike[str]) -> list[LoopProfile]:
+    """Read the loop profiles written by ``SchedulerLoopProfiler.write``."""
+    with open(path) as f:
+        return [LoopProfile.from_dict(profile) for profile in json.load(f)]
+
+
+class SchedulerLoopProfiler:
+    """
+    Record the wall time, SQL statements and rows of each phase of the scheduler loop.
+
+    The profiles of the last ``buffer_size`` loops are kept in memory. Each phase is also sent as a
+    ``scheduler.loop_phase_duration`` timer. If ``output_file`` is set, the profiles are written to it
+    every ``buffer_size`` loops, and when ``write`` is called.
+
+    SQL statements are counted on the given engine, so only phases, which do not overlap, are profiled;
+    statements executed outside of a phase are not counted.
+    """
+
+    def __init__(self, buffer_size: int = 100, output_file: str | None = None) -> None:
+        self.profiles: deque[LoopProfile] = deque(maxlen=buffer_size)
+        self.output_file = output_file
+        self._engine: Engine | None = None
+        self._loop: tuple[int, float, float] | None = None
+        self._phases: list[PhaseProfile] = []
+        self._in_phase = False
+        self._statements = 0
+        self._rows = 0
+
+    def install(self, engine: Engine) -> None:
+        """Start counting the SQL statements executed on ``engine``."""
+        self._engine = engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self) -> None:
+        """Stop counting SQL statements."""
+        if self._engine is None:
+            return
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._engine, "after_cursor_execute", self._after_cursor_execute)
+        self._engine = None
+
+    def _before_cursor_execute(self, *args, **kwargs) -> None:
+        if self._in_phase:
+            self._statements += 1
+
+    def _after_cursor_execute(self, conn, cursor, *args, **kwargs) -> None:
+        if self._in_phase and (rowcount := getattr(cursor, "rowcount", -1)) > 0:
+            self._rows += rowcount
+
+    @contextlib.contextmanager
+    def loop(self, loop_count: int) -> Generator[None, None, None]:
+        """Profile one scheduler loop."""
+        self._loop = (loop_count, time.time(), time.monotonic())
+        self._phases = []
+        try:
+            yield
+        finally:
+            loop_count, start, start_monotonic = self._loop
+            self._loop = None
+            self.profiles.append(
+                LoopProfile(loop_count, start, time.monotonic() - start_monotonic, self._phases)
+            )
+            if self.output_file and loop_count % (self.profiles.maxlen or 1) == 0:
+                self.write()
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Profile one phase of the current loop. Does nothing outside of a loop, or in another phase."""
+        if self._loop is None or self._in_phase:
+            yield
+            return
+        self._in_phase = True
+        self._statements = self._rows = 0
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start
+            self._in_phase = False
+            self._phases.append(PhaseProfile(name, duration, self._statements, self._rows))
+            Stats.timing(f"scheduler.loop_phase_duration.{name}", duration * 1000)
+            Stats.timing("scheduler.loop_phase_duration", duration * 1000, tags={"phase": name})
+
+    def format_summary(self) -> str:
+        """Return a table summarizing the profiled loops by phase."""
+        if not (summary := summarize(self.profiles)):
+            return "No scheduler loop profiled yet"
+        return tabulate(summary, headers="keys")
+
+    def write(self) -> None:
+        """Write the profiled loops to ``output_file``, as JSON."""
+        if not self.output_file:
+            return
+        try:
+            tmp_file = f"{self.output_file}.tmp"
+            with open(tmp_file, "w") as f:
+                json.dump([profile.to_dict() for profile in self.profiles], f)
+            os.replace(tmp_file, self.output_file)
+        except OSError:
+            log.exception("Failed to write the scheduler loop profile to %s", self.output_file)
@@ -0,0 +1,53 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Add data_segmented to serialized_dag.
+
+Revision ID: 17386b4d871c
+Revises: 7582ea3f3dd5
+Create Date: 2025-08-20 09:12:41.381924
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.mysql import LONGBLOB
+
+# revision identifiers, used by Alembic.
+revision = "17386b4d871c"
+down_revision = "7582ea3f3dd5"
+branch_labels = None
+depends_on = None
+airflow_version = "3.1.0"
+
+
+def upgrade():
+    """Add data_segmented to serialized_dag."""
+    with op.batch_alter_table("serialized_dag", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("data_segmented", sa.LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=True)
+        )
+
+
+def downgrade():
+    """Remove data_segmented from serialized_dag."""
+    with op.batch_alter_table("serialized_dag", schema=None) as batch_op:
+        batch_op.drop_column("data_segmented")
@@ -2113,13 +2113,14 @@ class DagModel(Base):
         bundle_name: str,
         rel_filelocs: list[str],
         session: Session = NEW_SESSION,
-    ) -> None:
+    ) -> int:
         """
         Set ``is_active=False`` on the DAGs for which the DAG files have been removed.
 
         :param bundle_name: bundle for filelocs
         :param rel_filelocs: relative filelocs for bundle
         :param session: ORM Session
+        :return: the number of DAGs deactivated
         """
         log.debug("Deactivating DAGs (for which DAG files are deleted) from %s table ", cls.__tablename__)
         dag_models = session.scalars(
@@ -2135,9 +2136,12 @@ class DagModel(Base):
             )
         )
 
+        deactivated = 0
         for dm in dag_models:
-            if dm.relative_fileloc not in rel_filelocs:
+            if dm.relative_fileloc not in rel_filelocs and not dm.is_stale:
                 dm.is_stale = True
+                deactivated += 1
+        return deactivated
 
     @classmethod
     def dags_needing_dagruns(cls, session: Session) -> tuple[Query, dict[str, datetime]]:
@@ -17,23 +17,33 @@
 # under the License.
 from __future__ import annotations
 
+import builtins
 import contextlib
 import hashlib
+import heapq
 import importlib
 import importlib.machinery
 import importlib.util
+import logging
+import multiprocessing
 import os
+import resource
 import signal
 import sys
 import textwrap
+import threading
+import time
 import traceback
 import warnings
 import zipfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, NamedTuple
 
-from sqlalchemy import Column, String, inspect, select
+from sqlalchemy import Column, String, case, exists, inspect, select
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.attributes import NO_VALUE
 from tabulate import tabulate
@@ -52,6 +62,7 @@ from airflow.exceptions import (
 from airflow.listeners.listener import get_listener_manager
 from airflow.models.base import Base, StringID
 from airflow.models.dag_version import DagVersion
+from airflow.stats import Stats
 from airflow.utils.docs import get_docs_url
 from airflow.utils.file import (
     correct_maybe_zipped,
@@ -79,6 +90,8 @@ if TYPE_CHECKING:
     from airflow.models.serialized_dag import SerializedDagModel
     from airflow.utils.types import ArgNotSet
 
+log = logging.getLogger(__name__)
+
 
 @contextlib.contextmanager
 def _capture_with_reraise() -> Generator[list[warnings.WarningMessage], None, None]:
@@ -109,6 +122,9 @@ class FileLoadStat(NamedTuple):
     :param task_num: Total number of Tasks loaded in this file.
     :param dags: DAGs names loaded in this file.
     :param warning_num: Total number of warnings captured from processing this file.
+    :param cpu_time: CPU time, in seconds, spent on process file.
+    :param peak_rss: Peak resident memory, in bytes, of the process while processing this file.
+    :param top_imports: Seconds spent importing the slowest modules imported by this file, slowest first.
     """
 
     file: str
@@ -117,6 +133,9 @@ class FileLoadStat(NamedTuple):
     task_num: int
     dags: str
     warning_num: int
+    cpu_time: float
+    peak_rss: int
+    top_imports: dict[str, float]
 
 
 @contextlib.contextmanager
@@ -143,6 +162,68 @@ def timeout(seconds=1, error_message="Timeout"):
             signal.setitimer(signal.ITIMER_REAL, 0)
 
 
+def _reset_peak_rss() -> None:
+    """
+    Reset the peak resident memory of the process to its current resident memory.
+
+    This is only possible on Linux; elsewhere, the peak resident memory of the whole life of the process
+    is measured.
+    """
+    with contextlib.suppress(OSError), open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+
+
+def _get_peak_rss() -> int:
+    """Return the peak resident memory of the process, in bytes."""
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, and in kilobytes elsewhere
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+_import_timer_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def _time_imports(import_times: dict[str, float]) -> Generator[None, None, None]:
+    """
+    Time the modules imported by the current thread, like ``python -X importtime`` does.
+
+    The time of a module does not include the time of the modules it imports itself. Modules already
+    imported, and relative imports, are not timed. Only one thread at a time can time its imports, the
+    imports of other threads are not timed meanwhile.
+
+    :param import_times: dictionary filled with the seconds spent importing each module
+    """
+    if not _import_timer_lock.acquire(blocking=False):
+        yield
+        return
+
+    original_import = builtins.__import__
+    thread_id = threading.get_ident()
+    # Seconds spent importing the modules imported by each module being imported
+    nested_import_times: list[float] = []
+
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.get_ident() != thread_id:
+            return original_import(name, globals, locals, fromlist, level)
+        nested_import_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.perf_counter() - start
+            import_times[name] = import_times.get(name, 0.0) + duration - nested_import_times.pop()
+            if nested_import_times:
+                nested_import_times[-1] += duration
+
+    builtins.__import__ = timed_import
+    try:
+        yield
+    finally:
+        builtins.__import__ = original_import
+        _import_timer_lock.release()
+
+
 class DagBag(LoggingMixin):
     """
     A dagbag is a collection of dags, parsed out of a folder tree and has high level configuration settings.
@@ -164,6 +245,8 @@ class DagBag(LoggingMixin):
         are not loaded to not run User code in Scheduler.
     :param collect_dags: when True, collects dags during class initialization.
     :param known_pools: If not none, then generate warnings if a Task attempts to use an unknown pool.
+    :param profile_parsing: when True, the peak resident memory of the process is reset before each file
+        is processed, and the imports of each file are timed if ``[core] dagbag_profile_top_imports`` is set.
     """
 
     def __init__(
@@ -175,9 +258,11 @@ class DagBag(LoggingMixin):
         collect_dags: bool = True,
         known_pools: set[str] | None = None,
         bundle_path: Path | None = None,
+        profile_parsing: bool = False,
     ):
         super().__init__()
         self.bundle_path = bundle_path
+        self.profile_parsing = profile_parsing
         include_examples = (
             include_examples
             if isinstance(include_examples, bool)
@@ -203,6 +288,8 @@ class DagBag(LoggingMixin):
 
         self.dagbag_import_error_tracebacks = conf.getboolean("core", "dagbag_import_error_tracebacks")
         self.dagbag_import_error_traceback_depth = conf.getint("core", "dagbag_import_error_traceback_depth")
+        self.dagbag_profile_top_imports = conf.getint("core", "dagbag_profile_top_imports")
+        self.dagbag_stats: list[FileLoadStat] = []
         if collect_dags:
             self.collect_dags(
                 dag_folder=dag_folder,
@@ -592,10 +679,25 @@ class DagBag(LoggingMixin):
 
         for filepath in files_to_parse:
             try:
+                import_times: dict[str, float] = {}
+                if self.profile_parsing:
+                    _reset_peak_rss()
                 file_parse_start_dttm = timezone.utcnow()
-                found_dags = self.process_file(filepath, only_if_updated=only_if_updated, safe_mode=safe_mode)
+                cpu_time_start = time.process_time()
+                with (
+                    _time_imports(import_times)
+                    if self.profile_parsing and self.dagbag_profile_top_imports > 0
+                    else contextlib.nullcontext()
+                ):
+                    found_dags = self.process_file(
+                        filepath, only_if_updated=only_if_updated, safe_mode=safe_mode
+                    )
 
+                cpu_time = time.process_time() - cpu_time_start
                 file_parse_end_dttm = timezone.utcnow()
+                top_imports = heapq.nlargest(
+                    self.dagbag_profile_top_imports, import_times.items(), key=itemgetter(1)
+                )
                 stats.append(
                     FileLoadStat(
                         file=filepath.replace(settings.DAGS_FOLDER, ""),
@@ -604,6 +706,9 @@ class DagBag(LoggingMixin):
                         task_num=sum(len(dag.tasks) for dag in found_dags),
                         dags=str([dag.dag_id for dag in found_dags]),
                         warning_num=len(self.captured_warnings.get(filepath, [])),
+                        cpu_time=cpu_time,
+                        peak_rss=_get_peak_rss(),
+                        top_imports=dict(top_imports),
                     )
                 )
             except Exception as e:
@@ -668,22 +773,63 @@ class DBDagBag:
     """
     Internal class for retrieving and caching dags in the scheduler.
 
+    Deserialized dags are kept in a least-recently-used cache keyed by dag version id. The cache can be
+    bounded by number of entries (``cache_size``) and by the approximate size of the cached dags in bytes
+    (``cache_max_bytes``); the size of a dag is approximated by the size of its serialized representation
+    as stored in the database.
+    A bound of 0 (the default) means that dimension is not limited.
+
     :meta private:
     """
 
-    def __init__(self, load_op_links: bool = True):
-        self._dags: dict[str, DAG] = {}  # dag_version_id to dag
+    def __init__(self, load_op_links: bool = True, cache_size: int = 0, cache_max_bytes: int = 0):
+        self._dags: OrderedDict[str, DAG] = OrderedDict()  # dag_version_id to dag, least recently used first
+        self._dag_sizes: dict[str, int] = {}
+        self._total_bytes = 0
         self.load_op_links = load_op_links
+        self.cache_size = cache_size
+        self.cache_max_bytes = cache_max_bytes
+
+    def _cache_dag(self, version_id: str, dag: DAG, size: int) -> None:
+        if version_id in self._dags:
+            self._total_bytes -= self._dag_sizes.pop(version_id, 0)
+        self._dags[version_id] = dag
+        self._dags.move_to_end(version_id)
+        self._dag_sizes[version_id] = size
+        self._total_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        # Always keep the most recently added dag, even if it alone exceeds the byte budget.
+        while len(self._dags) > 1 and (
+            (self.cache_size and len(self._dags) > self.cache_size)
+            or (self.cache_max_bytes and self._total_bytes > self.cache_max_bytes)
+        ):
+            version_id, _ = self._dags.popitem(last=False)
+            self._total_bytes -= self._dag_sizes.pop(version_id, 0)
+            Stats.incr("dag_bag.cache.evict")
+        Stats.gauge("dag_bag.cache.size", len(self._dags))
+        Stats.gauge("dag_bag.cache.bytes", self._total_bytes)
+
+    def clear_cache(self) -> None:
+        """Drop all cached dags."""
+        self._dags.clear()
+        self._dag_sizes.clear()
+        self._total_bytes = 0
 
     def _read_dag(self, serdag: SerializedDagModel) -> DAG | None:
         serdag.load_op_links = self.load_op_links
         if dag := serdag.dag:
-            self._dags[serdag.dag_version_id] = dag
+            size = serdag.stored_size if self.cache_max_bytes else 0
+            self._cache_dag(serdag.dag_version_id, dag, size)
         return dag
 
     def _get_dag(self, version_id: str, session: Session) -> DAG | None:
         if dag := self._dags.get(version_id):
+            self._dags.move_to_end(version_id)
+            Stats.incr("dag_bag.cache.hit")
             return dag
+        Stats.incr("dag_bag.cache.miss")
         dag_version = session.get(DagVersion, version_id, options=[joinedload(DagVersion.serialized_dag)])
         if not dag_version:
             return None
@@ -719,6 +865,84 @@ class DBDagBag:
             if dag := self._read_dag(sdm):
                 yield dag
 
+    def prewarm(self, *, batch_size: int = 500, processes: int = 0, session: Session) -> int:
+        """
+        Load the latest version of every active and unpaused dag into the cache.
+
+        Serialized dags are fetched ``batch_size`` dags at a time instead of one query per dag version
+        the first time it is needed. No more dags than the cache can hold are loaded: dags are loaded in
+        the order the scheduler needs them, those with queued or running dag runs first, then those whose
+        next dag run is due first.
+
+        :param batch_size: number of dags fetched from the database in one query
+        :param processes: if more than 1, decompress and decode serialized dags stored in a binary format
+            in a pool of this many processes; deserializing them into dags is always done in this process
+        :param session: ORM Session
+        :return: the number of dags loaded
+        """
+        from airflow.models.dag import DagModel
+        from airflow.models.dagrun import DagRun
+        from airflow.models.serialized_dag import SerializedDagModel
+        from airflow.utils.state import DagRunState
+
+        start = time.monotonic()
+        has_active_dag_runs = exists().where(
+            DagRun.dag_id == DagModel.dag_id, DagRun.state.in_((DagRunState.QUEUED, DagRunState.RUNNING))
+        )
+        dag_ids = session.scalars(
+            select(DagModel.dag_id)
+            .where(~DagModel.is_stale, ~DagModel.is_paused)
+            .order_by(
+                case((has_active_dag_runs, 0), else_=1),
+                # Dags without a next dag run last; MySQL does not support NULLS LAST
+                case((DagModel.next_dagrun_create_after.is_(None), 1), else_=0),
+                DagModel.next_dagrun_create_after,
+                DagModel.dag_id,
+            )
+        ).all()
+        if self.cache_size:
+            dag_ids = dag_ids[: self.cache_size]
+        log.info("Pre-warming the DAG cache with %d DAGs", len(dag_ids))
+
+        loaded = 0
+        with contextlib.ExitStack() as exit_stack:
+            pool = None
+            if processes > 1:
+                pool = exit_stack.enter_context(
+                    ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("spawn"))
+                )
+            for i in range(0, len(dag_ids), batch_size):
+                serdags = SerializedDagModel.get_latest_serialized_dags(
+                    dag_ids=dag_ids[i : i + batch_size], session=session
+                )
+                loaded += self._prewarm_batch(serdags, pool)
+                Stats.gauge("dag_bag.prewarm.loaded", loaded)
+                log.info("Pre-warmed %d/%d DAGs", loaded, len(dag_ids))
+                if self.cache_max_bytes and self._total_bytes >= self.cache_max_bytes:
+                    log.info("DAG cache is full, stopping the pre-warm")
+                    break
+
+        duration = time.monotonic() - start
+        Stats.timing("dag_bag.prewarm.duration", duration * 1000)
+        log.info("Pre-warmed the DAG cache with %d DAGs in %.2fs", loaded, duration)
+        return loaded
+
+    def _prewarm_batch(self, serdags: list[SerializedDagModel], pool: ProcessPoolExecutor | None) -> int:
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        if pool:
+            SerializedDagModel.decode_binary_data_in_pool(serdags, pool)
+
+        loaded = 0
+        for serdag in serdags:
+            try:
+                if self._read_dag(serdag):
+                    loaded += 1
+            except Exception:
+                # The dag will be loaded again, and the error raised, when the scheduler needs it.
+                log.exception("Failed to pre-warm the DAG cache with DAG %s", serdag.dag_id)
+        return loaded
+
     def get_latest_version_of_dag(self, dag_id: str, *, session: Session) -> DAG | None:
         """Get the latest version of a dag by its id."""
         from airflow.models.serialized_dag import SerializedDagModel
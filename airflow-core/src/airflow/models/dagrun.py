@@ -121,6 +121,44 @@ class TISchedulingDecision(NamedTuple):
     finished_tis: list[TI]
 
 
+class TIProjection:
+    """
+    Lightweight, read-only projection of a finished task instance row.
+
+    Used by ``DagRun.task_instance_scheduling_decisions`` when
+    ``[scheduler] compact_task_instance_loading`` is enabled. Finished task instances are only read
+    while evaluating the dependencies of unfinished ones, so loading them as full ORM objects is
+    wasted work. The projection exposes the attributes read by the dependency checks and the
+    DagRun state evaluation; ``task`` is populated afterwards, like it is for ORM task instances.
+    """
+
+    __slots__ = ("id", "task_id", "map_index", "state", "try_number", "start_date", "end_date", "task")
+
+    columns = (TI.id, TI.task_id, TI.map_index, TI.state, TI.try_number, TI.start_date, TI.end_date)
+
+    def __init__(
+        self,
+        id: str,
+        task_id: str,
+        map_index: int,
+        state: TaskInstanceState | None,
+        try_number: int,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> None:
+        self.id = id
+        self.task_id = task_id
+        self.map_index = map_index
+        self.state = state
+        self.try_number = try_number
+        self.start_date = start_date
+        self.end_date = end_date
+        self.task: Operator | None = None
+
+    def __repr__(self) -> str:
+        return f"<TIProjection: {self.task_id} map_index={self.map_index} [{self.state}]>"
+
+
 def _default_run_after(ctx):
     params = ctx.get_current_parameters()
     return params["data_interval_end"] or params["logical_date"] or timezone.utcnow()
@@ -287,6 +325,11 @@ class DagRun(Base, LoggingMixin):
         "max_dagruns_per_loop_to_schedule",
         fallback=20,
     )
+    COMPACT_TASK_INSTANCE_LOADING = airflow_conf.getboolean(
+        "scheduler",
+        "compact_task_instance_loading",
+        fallback=False,
+    )
     _ti_dag_versions = association_proxy("task_instances", "dag_version")
     _tih_dag_versions = association_proxy("task_instances_histories", "dag_version")
 
@@ -566,7 +609,6 @@ class DagRun(Base, LoggingMixin):
                 DagModel.is_paused == false(),
                 DagModel.is_stale == false(),
             )
-            .options(joinedload(cls.task_instances))
             .order_by(
                 nulls_first(BackfillDagRun.sort_ordinal, session=session),
                 nulls_first(cls.last_scheduling_decision, session=session),
@@ -574,6 +616,8 @@ class DagRun(Base, LoggingMixin):
             )
             .limit(cls.DEFAULT_DAGRUNS_TO_EXAMINE)
         )
+        if not cls.COMPACT_TASK_INSTANCE_LOADING:
+            query = query.options(joinedload(cls.task_instances))
 
         query = query.where(DagRun.run_after <= func.now())
 
@@ -850,6 +894,27 @@ class DagRun(Base, LoggingMixin):
             dag_id=self.dag_id, run_id=self.run_id, task_ids=task_ids, state=state, session=session
         )
 
+    def _get_task_instances_compact(self, session: Session) -> list[TI]:
+        """
+        Return the task instances for this dag run, loading the finished ones as ``TIProjection``.
+
+        Unfinished task instances may change state while being scheduled and are loaded as ORM objects.
+
+        :meta private:
+        """
+        task_ids = DagRun._get_partial_task_ids(self.dag)
+        tis = self.get_task_instances(state=State.unfinished, session=session)
+        query = select(*TIProjection.columns).where(
+            TI.dag_id == self.dag_id,
+            TI.run_id == self.run_id,
+            TI.state.in_(State.finished),
+        )
+        if task_ids is not None:
+            query = query.where(TI.task_id.in_(task_ids))
+        # The projections are duck-type compatible with the TI attributes read by the dependency checks.
+        tis.extend(cast("TI", TIProjection(*row)) for row in session.execute(query))
+        return tis
+
     @provide_session
     def get_task_instance(
         self,
@@ -1251,8 +1316,8 @@ class DagRun(Base, LoggingMixin):
 
         # finally, if the leaves aren't done, the dag is still running
         else:
-            # It might need to start TI spans as well.
-            self.start_dr_spans_if_needed(tis=tis)
+            # It might need to start TI spans as well. Projections of finished tis have no span to continue.
+            self.start_dr_spans_if_needed(tis=[ti for ti in tis if not isinstance(ti, TIProjection)])
 
             self.set_state(DagRunState.RUNNING)
 
@@ -1295,7 +1360,10 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def task_instance_scheduling_decisions(self, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+        if self.COMPACT_TASK_INSTANCE_LOADING:
+            tis = self._get_task_instances_compact(session=session)
+        else:
+            tis = self.get_task_instances(session=session, state=State.task_states)
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: DAG, tis: list[TI]) -> Iterable[TI]:
@@ -1308,6 +1376,9 @@ class DagRun(Base, LoggingMixin):
                 except TaskNotFound:
                     if ti.state != TaskInstanceState.REMOVED:
                         self.log.error("Failed to get task for ti %s. Marking it as removed.", ti)
+                        # Only materialize the ORM row of a projection when its state changes.
+                        if isinstance(ti, TIProjection) and (orm_ti := session.get(TI, ti.id)):
+                            orm_ti.state = TaskInstanceState.REMOVED
                         ti.state = TaskInstanceState.REMOVED
                         session.flush()
                 else:
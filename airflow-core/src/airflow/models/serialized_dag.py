@@ -27,8 +27,9 @@ from typing import TYPE_CHECKING, Any, Literal
 
 import sqlalchemy_jsonfield
 import uuid6
-from sqlalchemy import Column, ForeignKey, LargeBinary, String, exc, select, tuple_
-from sqlalchemy.orm import backref, foreign, relationship
+from sqlalchemy import Column, ForeignKey, LargeBinary, String, Text, cast, exc, select, tuple_
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.orm import backref, column_property, foreign, relationship
 from sqlalchemy.sql.expression import func, literal
 from sqlalchemy_utils import UUIDType
 
@@ -45,13 +46,16 @@ from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
 from airflow.sdk.definitions.asset import AssetUniqueKey
 from airflow.serialization.dag_dependency import DagDependency
+from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
+from airflow.serialization.segmented import SegmentedDagData, encode_segmented
 from airflow.serialization.serialized_objects import SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, json
+from airflow.settings import COMPRESS_SERIALIZED_DAGS, SERIALIZED_DAG_STORAGE_FORMAT, json
 from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.session import NEW_SESSION, provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from datetime import datetime
 
     from sqlalchemy.orm import Session
@@ -289,6 +293,9 @@ class SerializedDagModel(Base):
     dag_id = Column(String(ID_LEN), nullable=False)
     _data = Column("data", sqlalchemy_jsonfield.JSONField(json=json), nullable=True)
     _data_compressed = Column("data_compressed", LargeBinary, nullable=True)
+    _data_segmented = Column("data_segmented", LargeBinary().with_variant(LONGBLOB, "mysql"), nullable=True)
+    # Length of the uncompressed JSON data as stored, only queried when accessed
+    _data_length = column_property(func.length(cast(_data, Text)), deferred=True)
     created_at = Column(UtcDateTime, nullable=False, default=timezone.utcnow)
     last_updated = Column(UtcDateTime, nullable=False, default=timezone.utcnow, onupdate=timezone.utcnow)
     dag_hash = Column(String(32), nullable=False)
@@ -329,10 +336,14 @@ class SerializedDagModel(Base):
 
         self.dag_hash = SerializedDagModel.hash(dag_data)
 
-        # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
-
-        if COMPRESS_SERIALIZED_DAGS:
+        self._data_segmented = None
+        if SERIALIZED_DAG_STORAGE_FORMAT == "segmented":
+            self._data = None
+            self._data_compressed = None
+            self._data_segmented = encode_segmented(dag_data, compress=COMPRESS_SERIALIZED_DAGS)
+        elif COMPRESS_SERIALIZED_DAGS:
+            # partially ordered json data
+            dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -442,6 +453,7 @@ class SerializedDagModel(Base):
             # Update the serialized DAG with the new_serialized_dag
             latest_ser_dag._data = new_serialized_dag._data
             latest_ser_dag._data_compressed = new_serialized_dag._data_compressed
+            latest_ser_dag._data_segmented = new_serialized_dag._data_segmented
             latest_ser_dag.dag_hash = new_serialized_dag.dag_hash
             session.merge(latest_ser_dag)
             # The dag_version and dag_code may not have changed, still we should
@@ -538,17 +550,65 @@ class SerializedDagModel(Base):
                 )
         return dags
 
+    @staticmethod
+    def decode_binary_data(data_compressed: bytes | None, data_segmented: bytes | None) -> dict | None:
+        """
+        Decode the serialized DAG stored in the binary columns of a row, if any.
+
+        This does not need the row, so it can be called in another process.
+        """
+        if data_segmented:
+            return SegmentedDagData(data_segmented).data
+        if data_compressed:
+            return json.loads(zlib.decompress(data_compressed))
+        return None
+
     @property
     def data(self) -> dict | None:
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
-            if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+            if self._data_segmented or self._data_compressed:
+                self.__data_cache = self.decode_binary_data(self._data_compressed, self._data_segmented)
             else:
                 self.__data_cache = self._data
 
         return self.__data_cache
 
+    @property
+    def stored_size(self) -> int:
+        """
+        Size, in bytes, of the serialized DAG as stored in the DB.
+
+        The DAG is not decoded: this is the length of its binary data, or, for uncompressed JSON data,
+        its length as computed by the DB.
+        """
+        if self._data_segmented:
+            return len(self._data_segmented)
+        if self._data_compressed:
+            return len(self._data_compressed)
+        return self._data_length or 0
+
+    @classmethod
+    def decode_binary_data_in_pool(cls, serdags: Iterable[SerializedDagModel], pool: Executor) -> None:
+        """
+        Decode the data of the rows stored in a binary format in a pool of processes.
+
+        ``data`` then returns the decoded data of these rows without decoding it again. Rows stored as
+        uncompressed JSON are left as they are.
+
+        :param serdags: the rows to decode
+        :param pool: the pool of processes decoding the data
+        """
+        binary_serdags = [s for s in serdags if s._data_compressed or s._data_segmented]
+        decoded = pool.map(
+            cls.decode_binary_data,
+            [s._data_compressed for s in binary_serdags],
+            [s._data_segmented for s in binary_serdags],
+        )
+        for serdag, data in zip(binary_serdags, decoded):
+            if data is not None:
+                serdag.__data_cache = data
+
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
@@ -658,27 +718,44 @@ class SerializedDagModel(Base):
 
         :param session: ORM Session
         """
-        load_json: Callable | None
-        if COMPRESS_SERIALIZED_DAGS is False:
+        load_deps: Callable | None
+        data_cols_to_select: tuple[Any, ...]
+        if SERIALIZED_DAG_STORAGE_FORMAT == "segmented":
+            # Rows written before switching the storage format may still hold JSON data.
+            data_cols_to_select = (cls._data_compressed, cls._data)
+
+            def load_deps(data_compressed, data):
+                if data_compressed:
+                    data = json.loads(zlib.decompress(data_compressed))
+                return data["dag"]["dag_dependencies"] if data else []
+        elif COMPRESS_SERIALIZED_DAGS is False:
             if session.bind.dialect.name in ["sqlite", "mysql"]:
-                data_col_to_select = func.json_extract(cls._data, "$.dag.dag_dependencies")
+                data_cols_to_select = (func.json_extract(cls._data, "$.dag.dag_dependencies"),)
 
-                def load_json(deps_data):
+                def load_deps(deps_data):
                     return json.loads(deps_data) if deps_data else []
             else:
-                data_col_to_select = func.json_extract_path(cls._data, "dag", "dag_dependencies")
-                load_json = None
+                data_cols_to_select = (func.json_extract_path(cls._data, "dag", "dag_dependencies"),)
+                load_deps = None
         else:
-            data_col_to_select = cls._data_compressed
+            data_cols_to_select = (cls._data_compressed,)
 
-            def load_json(deps_data):
+            def load_deps(deps_data):
                 return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
 
+        def load_json(data_segmented, *deps_data):
+            # Rows written while the storage format was "segmented" are read whatever the setting is now.
+            if data_segmented:
+                return SegmentedDagData(data_segmented).header_data["dag"].get("dag_dependencies", [])
+            if load_deps is None:
+                return deps_data[0]
+            return load_deps(*deps_data)
+
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
         )
         query = session.execute(
-            select(cls.dag_id, data_col_to_select)
+            select(cls.dag_id, cls._data_segmented, *data_cols_to_select)
             .join(
                 latest_sdag_subquery,
                 (cls.dag_id == latest_sdag_subquery.c.dag_id)
@@ -687,15 +764,39 @@ class SerializedDagModel(Base):
             .join(cls.dag_model)
             .where(~DagModel.is_stale)
         )
-        iterator = (
-            [(dag_id, load_json(deps_data)) for dag_id, deps_data in query]
-            if load_json is not None
-            else query.all()
-        )
+        iterator = [(dag_id, load_json(*deps_data)) for dag_id, *deps_data in query]
         resolver = _DagDependenciesResolver(dag_id_dependencies=iterator, session=session)
         dag_depdendencies_by_dag = resolver.resolve()
         return dag_depdendencies_by_dag
 
+    def _get_segmented_task(self, task_id: str) -> Operator | None:
+        """
+        Deserialize a single task of a DAG stored in the segmented format, without its siblings.
+
+        This is only possible for a non-mapped task directly in the root task group, since mapped tasks
+        and task groups reference other tasks. Returns None if the whole DAG must be deserialized.
+
+        :raises TaskNotFound: if the DAG has no task with this id
+        """
+        segmented = SegmentedDagData(self._data_segmented)
+        header_dag = segmented.header_data["dag"]
+        if task_id not in segmented.task_ids:
+            raise TaskNotFound(f"Task {task_id} not found")
+        if task_id not in header_dag.get("task_group", {}).get("children", {}):
+            return None
+        encoded_task = segmented.get_task(task_id)
+        if encoded_task.get(Encoding.TYPE) != DAT.OP or encoded_task[Encoding.VAR].get("_is_mapped"):
+            return None
+
+        downstream_task_ids = encoded_task[Encoding.VAR].pop("downstream_task_ids", [])
+        encoded_dag = {k: v for k, v in header_dag.items() if k != "task_group"}
+        encoded_dag["tasks"] = [encoded_task]
+        SerializedDAG._load_operator_extra_links = self.load_op_links
+        task = SerializedDAG.from_dict({**segmented.header_data, "dag": encoded_dag}).get_task(task_id)
+        task.downstream_task_ids.update(downstream_task_ids)
+        task.upstream_task_ids.update(segmented.get_upstream_task_ids(task_id))
+        return task
+
     @staticmethod
     @provide_session
     def get_serialized_dag(dag_id: str, task_id: str, session: Session = NEW_SESSION) -> Operator | None:
@@ -703,6 +804,8 @@ class SerializedDagModel(Base):
             # get the latest version of the DAG
             model = session.scalar(SerializedDagModel.latest_item_select_object(dag_id))
             if model:
+                if model._data_segmented and (task := model._get_segmented_task(task_id)) is not None:
+                    return task
                 return model.dag.get_task(task_id)
         except (exc.NoResultFound, TaskNotFound):
             return None
@@ -0,0 +1,161 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Segmented binary storage format for serialized DAGs.
+
+A serialized DAG dict (as returned by ``SerializedDAG.to_dict``) is stored as::
+
+    MAGIC | version (1 byte) | flags (1 byte) | header length (4 bytes, big endian) | header | segments
+
+The header is a msgpack document holding the serialized DAG without its tasks, and an index of
+``[task_id, offset, length, upstream_task_ids]`` entries, in the original task order. Each task is
+msgpack-encoded in its own segment, at ``offset`` bytes after the end of the header, so a single
+task can be decoded without decoding the others. If the ``compressed`` flag is set, the header and
+each segment are compressed individually with zlib, the segments using the preset dictionary stored
+in the header.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from functools import cached_property
+from typing import Any
+
+import msgspec
+
+MAGIC = b"ASDG"
+FORMAT_VERSION = 1
+FLAG_COMPRESSED = 0x01
+
+_PREAMBLE = struct.Struct(">4sBBI")
+_ZDICT_TASKS = 4
+_ZDICT_MAX_SIZE = 32 * 1024
+
+
+def _compress(data: bytes, zdict: bytes = b"") -> bytes:
+    compressor = zlib.compressobj(zdict=zdict) if zdict else zlib.compressobj()
+    return compressor.compress(data) + compressor.flush()
+
+
+def _decompress(data: memoryview, zdict: bytes = b"") -> bytes:
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return decompressor.decompress(data) + decompressor.flush()
+
+
+def encode_segmented(dag_data: dict[str, Any], *, compress: bool = False) -> bytes:
+    """
+    Encode a serialized DAG dict into the segmented format.
+
+    :param dag_data: the serialized DAG, as returned by ``SerializedDAG.to_dict``
+    :param compress: whether to compress the header and every segment with zlib
+    """
+    encoder = msgspec.msgpack.Encoder()
+    dag_dict = dag_data["dag"]
+    tasks = dag_dict.get("tasks", [])
+
+    upstream_task_ids: dict[str, list[str]] = {}
+    for task in tasks:
+        for downstream_task_id in task["__var"].get("downstream_task_ids", ()):
+            upstream_task_ids.setdefault(downstream_task_id, []).append(task["__var"]["task_id"])
+
+    encoded_tasks = [encoder.encode(task) for task in tasks]
+    # Tasks of a DAG are very similar to each other, which compressing each of them on its own cannot
+    # take advantage of. The first tasks are used as a preset dictionary for all the segments instead.
+    zdict = b"".join(encoded_tasks[:_ZDICT_TASKS])[-_ZDICT_MAX_SIZE:] if compress else b""
+
+    segments: list[bytes] = []
+    index: list[list[Any]] = []
+    offset = 0
+    for task, segment in zip(tasks, encoded_tasks):
+        if compress:
+            segment = _compress(segment, zdict)
+        task_id = task["__var"]["task_id"]
+        index.append([task_id, offset, len(segment), upstream_task_ids.get(task_id, [])])
+        segments.append(segment)
+        offset += len(segment)
+
+    header_data = {**dag_data, "dag": {k: v for k, v in dag_dict.items() if k != "tasks"}}
+    header = encoder.encode({"data": header_data, "tasks": index, "zdict": zdict})
+    if compress:
+        header = _compress(header)
+    flags = FLAG_COMPRESSED if compress else 0
+    return b"".join((_PREAMBLE.pack(MAGIC, FORMAT_VERSION, flags, len(header)), header, *segments))
+
+
+class SegmentedDagData:
+    """
+    Lazily decoded view over a serialized DAG stored in the segmented format.
+
+    Only the header is decoded up front; tasks are decoded on access.
+
+    :param blob: the encoded serialized DAG, as returned by ``encode_segmented``
+    """
+
+    def __init__(self, blob: bytes) -> None:
+        magic, version, flags, header_length = _PREAMBLE.unpack_from(blob)
+        if magic != MAGIC:
+            raise ValueError("Serialized DAG data is not in the segmented format")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsure how to decode segmented serialized DAG version {version!r}")
+        self._blob = memoryview(blob)
+        self._compressed = bool(flags & FLAG_COMPRESSED)
+        self._header_end = _PREAMBLE.size + header_length
+        self._zdict = b""
+        header = self._decode(self._blob[_PREAMBLE.size : self._header_end])
+        self._zdict = header["zdict"]
+        self._header_data: dict[str, Any] = header["data"]
+        self._index: dict[str, tuple[int, int, list[str]]] = {
+            task_id: (offset, length, upstream) for task_id, offset, length, upstream in header["tasks"]
+        }
+
+    def _decode(self, buffer: memoryview) -> Any:
+        if self._compressed:
+            return msgspec.msgpack.decode(_decompress(buffer, self._zdict))
+        return msgspec.msgpack.decode(buffer)
+
+    @property
+    def header_data(self) -> dict[str, Any]:
+        """The serialized DAG dict without its tasks. Must not be modified."""
+        return self._header_data
+
+    @property
+    def task_ids(self) -> list[str]:
+        """Ids of the tasks of the DAG, in their serialized order."""
+        return list(self._index)
+
+    def get_upstream_task_ids(self, task_id: str) -> list[str]:
+        """Return the ids of the direct upstream tasks of a task, without decoding any task."""
+        return self._index[task_id][2]
+
+    def get_task(self, task_id: str) -> dict[str, Any]:
+        """
+        Decode a single serialized task.
+
+        :raises KeyError: if the DAG has no task with this id
+        """
+        offset, length, _ = self._index[task_id]
+        start = self._header_end + offset
+        return self._decode(self._blob[start : start + length])
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        """The whole serialized DAG dict, as returned by ``SerializedDAG.to_dict``."""
+        dag_dict = dict(self._header_data["dag"])
+        dag_dict["tasks"] = [self.get_task(task_id) for task_id in self._index]
+        return {**self._header_data, "dag": dag_dict}
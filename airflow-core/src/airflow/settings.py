@@ -671,6 +671,9 @@ MIN_SERIALIZED_DAG_UPDATE_INTERVAL = conf.getint("core", "min_serialized_dag_upd
 # If set to True, serialized DAGs is compressed before writing to DB,
 COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
 
+# Format in which serialized DAGs are written to DB, either "json" or "segmented"
+SERIALIZED_DAG_STORAGE_FORMAT = conf.get("core", "serialized_dag_storage_format", fallback="json")
+
 # Fetching serialized DAG can not be faster than a minimum interval to reduce database
 # read rate. This config controls when your DAGs are updated in the Webserver
 MIN_SERIALIZED_DAG_FETCH_INTERVAL = conf.getint("core", "min_serialized_dag_fetch_interval", fallback=10)
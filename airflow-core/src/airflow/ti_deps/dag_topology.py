@@ -0,0 +1,121 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Precomputed task topology used when evaluating task instance dependencies."""
+
+from __future__ import annotations
+
+import weakref
+from typing import TYPE_CHECKING, NamedTuple
+
+from airflow.sdk.definitions.taskgroup import MappedTaskGroup
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from airflow.models.mappedoperator import MappedOperator
+    from airflow.serialization.serialized_objects import SerializedBaseOperator, SerializedDAG
+
+    Operator: TypeAlias = MappedOperator | SerializedBaseOperator
+
+
+class TaskTopology(NamedTuple):
+    """
+    Relationships of a task that are read when evaluating its trigger rule.
+
+    Computing these walks the DAG (e.g. finding the relevant setups of a task walks all of its upstream
+    and downstream relatives), so they are computed once per task of a DAG version instead of once per
+    task instance and scheduling pass. Only task ids and flags are kept, so that the topology does not
+    keep the DAG alive.
+    """
+
+    upstream_task_ids: frozenset[str]
+    upstream_setup_ids: frozenset[str]
+    upstream_needs_expansion: bool
+    relevant_setup_ids: tuple[str, ...]
+    indirect_setup_ids: tuple[str, ...]
+    indirect_setups_need_expansion: bool
+    in_mapped_task_group: bool
+    expansion_dependencies: frozenset[str]
+
+    @classmethod
+    def compute(cls, task: Operator) -> TaskTopology:
+        """Compute the topology of ``task`` by walking its DAG."""
+        from airflow.models.mappedoperator import is_mapped
+
+        upstream_tasks = task.upstream_list
+        if task.is_teardown:
+            # a teardown cannot have any indirect setups
+            relevant_setups = []
+        else:
+            relevant_setups = list({t.task_id: t for t in task.get_upstreams_only_setups()}.values())
+        indirect_setups = [t for t in relevant_setups if t.task_id not in task.upstream_task_ids]
+
+        expansion_dependencies: set[str] = set()
+        if isinstance(task_group := task.task_group, MappedTaskGroup):
+            if is_mapped(task):
+                expansion_dependencies.update(op.task_id for op in task.iter_mapped_dependencies())
+            expansion_dependencies.update(
+                op.task_id
+                for tg in task_group.iter_mapped_task_groups()
+                for op in tg.iter_mapped_dependencies()
+            )
+
+        return cls(
+            upstream_task_ids=frozenset(task.upstream_task_ids),
+            upstream_setup_ids=frozenset(t.task_id for t in upstream_tasks if t.is_setup),
+            upstream_needs_expansion=any(t.get_needs_expansion() for t in upstream_tasks),
+            relevant_setup_ids=tuple(t.task_id for t in relevant_setups),
+            indirect_setup_ids=tuple(t.task_id for t in indirect_setups),
+            indirect_setups_need_expansion=any(t.get_needs_expansion() for t in indirect_setups),
+            in_mapped_task_group=task.get_closest_mapped_task_group() is not None,
+            expansion_dependencies=frozenset(expansion_dependencies),
+        )
+
+
+# Indexes of serialized DAGs, keyed by the id of the DAG object. An entry is removed when its DAG is
+# garbage collected, so it is never reused for another DAG (version) that gets the same id.
+_dag_indexes: dict[int, dict[str, TaskTopology]] = {}
+
+
+def _get_dag_index(dag: SerializedDAG) -> dict[str, TaskTopology]:
+    try:
+        return _dag_indexes[id(dag)]
+    except KeyError:
+        index = _dag_indexes[id(dag)] = {}
+        weakref.finalize(dag, _dag_indexes.pop, id(dag), None)
+        return index
+
+
+def get_task_topology(task: Operator) -> TaskTopology:
+    """
+    Return the topology of ``task``.
+
+    Topologies of tasks in serialized DAGs are cached for as long as the DAG object is alive, since
+    the scheduler loads a new DAG object for each DAG version. Other DAGs may still be modified after
+    their dependencies were evaluated, so the topology of their tasks is always computed.
+    """
+    from airflow.serialization.serialized_objects import SerializedDAG
+
+    if not isinstance(dag := task.dag, SerializedDAG):
+        return TaskTopology.compute(task)
+    index = _get_dag_index(dag)
+    try:
+        return index[task.task_id]
+    except KeyError:
+        topology = index[task.task_id] = TaskTopology.compute(task)
+        return topology
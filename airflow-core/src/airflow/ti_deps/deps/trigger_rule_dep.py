@@ -20,13 +20,14 @@ from __future__ import annotations
 import collections.abc
 import functools
 from collections import Counter
-from collections.abc import Iterator, KeysView
+from collections.abc import Collection, Container, Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, NamedTuple, cast
 
 from sqlalchemy import and_, func, or_, select
 
 from airflow.models.taskinstance import PAST_DEPENDS_MET
 from airflow.sdk.definitions.taskgroup import MappedTaskGroup
+from airflow.ti_deps.dag_topology import get_task_topology
 from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
 from airflow.utils.state import TaskInstanceState
 from airflow.utils.trigger_rule import TriggerRule as TR
@@ -43,6 +44,42 @@ if TYPE_CHECKING:
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
 
 
+class _UpstreamStateCounts(NamedTuple):
+    """
+    Counts of the states of the finished upstream tis of a ti, summed from per-task counts.
+
+    This avoids iterating over all the finished tis of the dag_run for every ti, for tis that depend on
+    all tis of their upstream tasks (i.e. that are not in a mapped task group).
+    """
+
+    counter: Counter[TaskInstanceState]
+    setup_counter: Counter[TaskInstanceState]
+
+    @classmethod
+    def from_task_states(
+        cls,
+        task_states: Mapping[str, Counter[TaskInstanceState]],
+        upstream_ids: Iterable[str],
+        setup_ids: Container[str],
+    ) -> _UpstreamStateCounts:
+        """
+        Sum the counts of the finished tis of the given upstream tasks.
+
+        :param task_states: counts of the states of the finished tis of the dag_run, per task id
+        :param upstream_ids: ids of the upstream tasks
+        :param setup_ids: ids of the upstream tasks that are setups
+        """
+        counter: Counter[TaskInstanceState] = Counter()
+        setup_counter: Counter[TaskInstanceState] = Counter()
+        for task_id in upstream_ids:
+            if (states := task_states.get(task_id)) is None:
+                continue
+            counter.update(states)
+            if task_id in setup_ids:
+                setup_counter.update(states)
+        return cls(counter, setup_counter)
+
+
 class _UpstreamTIStates(NamedTuple):
     """
     States of the upstream tis for a specific ti.
@@ -60,24 +97,30 @@ class _UpstreamTIStates(NamedTuple):
     skipped_setup: int
 
     @classmethod
-    def calculate(cls, finished_upstreams: Iterator[TaskInstance]) -> _UpstreamTIStates:
+    def calculate(
+        cls, finished_upstreams: Iterator[TaskInstance] | _UpstreamStateCounts
+    ) -> _UpstreamTIStates:
         """
         Calculate states for a task instance.
 
         ``counter`` is inclusive of ``setup_counter`` -- e.g. if there are 2 skipped upstreams, one
         of which is a setup, then counter will show 2 skipped and setup counter will show 1.
 
-        :param finished_upstreams: all the finished upstreams of the dag_run
+        :param finished_upstreams: all the finished upstreams of the dag_run, or their already
+            summed state counts
         """
-        counter: dict[str, int] = Counter()
-        setup_counter: dict[str, int] = Counter()
-        for ti in finished_upstreams:
-            if TYPE_CHECKING:
-                assert ti.task
-            curr_state = {ti.state: 1}
-            counter.update(curr_state)
-            if ti.task.is_setup:
-                setup_counter.update(curr_state)
+        if isinstance(finished_upstreams, _UpstreamStateCounts):
+            counter, setup_counter = finished_upstreams
+        else:
+            counter = Counter()
+            setup_counter = Counter()
+            for ti in finished_upstreams:
+                if TYPE_CHECKING:
+                    assert ti.task
+                curr_state = {ti.state: 1}
+                counter.update(curr_state)
+                if ti.task.is_setup:
+                    setup_counter.update(curr_state)
         return _UpstreamTIStates(
             success=counter.get(TaskInstanceState.SUCCESS, 0),
             skipped=counter.get(TaskInstanceState.SKIPPED, 0),
@@ -133,6 +176,11 @@ class TriggerRuleDep(BaseTIDep):
         from airflow.models.taskinstance import TaskInstance
         from airflow.sdk.definitions._internal.abstractoperator import NotMapped
 
+        if TYPE_CHECKING:
+            assert ti.task
+
+        topology = get_task_topology(ti.task)
+
         @functools.lru_cache
         def _get_expanded_ti_count() -> int:
             """
@@ -148,19 +196,6 @@ class TriggerRuleDep(BaseTIDep):
 
             return get_mapped_ti_count(ti.task, ti.run_id, session=session)
 
-        def _iter_expansion_dependencies(task_group: MappedTaskGroup) -> Iterator[str]:
-            from airflow.models.mappedoperator import is_mapped
-
-            if (task := ti.task) is not None and is_mapped(task):
-                for op in task.iter_mapped_dependencies():
-                    yield op.task_id
-            if task_group and task_group.iter_mapped_task_groups():
-                yield from (
-                    op.task_id
-                    for tg in task_group.iter_mapped_task_groups()
-                    for op in tg.iter_mapped_dependencies()
-                )
-
         @functools.lru_cache
         def _get_relevant_upstream_map_indexes(upstream_id: str) -> int | range | None:
             """
@@ -176,9 +211,7 @@ class TriggerRuleDep(BaseTIDep):
 
             if isinstance(ti.task.task_group, MappedTaskGroup):
                 is_fast_triggered = ti.task.trigger_rule in (TR.ONE_SUCCESS, TR.ONE_FAILED, TR.ONE_DONE)
-                if is_fast_triggered and upstream_id not in set(
-                    _iter_expansion_dependencies(task_group=ti.task.task_group)
-                ):
+                if is_fast_triggered and upstream_id not in topology.expansion_dependencies:
                     return None
 
             try:
@@ -193,7 +226,7 @@ class TriggerRuleDep(BaseTIDep):
                 session=session,
             )
 
-        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: set[str] | KeysView[str]) -> bool:
+        def _is_relevant_upstream(upstream: TaskInstance, relevant_ids: Collection[str]) -> bool:
             """
             Whether a task instance is a "relevant upstream" of the current task.
 
@@ -203,15 +236,12 @@ class TriggerRuleDep(BaseTIDep):
                 2. ti is in a mapped task group and upstream has a map index
                   that ti does not depend on.
             """
-            if TYPE_CHECKING:
-                assert ti.task
-
             # Not actually an upstream task.
             if upstream.task_id not in relevant_ids:
                 return False
             # The current task is not in a mapped task group. All tis from an
             # upstream task are relevant.
-            if ti.task.get_closest_mapped_task_group() is None:
+            if not topology.in_mapped_task_group:
                 return True
             # The upstream ti is not expanded. The upstream may be mapped or
             # not, but the ti is relevant either way.
@@ -228,16 +258,38 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
-        def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnOperators]:
+        def _calculate_upstream_states(
+            *, upstream_ids: Collection[str], setup_ids: Container[str]
+        ) -> _UpstreamTIStates:
+            """
+            Count the states of the finished tis of the given upstream tasks that ``ti`` depends on.
+
+            Unless ``ti`` is in a mapped task group, it depends on all tis of its upstream tasks, and
+            the counts are summed from the per-task counts shared by all tis evaluated in this context.
+            """
+            dag_run = ti.get_dagrun(session)
+            if not topology.in_mapped_task_group:
+                return _UpstreamTIStates.calculate(
+                    _UpstreamStateCounts.from_task_states(
+                        dep_context.ensure_finished_ti_states(dag_run, session),
+                        upstream_ids=upstream_ids,
+                        setup_ids=setup_ids,
+                    )
+                )
+            finished_upstream_tis = (
+                finished_ti
+                for finished_ti in dep_context.ensure_finished_tis(dag_run, session)
+                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=upstream_ids)
+            )
+            return _UpstreamTIStates.calculate(finished_upstream_tis)
+
+        def _iter_upstream_conditions(relevant_tasks: Collection[str]) -> Iterator[ColumnOperators]:
             # Optimization: If the current task is not in a mapped task group,
             # it depends on all upstream task instances.
             from airflow.models.taskinstance import TaskInstance
 
-            if TYPE_CHECKING:
-                assert ti.task
-
-            if ti.task.get_closest_mapped_task_group() is None:
-                yield TaskInstance.task_id.in_(relevant_tasks.keys())
+            if not topology.in_mapped_task_group:
+                yield TaskInstance.task_id.in_(relevant_tasks)
                 return
             # Otherwise we need to figure out which map indexes are depended on
             # for each upstream by the current task instance.
@@ -262,24 +314,17 @@ class TriggerRuleDep(BaseTIDep):
                 else:
                     yield and_(TaskInstance.task_id == upstream_id, TaskInstance.map_index == map_indexes)
 
-        def _evaluate_setup_constraint(*, relevant_setups) -> Iterator[tuple[TIDepStatus, bool]]:
-            """
-            Evaluate whether ``ti``'s trigger rule was met as part of the setup constraint.
-
-            :param relevant_setups: Relevant setups for the current task instance.
-            """
+        def _evaluate_setup_constraint() -> Iterator[tuple[TIDepStatus, bool]]:
+            """Evaluate whether ``ti``'s trigger rule was met as part of the setup constraint."""
             if TYPE_CHECKING:
                 assert ti.task
 
             task = ti.task
 
-            indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
+            indirect_setups = topology.indirect_setup_ids
+            upstream_states = _calculate_upstream_states(
+                upstream_ids=indirect_setups, setup_ids=indirect_setups
             )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -290,7 +335,7 @@ class TriggerRuleDep(BaseTIDep):
 
             # Optimization: Don't need to hit the database if all upstreams are
             # "simple" tasks (no task or task group mapping involved).
-            if not any(t.get_needs_expansion() for t in indirect_setups.values()):
+            if not topology.indirect_setups_need_expansion:
                 upstream = len(indirect_setups)
             else:
                 task_id_counts = session.execute(
@@ -340,6 +385,7 @@ class TriggerRuleDep(BaseTIDep):
             if ti.map_index > -1:
                 non_successes -= removed
             if non_successes > 0:
+                relevant_setups = {t: task.dag.task_dict[t] for t in topology.relevant_setup_ids}
                 yield (
                     self._failing_status(
                         reason=(
@@ -357,15 +403,12 @@ class TriggerRuleDep(BaseTIDep):
                 assert ti.task
 
             task = ti.task
-            upstream_tasks = {t.task_id: t for t in task.upstream_list}
+            upstream_tasks = topology.upstream_task_ids
             trigger_rule = task.trigger_rule
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=ti.task.upstream_task_ids)
+            upstream_states = _calculate_upstream_states(
+                upstream_ids=upstream_tasks, setup_ids=topology.upstream_setup_ids
             )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -378,9 +421,9 @@ class TriggerRuleDep(BaseTIDep):
 
             # Optimization: Don't need to hit the database if all upstreams are
             # "simple" tasks (no task or task group mapping involved).
-            if not any(t.get_needs_expansion() for t in upstream_tasks.values()):
+            if not topology.upstream_needs_expansion:
                 upstream = len(upstream_tasks)
-                upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
+                upstream_setup = len(topology.upstream_setup_ids)
             else:
                 task_id_counts = session.execute(
                     select(TaskInstance.task_id, func.count(TaskInstance.task_id))
@@ -389,7 +432,7 @@ class TriggerRuleDep(BaseTIDep):
                     .group_by(TaskInstance.task_id)
                 ).all()
                 upstream = sum(count for _, count in task_id_counts)
-                upstream_setup = sum(c for t, c in task_id_counts if upstream_tasks[t].is_setup)
+                upstream_setup = sum(c for t, c in task_id_counts if t in topology.upstream_setup_ids)
 
             upstream_done = done >= upstream
 
@@ -626,17 +669,12 @@ class TriggerRuleDep(BaseTIDep):
             else:
                 yield self._failing_status(reason=f"No strategy to evaluate trigger rule '{trigger_rule}'.")
 
-        if TYPE_CHECKING:
-            assert ti.task
-
-        if not ti.task.is_teardown:
-            # a teardown cannot have any indirect setups
-            relevant_setups = {t.task_id: t for t in ti.task.get_upstreams_only_setups()}
-            if relevant_setups:
-                for status, changed in _evaluate_setup_constraint(relevant_setups=relevant_setups):
-                    yield status
-                    if not status.passed and changed:
-                        # no need to evaluate trigger rule; we've already marked as skipped or failed
-                        return
+        # a teardown cannot have any indirect setups, its relevant setups are always empty
+        if topology.relevant_setup_ids:
+            for status, changed in _evaluate_setup_constraint():
+                yield status
+                if not status.passed and changed:
+                    # no need to evaluate trigger rule; we've already marked as skipped or failed
+                    return
 
         yield from _evaluate_direct_relatives()
@@ -18,12 +18,14 @@
 from __future__ import annotations
 
 import ast
+import functools
 import hashlib
 import logging
 import os
 import re
+import stat
 import zipfile
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 from io import TextIOWrapper
 from pathlib import Path
 from re import Pattern
@@ -124,6 +126,110 @@ class _GlobIgnoreRule(NamedTuple):
         return matched
 
 
+_DEFAULT_REGEX_FLAGS = re.compile("").flags
+
+
+def _combine_patterns(patterns: list[Pattern]) -> list[Pattern]:
+    """
+    Combine regular expressions into as few as possible, which match the same strings when searched.
+
+    Patterns with groups, which could clash once combined, or with flags, which would apply to all of
+    them, are kept on their own.
+    """
+    combinable = [p for p in patterns if not p.groups and p.flags == _DEFAULT_REGEX_FLAGS]
+    if len(combinable) < 2:
+        return patterns
+    combined = re.compile("|".join(f"(?:{p.pattern})" for p in combinable))
+    return [combined, *(p for p in patterns if p.groups or p.flags != _DEFAULT_REGEX_FLAGS)]
+
+
+class _IgnoreMatcher:
+    """
+    Ignore rules compiled to match a path with as few regular expressions as possible.
+
+    Consecutive rules that both ignore paths (or both un-ignore them, for negated glob patterns) and
+    are matched against paths relative to the same directory are combined into a single regular
+    expression, so the cost of matching a path barely grows with the number of rules.
+    """
+
+    def __init__(self, rules: Iterable[_IgnoreRule]) -> None:
+        runs: list[tuple[bool, dict[Path | None, list[Pattern]]]] = []
+        for rule in rules:
+            if isinstance(rule, _RegexpIgnoreRule):
+                include, relative_to, pattern = True, rule.base_dir, rule.pattern
+            elif isinstance(rule, _GlobIgnoreRule):
+                if (regex := rule.wild_match_pattern.regex) is None:
+                    continue
+                include, relative_to = bool(rule.wild_match_pattern.include), rule.relative_to
+                # pathspec names a group in each pattern, which only tells whether a directory matched
+                pattern = re.compile(regex.pattern.replace("(?P<ps_d>", "(?:"), regex.flags)
+            else:
+                raise ValueError(f"_IgnoreMatcher cannot match rules of type: {type(rule)}")
+            if not runs or runs[-1][0] != include:
+                runs.append((include, {}))
+            runs[-1][1].setdefault(relative_to, []).append(pattern)
+        self._runs = [
+            (
+                include,
+                [(relative_to, _combine_patterns(patterns)) for relative_to, patterns in groups.items()],
+            )
+            for include, groups in runs
+        ]
+
+    def match(self, path: Path) -> bool:
+        """Whether the supplied absolute path is ignored."""
+        # The first matching rule decides, so that later (negated) patterns can override earlier ones
+        for include, groups in self._runs:
+            for relative_to, patterns in groups:
+                rel_path = str(path.relative_to(relative_to)) if relative_to else path.name
+                if any(pattern.search(rel_path) is not None for pattern in patterns):
+                    return include
+        return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_ignore_file(
+    ignore_file_path: Path,
+    mtime_ns: int,
+    size: int,
+    base_dir: Path,
+    ignore_rule_type: type[_IgnoreRule],
+) -> tuple[_IgnoreRule, ...]:
+    """Read and compile the rules of an ignore file, cached until the file changes."""
+    with open(ignore_file_path) as ifile:
+        patterns_to_match_excluding_comments = [
+            re.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")
+        ]
+    # filter out "None" objects, which are invalid patterns
+    return tuple(
+        p
+        for p in [
+            ignore_rule_type.compile(pattern, base_dir, ignore_file_path)
+            for pattern in patterns_to_match_excluding_comments
+            if pattern
+        ]
+        if p is not None
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_ignore_matcher(
+    ignore_files: tuple[tuple[Path, int, int], ...],
+    base_dir: Path,
+    ignore_rule_type: type[_IgnoreRule],
+) -> _IgnoreMatcher:
+    """
+    Compile the rules of the ignore files that apply to a directory, from the outermost one.
+
+    :param ignore_files: the path, modification time in nanoseconds and size of each ignore file
+    """
+    return _IgnoreMatcher(
+        rule
+        for ignore_file_path, mtime_ns, size in ignore_files
+        for rule in _read_ignore_file(ignore_file_path, mtime_ns, size, base_dir, ignore_rule_type)
+    )
+
+
 ZIP_REGEX = re.compile(rf"((.*\.zip){re.escape(os.sep)})?(.*)")
 
 
@@ -177,46 +283,40 @@ def _find_path_from_directory(
 
     :return: a generator of file paths which should not be ignored.
     """
-    # A Dict of patterns, keyed using resolved, absolute paths
-    patterns_by_dir: dict[Path, list[_IgnoreRule]] = {}
+    # The ignore files that apply to each directory, keyed using resolved, absolute paths
+    ignore_files_by_dir: dict[Path, tuple[tuple[Path, int, int], ...]] = {}
 
     for root, dirs, files in os.walk(base_dir_path, followlinks=True):
-        patterns: list[_IgnoreRule] = patterns_by_dir.get(Path(root).resolve(), [])
+        ignore_files = ignore_files_by_dir.get(Path(root).resolve(), ())
 
         ignore_file_path = Path(root) / ignore_file_name
-        if ignore_file_path.is_file():
-            with open(ignore_file_path) as ifile:
-                patterns_to_match_excluding_comments = [
-                    re.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")
-                ]
-                # append new patterns and filter out "None" objects, which are invalid patterns
-                patterns += [
-                    p
-                    for p in [
-                        ignore_rule_type.compile(pattern, Path(base_dir_path), ignore_file_path)
-                        for pattern in patterns_to_match_excluding_comments
-                        if pattern
-                    ]
-                    if p is not None
-                ]
+        try:
+            ignore_file_stat = ignore_file_path.stat()
+        except OSError:
+            pass
+        else:
+            if stat.S_ISREG(ignore_file_stat.st_mode):
                 # evaluation order of patterns is important with negation
                 # so that later patterns can override earlier patterns
+                ignore_files += ((ignore_file_path, ignore_file_stat.st_mtime_ns, ignore_file_stat.st_size),)
+        # Ignore files are only read and compiled again when they changed since the previous scan
+        matcher = _get_ignore_matcher(ignore_files, Path(base_dir_path), ignore_rule_type)
 
-        dirs[:] = [subdir for subdir in dirs if not ignore_rule_type.match(Path(root) / subdir, patterns)]
+        dirs[:] = [subdir for subdir in dirs if not matcher.match(Path(root) / subdir)]
         # explicit loop for infinite recursion detection since we are following symlinks in this walk
         for sd in dirs:
             dirpath = (Path(root) / sd).resolve()
-            if dirpath in patterns_by_dir:
+            if dirpath in ignore_files_by_dir:
                 raise RuntimeError(
                     "Detected recursive loop when walking DAG directory "
                     f"{base_dir_path}: {dirpath} has appeared more than once."
                 )
-            patterns_by_dir.update({dirpath: patterns.copy()})
+            ignore_files_by_dir[dirpath] = ignore_files
 
         for file in files:
             if file != ignore_file_name:
                 abs_file_path = Path(root) / file
-                if not ignore_rule_type.match(abs_file_path, patterns):
+                if not matcher.match(abs_file_path):
                     yield str(abs_file_path)
 
 
@@ -89,6 +89,9 @@ class TestDagReportEndpoint:
             assert response.status_code == 200
             response_json = response.json()
             assert response_json["total_entries"] == expected_total_entries
+            for dag_report in response_json["dag_reports"]:
+                assert dag_report["peak_rss"] > 0
+                assert {"cpu_time", "top_imports"} <= dag_report.keys()
 
     def test_should_response_200_with_empty_dagbag(self, test_client):
         # the constructor of DagBag will call `collect_dags` method and store the result in `dagbag_stats`
@@ -1378,6 +1378,125 @@ class TestTIHealthEndpoint:
         session.refresh(ti)
         assert ti.last_heartbeat_at == time_now.add(minutes=10)
 
+    def test_ti_heartbeat_batch(self, client, session, create_task_instance, time_machine):
+        """Test that each Task Instance of a batch gets the result of the single heartbeat endpoint."""
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        running = create_task_instance(
+            dag_id="running", state=State.RUNNING, hostname="random-hostname", pid=1547, session=session
+        )
+        elsewhere = create_task_instance(
+            dag_id="elsewhere", state=State.RUNNING, hostname="other-hostname", pid=1547, session=session
+        )
+        finished = create_task_instance(
+            dag_id="finished", state=State.SUCCESS, hostname="random-hostname", pid=1547, session=session
+        )
+        session.commit()
+        missing_id = "0182e924-0f1e-77e6-ab50-e977118bc139"
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "task_instances": [
+                    {"id": str(ti_id), "token": "fake", "hostname": "random-hostname", "pid": 1547}
+                    for ti_id in (running.id, elsewhere.id, finished.id, missing_id)
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = {result["id"]: result for result in response.json()["results"]}
+        assert results == {
+            str(running.id): {
+                "id": str(running.id),
+                "status_code": 204,
+                "detail": None,
+                "refreshed_token": None,
+            },
+            str(elsewhere.id): {
+                "id": str(elsewhere.id),
+                "status_code": 409,
+                "detail": {
+                    "reason": "running_elsewhere",
+                    "message": "TI is already running elsewhere",
+                    "current_hostname": "other-hostname",
+                    "current_pid": 1547,
+                },
+                "refreshed_token": None,
+            },
+            str(finished.id): {
+                "id": str(finished.id),
+                "status_code": 409,
+                "detail": {
+                    "reason": "not_running",
+                    "message": "TI is no longer in the running state and task should terminate",
+                    "current_state": State.SUCCESS,
+                },
+                "refreshed_token": None,
+            },
+            missing_id: {
+                "id": missing_id,
+                "status_code": 404,
+                "detail": {"reason": "not_found", "message": "Task Instance not found"},
+                "refreshed_token": None,
+            },
+        }
+        for ti in (running, elsewhere, finished):
+            session.refresh(ti)
+        assert running.last_heartbeat_at == time_now
+        assert elsewhere.last_heartbeat_at is None
+        assert finished.last_heartbeat_at is None
+
+    def test_ti_heartbeat_batch_checks_each_token(self, client, session, create_task_instance):
+        """Test that the token of each Task Instance of a batch must be valid for it."""
+        allowed = create_task_instance(
+            dag_id="allowed", state=State.RUNNING, hostname="random-hostname", pid=1547, session=session
+        )
+        denied = create_task_instance(
+            dag_id="denied", state=State.RUNNING, hostname="random-hostname", pid=1547, session=session
+        )
+        session.commit()
+
+        validator = mock.AsyncMock(spec=JWTValidator)
+
+        def side_effect(cred, validators):
+            if validators and validators["sub"]["value"] != cred:
+                raise RuntimeError("Fake auth denied")
+            return {"sub": cred, "exp": 9999999999}
+
+        validator.avalidated_claims.side_effect = side_effect
+        lifespan.registry.register_value(JWTValidator, validator)
+
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            headers={"Authorization": f"Bearer {allowed.id}"},
+            json={
+                "task_instances": [
+                    {
+                        "id": str(allowed.id),
+                        "token": str(allowed.id),
+                        "hostname": "random-hostname",
+                        "pid": 1547,
+                    },
+                    {
+                        "id": str(denied.id),
+                        "token": str(allowed.id),
+                        "hostname": "random-hostname",
+                        "pid": 1547,
+                    },
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = {result["id"]: result for result in response.json()["results"]}
+        assert results[str(allowed.id)]["status_code"] == 204
+        assert results[str(denied.id)]["status_code"] == 403
+        assert results[str(denied.id)]["detail"] == "Invalid auth token: Fake auth denied"
+        session.refresh(denied)
+        assert denied.last_heartbeat_at is None
+
 
 class TestTIPutRTIF:
     def setup_method(self):
@@ -16,15 +16,19 @@
 # under the License.
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from airflow.cli import cli_parser
 from airflow.cli.commands import jobs_command
 from airflow.jobs.job import Job
 from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_loop_profiler import SchedulerLoopProfiler
 from airflow.utils.session import create_session
 from airflow.utils.state import JobState, State
 
+from tests_common.test_utils.config import conf_vars
 from tests_common.test_utils.db import clear_db_jobs
 
 
@@ -146,3 +150,30 @@ class TestCliConfigList:
             match=r"To use option --allow-multiple, you must set the limit to a value greater than 1.",
         ):
             jobs_command.check(self.parser.parse_args(["jobs", "check", "--allow-multiple"]))
+
+
+class TestCliJobsLoopProfile:
+    @classmethod
+    def setup_class(cls):
+        cls.parser = cli_parser.get_parser()
+
+    def test_loop_profile(self, tmp_path, stdout_capture):
+        profiler = SchedulerLoopProfiler(output_file=str(tmp_path / "profile.json"))
+        with profiler.loop(1), profiler.phase("critical_section"):
+            pass
+        profiler.write()
+
+        with stdout_capture as temp_stdout:
+            jobs_command.loop_profile(
+                self.parser.parse_args(
+                    ["jobs", "loop-profile", "--profile-file", profiler.output_file, "--output", "json"]
+                )
+            )
+        summary = json.loads(temp_stdout.getvalue())
+        assert [row["phase"] for row in summary] == ["loop", "critical_section"]
+        assert summary[1]["count"] == "1"
+
+    def test_loop_profile_missing_file(self, tmp_path):
+        with conf_vars({("scheduler", "loop_profiling_output_file"): str(tmp_path / "missing.json")}):
+            with pytest.raises(SystemExit, match="Is \\[scheduler\\] loop_profiling enabled?"):
+                jobs_command.loop_profile(self.parser.parse_args(["jobs", "loop-profile"]))
@@ -774,6 +774,30 @@ key3 = value3
         )
         assert message == exception
 
+    def test_enum_serialized_dag_storage_format(self):
+        test_conf = AirflowConfigParser(default_config="")
+        test_conf.read_dict({"core": {"serialized_dag_storage_format": "segment"}})
+        with pytest.raises(AirflowConfigException) as ctx:
+            test_conf.validate()
+        exception = str(ctx.value)
+        message = (
+            "`[core] serialized_dag_storage_format` should not be 'segment'. Possible values: "
+            "json, segmented."
+        )
+        assert message == exception
+
+    def test_enum_critical_section_query_mode(self):
+        test_conf = AirflowConfigParser(default_config="")
+        test_conf.read_dict({"scheduler": {"critical_section_query_mode": "window"}})
+        with pytest.raises(AirflowConfigException) as ctx:
+            test_conf.validate()
+        exception = str(ctx.value)
+        message = (
+            "`[scheduler] critical_section_query_mode` should not be 'window'. Possible values: "
+            "iterative, windowed."
+        )
+        assert message == exception
+
     def test_as_dict_works_without_sensitive_cmds(self):
         conf_materialize_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=True)
         conf_maintain_cmds = conf.as_dict(display_sensitive=True, raw=True, include_cmds=False)
@@ -0,0 +1,93 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.bundles.watcher import BundleChanges, BundleFileWatcher
+
+watchfiles = pytest.importorskip("watchfiles")
+
+
+class TestBundleFileWatcher:
+    @pytest.fixture
+    def watcher(self, tmp_path):
+        watcher = BundleFileWatcher(tmp_path)
+        watcher._thread = mock.Mock(**{"is_alive.return_value": True})
+        return watcher
+
+    def test_record_changes(self, watcher, tmp_path):
+        watcher._record(
+            {
+                (watchfiles.Change.modified, str(tmp_path / "dag_1.py")),
+                (watchfiles.Change.modified, str(tmp_path / "dag_2.py")),
+                (watchfiles.Change.deleted, str(tmp_path / "dag_2.py")),
+            }
+        )
+        watcher._record({(watchfiles.Change.deleted, str(tmp_path / "subdir"))})
+
+        assert watcher.get_changes() == BundleChanges(
+            modified={Path("dag_1.py")}, deleted={Path("dag_2.py"), Path("subdir")}, rescan=False
+        )
+        assert watcher.get_changes() == BundleChanges(modified=set(), deleted=set(), rescan=False)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            pytest.param((watchfiles.Change.added, "dag.py"), id="added"),
+            pytest.param((watchfiles.Change.modified, "subdir/.airflowignore"), id="ignore-rules"),
+        ],
+    )
+    def test_record_changes_requiring_rescan(self, watcher, tmp_path, change):
+        watcher._record({(change[0], str(tmp_path / change[1]))})
+
+        assert watcher.get_changes().rescan
+        assert not watcher.get_changes().rescan
+
+    def test_rescan_when_not_watching(self, tmp_path):
+        assert BundleFileWatcher(tmp_path).get_changes().rescan
+
+    def test_watch(self, tmp_path):
+        dag_file = tmp_path / "dag.py"
+        dag_file.write_text("")
+        watcher = BundleFileWatcher(tmp_path)
+        assert watcher.start()
+        try:
+            # The files are watched as soon as start returns
+            dag_file.write_text("# modified")
+
+            deadline = time.monotonic() + 10
+            modified: set[Path] = set()
+            while not modified and time.monotonic() < deadline:
+                time.sleep(0.1)
+                modified = watcher.get_changes().modified
+            assert modified == {Path("dag.py")}
+        finally:
+            watcher.stop()
+        # Changes are not seen anymore
+        assert watcher.get_changes().rescan
+
+    def test_start_fails_when_files_cannot_be_watched(self, tmp_path):
+        watcher = BundleFileWatcher(tmp_path)
+
+        with mock.patch("watchfiles.watch", side_effect=OSError("inotify watch limit reached")):
+            assert not watcher.start()
+        assert watcher.get_changes().rescan
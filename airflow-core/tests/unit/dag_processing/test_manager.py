@@ -24,6 +24,7 @@ import random
 import re
 import shutil
 import signal
+import sys
 import textwrap
 import time
 from collections import deque
@@ -37,19 +38,30 @@ from unittest.mock import MagicMock
 import msgspec
 import pytest
 import time_machine
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from uuid6 import uuid7
 
 from airflow._shared.timezones import timezone
 from airflow.callbacks.callback_requests import DagCallbackRequest
 from airflow.config_templates.airflow_local_settings import DEFAULT_LOGGING_CONFIG
+from airflow.dag_processing.bundles.local import LocalDagBundle
 from airflow.dag_processing.bundles.manager import DagBundlesManager
+from airflow.dag_processing.bundles.watcher import BundleChanges
 from airflow.dag_processing.manager import (
     DagFileInfo,
     DagFileProcessorManager,
     DagFileStat,
+    ParsedFile,
+    _predict_parse_time,
+    process_parse_results,
+    process_parse_results_batch,
+)
+from airflow.dag_processing.processor import (
+    DagFileParseProfile,
+    DagFileParseWorkerProcess,
+    DagFileParsingResult,
+    DagFileProcessorProcess,
 )
-from airflow.dag_processing.processor import DagFileProcessorProcess
 from airflow.models import DAG, DagBag, DagModel, DbCallbackRequest
 from airflow.models.asset import TaskOutletAssetReference
 from airflow.models.dag_version import DagVersion
@@ -57,6 +69,7 @@ from airflow.models.dagbag import DBDagBag
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.dagcode import DagCode
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.serialization.serialized_objects import LazyDeserializedDAG
 from airflow.utils.net import get_hostname
 from airflow.utils.session import create_session
 
@@ -227,6 +240,93 @@ class TestDagFileProcessorManager:
         assert file_2 in manager._processors.keys()
         assert deque([file_3]) == manager._file_queue
 
+    @mock.patch.object(DagFileProcessorManager, "_get_logger_for_dag_file")
+    def test_parse_workers_reused_until_recycled(self, mock_get_logger, configure_testing_dag_bundle):
+        mock_get_logger.return_value = (MagicMock(), MagicMock())
+        with configure_testing_dag_bundle("/tmp"):
+            manager = DagFileProcessorManager(max_runs=1, use_parse_workers=True)
+        file_1 = DagFileInfo(bundle_name="testing", rel_path=Path("file_1.py"), bundle_path=TEST_DAGS_FOLDER)
+        file_2 = DagFileInfo(bundle_name="testing", rel_path=Path("file_2.py"), bundle_path=TEST_DAGS_FOLDER)
+        worker = MagicMock(spec=DagFileParseWorkerProcess)
+        worker._check_subprocess_exit.return_value = None
+        worker.should_recycle.side_effect = [False, True]
+
+        with mock.patch.object(DagFileParseWorkerProcess, "start", return_value=worker) as mock_start:
+            assert manager._create_process(file_1) is worker
+            manager._release_parse_worker(worker)
+            assert manager._idle_parse_workers == [worker]
+
+            assert manager._create_process(file_2) is worker
+            manager._release_parse_worker(worker)
+
+        mock_start.assert_called_once()
+        worker.parse_file.assert_called_once()
+        assert worker.parse_file.call_args.kwargs["path"] == file_2.absolute_path
+        worker.retire.assert_called_once()
+        assert manager._idle_parse_workers == []
+        assert manager._retiring_parse_workers == [worker]
+
+    @mock.patch.object(DagFileProcessorManager, "_get_logger_for_dag_file")
+    def test_parse_workers_do_not_run_callbacks(self, mock_get_logger, configure_testing_dag_bundle):
+        mock_get_logger.return_value = (MagicMock(), MagicMock())
+        with configure_testing_dag_bundle("/tmp"):
+            manager = DagFileProcessorManager(max_runs=1, use_parse_workers=True)
+        file_1 = DagFileInfo(bundle_name="testing", rel_path=Path("file_1.py"), bundle_path=TEST_DAGS_FOLDER)
+        manager._callback_to_execute[file_1] = [MagicMock()]
+        manager._idle_parse_workers = [MagicMock(spec=DagFileParseWorkerProcess)]
+
+        with mock.patch.object(DagFileProcessorProcess, "start") as mock_start:
+            manager._create_process(file_1)
+
+        mock_start.assert_called_once()
+        manager._idle_parse_workers[0].parse_file.assert_not_called()
+
+    def test_apply_bundle_changes(self, tmp_path):
+        bundle = LocalDagBundle(name="testing", path=tmp_path)
+        manager = DagFileProcessorManager(max_runs=1)
+        manager._dag_bundles = [bundle]
+        dag_1, dag_2, dag_3 = (
+            DagFileInfo(bundle_name="testing", rel_path=Path(name), bundle_path=tmp_path)
+            for name in ("dag_1.py", "dag_2.py", "subdir/dag_3.py")
+        )
+        known_files = {"testing": {dag_1, dag_2, dag_3}}
+        manager._file_queue = deque([dag_2])
+
+        changes = BundleChanges(
+            modified={Path("dag_1.py"), Path("README.md")}, deleted={Path("subdir")}, rescan=False
+        )
+        assert manager._apply_bundle_changes(bundle, changes, known_files)
+
+        assert known_files == {"testing": {dag_1, dag_2}}
+        assert manager._file_queue == deque([dag_1, dag_2])
+
+    def test_apply_bundle_changes_to_python_file_requires_listing(self, tmp_path):
+        bundle = LocalDagBundle(name="testing", path=tmp_path)
+        manager = DagFileProcessorManager(max_runs=1)
+        dag_1 = DagFileInfo(bundle_name="testing", rel_path=Path("dag_1.py"), bundle_path=tmp_path)
+        known_files = {"testing": {dag_1}}
+
+        # A module that was not a DAG file may now contain DAGs
+        tmp_path.joinpath("util.py").write_text("from airflow.sdk import DAG")
+        changes = BundleChanges(modified={Path("util.py")}, deleted={Path("dag_1.py")}, rescan=False)
+        assert not manager._apply_bundle_changes(bundle, changes, known_files)
+        assert known_files == {"testing": {dag_1}}
+
+    def test_apply_bundle_changes_queues_files_importing_modified_module(self, tmp_path):
+        bundle = LocalDagBundle(name="testing", path=tmp_path)
+        manager = DagFileProcessorManager(max_runs=1)
+        dag_1, dag_2 = (
+            DagFileInfo(bundle_name="testing", rel_path=Path(name), bundle_path=tmp_path)
+            for name in ("dag_1.py", "dag_2.py")
+        )
+        manager._file_stats[dag_1] = DagFileStat(bundle_imports=[Path("util.py")])
+        manager._file_stats[dag_2] = DagFileStat(bundle_imports=[Path("other_util.py")])
+        tmp_path.joinpath("util.py").write_text("NAME = 'dag_1'")
+
+        changes = BundleChanges(modified={Path("util.py")}, deleted=set(), rescan=False)
+        assert manager._apply_bundle_changes(bundle, changes, {"testing": {dag_1, dag_2}})
+        assert manager._file_queue == deque([dag_1])
+
     def test_handle_removed_files_when_processor_file_path_not_in_new_file_paths(self):
         """Ensure processors and file stats are removed when the file path is not in the new file paths"""
         manager = DagFileProcessorManager(max_runs=1)
@@ -312,6 +412,99 @@ class TestDagFileProcessorManager:
         )
         assert manager._file_queue == deque(ordered_files)
 
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "parse_cost"})
+    @mock.patch("airflow.utils.file.os.path.getmtime", new=mock_get_mtime)
+    def test_files_sorted_by_parse_cost(self):
+        """Test changed and new files come first, the fastest first, and then the others, the slowest first"""
+        fast, slow, medium, changed, new = _get_file_infos(
+            encode_mtime_in_filename(
+                [("fast.py", 1.0), ("slow.py", 1.0), ("medium.py", 1.0), ("changed.py", 5.0), ("new.py", 1.0)]
+            )
+        )
+        manager = DagFileProcessorManager(max_runs=1)
+        last_parsed = timezone.datetime(1970, 1, 1, 0, 0, 2)
+        for file, duration in ((fast, 1), (slow, 10), (medium, 5), (changed, 20)):
+            manager._file_stats[file] = DagFileStat(last_finish_time=last_parsed, last_duration=duration)
+
+        manager.prepare_file_queue(known_files={"any": {fast, slow, medium, changed, new}})
+        assert manager._file_queue == deque([new, changed, slow, medium, fast])
+
+    @pytest.mark.parametrize(
+        ("durations", "parallelism", "expected"),
+        [
+            pytest.param([], 2, 0, id="no-files"),
+            pytest.param([4, 1, 1], 2, 4, id="slowest-first"),
+            pytest.param([1, 1, 4], 2, 5, id="slowest-last"),
+            pytest.param([3, 3, 2, 2, 2], 1, 12, id="one-process"),
+        ],
+    )
+    def test_predict_parse_time(self, durations, parallelism, expected):
+        assert _predict_parse_time(durations, parallelism) == expected
+
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "alphabetical"})
+    @mock.patch("airflow.dag_processing.manager.Stats.gauge")
+    def test_parse_cycle_time_reported(self, mock_gauge):
+        files = _get_file_infos(["file_1.py", "file_2.py", "file_3.py"])
+        manager = DagFileProcessorManager(max_runs=1, parallelism=2)
+        manager._file_stats[files[0]] = DagFileStat(last_duration=4)
+        manager._file_stats[files[1]] = DagFileStat(last_duration=2)
+
+        manager.prepare_file_queue(known_files={"any": set(files)})
+        # The third file is predicted to take as long as the others on average
+        assert manager._parse_cycle.predicted_duration == 5
+        assert manager._parse_cycle.files == set(files)
+
+        # Files of the cycle are still being parsed
+        manager._file_queue.clear()
+        manager._processors[files[0]] = MagicMock()
+        manager._end_parse_cycle()
+        assert manager._parse_cycle is not None
+
+        manager._processors.clear()
+        manager._end_parse_cycle()
+        mock_gauge.assert_any_call("dag_processing.parse_cycle_time", mock.ANY)
+        mock_gauge.assert_any_call("dag_processing.predicted_parse_cycle_time", 5)
+        assert manager._parse_cycle is None
+
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "alphabetical"})
+    @mock.patch("airflow.dag_processing.manager.get_live_dag_processor_ids")
+    def test_files_sharded_across_processors(self, mock_live_ids):
+        files = _get_file_infos([f"file_{i}.py" for i in range(20)])
+        manager = DagFileProcessorManager(max_runs=1, shard_files=True)
+        manager.job_id = 1
+
+        mock_live_ids.return_value = {1}
+        manager._refresh_file_shards()
+        manager.prepare_file_queue(known_files={"testing": set(files)})
+        assert set(manager._file_queue) == set(files)
+        for file in files:
+            manager._file_stats[file] = DagFileStat(last_finish_time=timezone.utcnow())
+
+        # Another processor joins: files it takes over are not parsed here anymore
+        mock_live_ids.return_value = {1, 2}
+        manager._last_shard_refresh_time = 0
+        manager._refresh_file_shards()
+        owned = {file for file in files if manager._shard_ring.get_owner("testing", str(file.rel_path)) == 1}
+        assert 0 < len(owned) < len(files)
+        assert set(manager._file_queue) == owned
+        assert set(manager._file_stats) == owned
+
+        # It leaves: its files are taken over, as new files
+        mock_live_ids.return_value = {1}
+        manager._last_shard_refresh_time = 0
+        manager._refresh_file_shards()
+        manager.add_files_to_queue(known_files={"testing": set(files)})
+        assert set(manager._file_queue) == set(files)
+
+    @mock.patch("airflow.dag_processing.manager.get_live_dag_processor_ids")
+    def test_files_not_sharded_without_job(self, mock_live_ids):
+        manager = DagFileProcessorManager(max_runs=1, shard_files=True)
+
+        manager._refresh_file_shards()
+
+        mock_live_ids.assert_not_called()
+        assert manager._owns_file(_get_file_infos(["file_1.py"])[0])
+
     @conf_vars({("dag_processor", "file_parsing_sort_mode"): "modified_time"})
     @mock.patch("airflow.utils.file.os.path.getmtime", new=mock_get_mtime)
     def test_queued_files_exclude_missing_file(self):
@@ -351,6 +544,35 @@ class TestDagFileProcessorManager:
         )
         assert manager._file_queue == deque(ordered_files)
 
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "modified_time"})
+    def test_file_importing_modified_module_is_parsed_with_mtime_mode(self):
+        base_time = timezone.datetime(2020, 1, 5, 0, 0, 0)
+        dag_1, dag_2 = (
+            DagFileInfo(bundle_name="testing", rel_path=Path(name), bundle_path=TEST_DAGS_FOLDER)
+            for name in ("file_1.py", "file_2.py")
+        )
+        manager = DagFileProcessorManager(max_runs=3)
+        last_finish_time = base_time - timedelta(seconds=10)
+        manager._file_stats = {
+            dag_1: DagFileStat(1, 0, last_finish_time, 1.0, 1, 1, bundle_imports=[Path("util.py")]),
+            dag_2: DagFileStat(1, 0, last_finish_time, 1.0, 1, 1, bundle_imports=[Path("other_util.py")]),
+        }
+        mtimes = {
+            TEST_DAGS_FOLDER / "file_1.py": base_time - timedelta(minutes=5),
+            TEST_DAGS_FOLDER / "file_2.py": base_time - timedelta(minutes=5),
+            TEST_DAGS_FOLDER / "util.py": base_time - timedelta(seconds=5),
+            TEST_DAGS_FOLDER / "other_util.py": base_time - timedelta(minutes=5),
+        }
+
+        with (
+            time_machine.travel(base_time),
+            mock.patch.object(os.path, "getmtime", side_effect=lambda path: mtimes[path].timestamp()),
+        ):
+            manager.prepare_file_queue(known_files={"testing": {dag_1, dag_2}})
+
+        # Only the file whose imported module changed since it was parsed is parsed again
+        assert manager._file_queue == deque([dag_1])
+
     @conf_vars({("dag_processor", "file_parsing_sort_mode"): "modified_time"})
     @mock.patch("airflow.utils.file.os.path.getmtime")
     def test_recently_modified_file_is_parsed_with_mtime_mode(self, mock_getmtime):
@@ -442,6 +664,46 @@ class TestDagFileProcessorManager:
         assert len(parsing_request_after) == 1
         assert parsing_request_after[0].relative_fileloc == "file_x.py"
 
+    def test_housekeeping_backs_off_while_idle(self):
+        manager = DagFileProcessorManager(max_runs=1, housekeeping_max_interval=1.5)
+        query = MagicMock(return_value=[])
+
+        with mock.patch("airflow.dag_processing.manager.time.monotonic", return_value=100):
+            assert manager._run_housekeeping("query", query) == []
+            # Nothing was found, so the query is not run again on the next loop, unless forced
+            assert manager._run_housekeeping("query", query) is None
+            assert query.call_count == 1
+            manager._run_housekeeping("query", query, force=True)
+            assert query.call_count == 2
+
+        schedule = manager._housekeeping_schedules["query"]
+        assert schedule.interval == 1
+        schedule.reschedule(False, 100)
+        assert schedule.interval == 1.5
+
+        query.return_value = ["callback"]
+        with mock.patch("airflow.dag_processing.manager.time.monotonic", return_value=102):
+            assert manager._run_housekeeping("query", query) == ["callback"]
+            # Something was found, so there may be more on the next loop
+            assert manager._run_housekeeping("query", query) == ["callback"]
+
+    @mock.patch.object(DagFileProcessorManager, "deactivate_stale_dags")
+    def test_scan_stale_dags_only_after_files_parsed(self, mock_deactivate_stale_dags):
+        manager = DagFileProcessorManager(max_runs=1, parsing_cleanup_interval=-1)
+        file = _get_file_infos(["file_1.py"])[0]
+
+        manager._scan_stale_dags()
+        mock_deactivate_stale_dags.assert_not_called()
+
+        manager._file_stats[file] = DagFileStat(last_finish_time=timezone.datetime(2025, 1, 1))
+        manager._scan_stale_dags()
+        manager._scan_stale_dags()
+        mock_deactivate_stale_dags.assert_called_once()
+
+        manager._file_stats[file] = DagFileStat(last_finish_time=timezone.datetime(2025, 1, 2))
+        manager._scan_stale_dags()
+        assert mock_deactivate_stale_dags.call_count == 2
+
     def test_scan_stale_dags(self, testing_dag_bundle):
         """
         Ensure that DAGs are marked inactive when the file is parsed but the
@@ -518,6 +780,33 @@ class TestDagFileProcessorManager:
             # SerializedDagModel gives history about Dags
             assert serialized_dag_count == 1
 
+    @conf_vars(
+        {
+            (
+                "dag_processor",
+                "parsing_preload_modules",
+            ): "tests_common.test_utils.system_tests, nonexistent_module"
+        }
+    )
+    @mock.patch("airflow.dag_processing.manager.gc.freeze")
+    def test_preload_parsing_modules(self, mock_freeze, monkeypatch):
+        monkeypatch.delitem(sys.modules, "tests_common.test_utils.system_tests", raising=False)
+        manager = DagFileProcessorManager(max_runs=1)
+
+        manager._preload_parsing_modules()
+
+        # Modules that cannot be imported are skipped
+        assert "tests_common.test_utils.system_tests" in sys.modules
+        mock_freeze.assert_called_once()
+
+    @mock.patch("airflow.dag_processing.manager.gc.freeze")
+    def test_preload_parsing_modules_disabled(self, mock_freeze):
+        manager = DagFileProcessorManager(max_runs=1)
+
+        manager._preload_parsing_modules()
+
+        mock_freeze.assert_not_called()
+
     def test_kill_timed_out_processors_kill(self):
         manager = DagFileProcessorManager(max_runs=1, processor_timeout=5)
         processor, _ = self.mock_processor(start_time=16000)
@@ -560,6 +849,7 @@ class TestDagFileProcessorManager:
                     "file": "/opt/airflow/dags/test_dag.py",
                     "bundle_path": "/opt/airflow/dags",
                     "callback_requests": [],
+                    "source_fingerprint": None,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -592,6 +882,7 @@ class TestDagFileProcessorManager:
                             "type": "DagCallbackRequest",
                         }
                     ],
+                    "source_fingerprint": None,
                     "type": "DagFileParseRequest",
                 },
             ),
@@ -742,6 +1033,207 @@ class TestDagFileProcessorManager:
         # and the DAG from test_dag2.py is deactivated
         assert dagbag.get_latest_version_of_dag("test_dag2", session=session).get_is_active() is False
 
+    def test_process_parse_results_unchanged_sources(self, dag_maker, session):
+        with dag_maker("test_dag1"):
+            pass
+        dag_maker.sync_dagbag_to_db()
+        session.execute(update(DagModel).values(last_parsed_time=timezone.datetime(2025, 1, 1)))
+        result = DagFileParsingResult(
+            fileloc="test_dag1.py",
+            serialized_dags=[],
+            source_fingerprint="abc",
+            unchanged_dag_ids=["test_dag1"],
+        )
+
+        with mock.patch("airflow.dag_processing.manager.update_dag_parsing_results_in_db") as write:
+            stat = process_parse_results(
+                run_duration=1,
+                finish_time=timezone.utcnow(),
+                run_count=0,
+                bundle_name="dag_maker",
+                bundle_version=None,
+                parsing_result=result,
+                session=session,
+            )
+        write.assert_not_called()
+        assert stat.num_dags == 1
+        assert stat.source_fingerprint == "abc"
+        dag_model = session.scalar(select(DagModel).where(DagModel.dag_id == "test_dag1"))
+        assert dag_model.last_parsed_time > timezone.datetime(2025, 1, 1)
+
+        # A DAG deleted in the meantime is only restored by a full parse, so the fingerprint is dropped
+        session.execute(update(DagModel).values(is_stale=True))
+        stat = process_parse_results(
+            run_duration=1,
+            finish_time=timezone.utcnow(),
+            run_count=1,
+            bundle_name="dag_maker",
+            bundle_version=None,
+            parsing_result=result,
+            session=session,
+        )
+        assert stat.source_fingerprint is None
+
+    def test_process_parse_results_unchanged_sources_new_bundle_version(self, dag_maker, session):
+        """New DAG runs of an unchanged file use the bundle version the file was last parsed from."""
+        with dag_maker("test_dag1"):
+            pass
+        dag_maker.sync_dagbag_to_db()
+        session.execute(update(DagModel).values(bundle_version="v1"))
+        result = DagFileParsingResult(
+            fileloc="test_dag1.py",
+            serialized_dags=[],
+            source_fingerprint="abc",
+            unchanged_dag_ids=["test_dag1"],
+        )
+
+        stat = process_parse_results(
+            run_duration=1,
+            finish_time=timezone.utcnow(),
+            run_count=0,
+            bundle_name="dag_maker",
+            bundle_version="v2",
+            parsing_result=result,
+            session=session,
+        )
+
+        assert stat.source_fingerprint == "abc"
+        dag_model = session.scalar(select(DagModel).where(DagModel.dag_id == "test_dag1"))
+        assert dag_model.bundle_version == "v2"
+
+    def test_process_parse_results_batch(self):
+        def parsed_file(rel_path, bundle_version="v1", **kwargs):
+            return ParsedFile(
+                file=DagFileInfo(
+                    bundle_name="testing", rel_path=Path(rel_path), bundle_path=TEST_DAGS_FOLDER
+                ),
+                run_duration=1,
+                finish_time=timezone.utcnow(),
+                run_count=0,
+                bundle_version=bundle_version,
+                parsing_result=DagFileParsingResult(fileloc=rel_path, **kwargs),
+            )
+
+        dag_1, dag_2, dag_3 = (MagicMock(spec=LazyDeserializedDAG, dag_id=f"dag_{i}") for i in range(1, 4))
+        parsed_files = [
+            parsed_file("a.py", serialized_dags=[dag_1], source_fingerprint="a"),
+            parsed_file("b.py", serialized_dags=[dag_2], import_errors={"b.py": "error"}),
+            parsed_file("c.py", bundle_version="v2", serialized_dags=[dag_3]),
+        ]
+
+        session = MagicMock()
+        with mock.patch("airflow.dag_processing.manager.update_dag_parsing_results_in_db") as write:
+            stats = process_parse_results_batch(parsed_files, session=session)
+
+        # One write per bundle version, whatever the number of files
+        assert write.call_args_list == [
+            mock.call(
+                bundle_name="testing",
+                bundle_version="v1",
+                dags=[dag_1, dag_2],
+                import_errors={("testing", "b.py"): "error"},
+                warnings=set(),
+                session=session,
+            ),
+            mock.call(
+                bundle_name="testing",
+                bundle_version="v2",
+                dags=[dag_3],
+                import_errors={},
+                warnings=set(),
+                session=session,
+            ),
+        ]
+        stat_a, stat_b, stat_c = (stats[parsed.file] for parsed in parsed_files)
+        assert (stat_a.num_dags, stat_a.import_errors, stat_a.source_fingerprint) == (1, 0, "a")
+        assert (stat_b.num_dags, stat_b.import_errors, stat_b.run_count) == (1, 1, 1)
+        assert stat_c.num_dags == 1
+
+    @mock.patch("airflow.dag_processing.manager.Stats")
+    def test_parse_profile(self, mock_stats, tmp_path, configure_testing_dag_bundle):
+        profile = DagFileParseProfile(
+            cpu_time=0.5, peak_rss=2048, top_imports={"pandas": 0.25}, dag_num=1, task_num=3
+        )
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("team/dag_1.py"))
+        parsed = ParsedFile(
+            file=file,
+            run_duration=1,
+            finish_time=timezone.utcnow(),
+            run_count=0,
+            bundle_version=None,
+            parsing_result=DagFileParsingResult(fileloc="team/dag_1.py", serialized_dags=[], profile=profile),
+        )
+        with configure_testing_dag_bundle(tmp_path):
+            manager = DagFileProcessorManager(max_runs=1)
+        manager._bundle_versions["testing"] = None
+        manager._processors[file] = MagicMock(
+            spec=DagFileProcessorProcess, is_ready=True, start_time=0, parsing_result=parsed.parsing_result
+        )
+
+        with mock.patch("airflow.dag_processing.manager.update_dag_parsing_results_in_db"):
+            manager._collect_results(session=MagicMock())
+
+        stat = manager._file_stats[file]
+        assert (stat.num_tasks, stat.last_cpu_time, stat.last_peak_rss) == (3, 0.5, 2048)
+        assert stat.last_top_imports == {"pandas": 0.25}
+        tags = {"file_name": "dag_1", "bundle_name": "testing"}
+        mock_stats.timing.assert_any_call("dag_processing.last_cpu_time", 500, tags=tags)
+        mock_stats.gauge.assert_any_call("dag_processing.last_peak_rss", 2048, tags=tags)
+
+    @mock.patch("airflow.dag_processing.manager.process_parse_results_batch")
+    def test_collect_results_waits_for_batch(
+        self, mock_process_batch, tmp_path, configure_testing_dag_bundle
+    ):
+        with configure_testing_dag_bundle(tmp_path):
+            manager = DagFileProcessorManager(
+                max_runs=1, parse_results_batch_size=2, parse_results_batch_max_wait=60
+            )
+        mock_process_batch.side_effect = lambda parsed_files, session: {
+            parsed.file: DagFileStat(run_count=1) for parsed in parsed_files
+        }
+        files = [DagFileInfo(bundle_name="testing", rel_path=Path(f"dag_{i}.py")) for i in range(2)]
+        manager._bundle_versions["testing"] = None
+
+        def finish(file):
+            manager._processors[file] = MagicMock(spec=DagFileProcessorProcess, is_ready=True, start_time=0)
+            manager._collect_results()
+
+        finish(files[0])
+        mock_process_batch.assert_not_called()
+        # The file is not parsed again until its results are written
+        manager._file_queue.append(files[0])
+        manager._start_new_processes()
+        assert manager._processors == {}
+
+        finish(files[1])
+        mock_process_batch.assert_called_once()
+        assert [parsed.file for parsed in mock_process_batch.call_args.args[0]] == files
+        assert manager._parsed_files == {}
+        assert all(manager._file_stats[file].run_count == 1 for file in files)
+
+    @mock.patch("airflow.dag_processing.manager.process_parse_results_batch")
+    def test_terminate_writes_pending_parse_results(
+        self, mock_process_batch, tmp_path, configure_testing_dag_bundle
+    ):
+        with configure_testing_dag_bundle(tmp_path):
+            manager = DagFileProcessorManager(
+                max_runs=1, parse_results_batch_size=2, parse_results_batch_max_wait=60
+            )
+        mock_process_batch.side_effect = lambda parsed_files, session: {
+            parsed.file: DagFileStat(run_count=1) for parsed in parsed_files
+        }
+        file = DagFileInfo(bundle_name="testing", rel_path=Path("dag_1.py"))
+        manager._bundle_versions["testing"] = None
+        manager._processors[file] = MagicMock(spec=DagFileProcessorProcess, is_ready=True, start_time=0)
+        manager._collect_results()
+        mock_process_batch.assert_not_called()
+
+        manager.terminate()
+
+        assert [parsed.file for parsed in mock_process_batch.call_args.args[0]] == [file]
+        assert manager._parsed_files == {}
+        assert manager._file_stats[file].run_count == 1
+
     @conf_vars({("core", "load_examples"): "False"})
     def test_fetch_callbacks_from_database(self, configure_testing_dag_bundle):
         dag_filepath = TEST_DAG_FOLDER / "test_on_failure_callback_dag.py"
@@ -892,6 +1384,7 @@ class TestDagFileProcessorManager:
                     path=Path(dag2_path.bundle_path, dag2_path.rel_path),
                     bundle_path=dag2_path.bundle_path,
                     callbacks=[dag2_req1],
+                    source_fingerprint=None,
                     selector=mock.ANY,
                     logger=mock_logger,
                     logger_filehandle=mock_filehandle,
@@ -902,6 +1395,7 @@ class TestDagFileProcessorManager:
                     path=Path(dag1_path.bundle_path, dag1_path.rel_path),
                     bundle_path=dag1_path.bundle_path,
                     callbacks=[dag1_req1, dag1_req2],
+                    source_fingerprint=None,
                     selector=mock.ANY,
                     logger=mock_logger,
                     logger_filehandle=mock_filehandle,
@@ -47,6 +47,7 @@ from airflow.callbacks.callback_requests import (
 )
 from airflow.dag_processing.processor import (
     DagFileParseRequest,
+    DagFileParseWorkerProcess,
     DagFileParsingResult,
     DagFileProcessorProcess,
     _execute_dag_callbacks,
@@ -364,6 +365,52 @@ class TestDagFileProcessor:
         assert result.import_errors == {}
         assert result.serialized_dags[0].dag_id == "dag_name"
 
+    def test_parse_worker_parses_files_with_current_bundle_modules(
+        self, tmp_path: pathlib.Path, inprocess_client
+    ):
+        util_path = tmp_path.joinpath("util.py")
+        util_path.write_text("NAME = 'first'")
+        dag_path = tmp_path.joinpath("dag1.py")
+        dag_path.write_text(
+            "from util import NAME\nfrom airflow.sdk import DAG\n\nwith DAG(NAME):\n    pass\n"
+        )
+
+        proc = DagFileParseWorkerProcess.start(
+            id=1,
+            path=dag_path,
+            bundle_path=tmp_path,
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "first"
+
+        util_path.write_text("NAME = 'second'")
+        first_filehandle = proc.logger_filehandle
+        proc.parse_file(
+            path=dag_path,
+            bundle_path=tmp_path,
+            source_fingerprint=None,
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+        )
+        first_filehandle.close.assert_called_once()
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "second"
+        assert not proc.has_exited
+        assert proc.should_recycle(max_files=2, max_memory_mb=0)
+
+        proc.retire()
+        while not proc.has_exited:
+            proc._service_subprocess(0.1)
+        assert proc._exit_code == 0
+
     def test__pre_import_airflow_modules_when_disabled(self):
         logger = MagicMock(spec=FilteringBoundLogger)
         with (
@@ -530,6 +577,73 @@ def test_parse_file_with_dag_callbacks(spy_agency):
     assert called is True
 
 
+class TestParseFileSourceFingerprint:
+    @pytest.fixture
+    def dag_path(self, tmp_path, monkeypatch):
+        tmp_path.joinpath("fingerprint_util.py").write_text("NAME = 'dag_name'")
+        dag_path = tmp_path.joinpath("dag1.py")
+        dag_code = """
+        from fingerprint_util import NAME
+
+        from airflow.sdk import DAG
+
+        with DAG(NAME):
+            pass
+        """
+        dag_path.write_text(textwrap.dedent(dag_code))
+        monkeypatch.syspath_prepend(tmp_path)
+        # Each file is parsed in a new process, so the util module must be imported again for every parse
+        monkeypatch.delitem(sys.modules, "fingerprint_util", raising=False)
+        yield dag_path
+        sys.modules.pop("fingerprint_util", None)
+
+    @staticmethod
+    def _parse(dag_path, source_fingerprint=None):
+        sys.modules.pop("fingerprint_util", None)
+        return _parse_file(
+            DagFileParseRequest(
+                file=str(dag_path), bundle_path=dag_path.parent, source_fingerprint=source_fingerprint
+            ),
+            log=structlog.get_logger(),
+        )
+
+    def test_disabled_by_default(self, dag_path):
+        result = self._parse(dag_path)
+        assert result.source_fingerprint is None
+        assert result.serialized_dags[0].dag_id == "dag_name"
+
+    def test_records_bundle_imports(self, dag_path):
+        result = self._parse(dag_path)
+        assert result.bundle_imports == [pathlib.Path("fingerprint_util.py")]
+
+    @conf_vars({("core", "dagbag_profile_top_imports"): "10"})
+    def test_records_parse_profile(self, dag_path):
+        profile = self._parse(dag_path).profile
+        assert (profile.dag_num, profile.task_num) == (1, 0)
+        assert "fingerprint_util" in profile.top_imports
+        assert profile.cpu_time > 0
+        assert profile.peak_rss > 0
+
+    @conf_vars({("dag_processor", "skip_unchanged_dag_files"): "True"})
+    def test_skips_serialization_of_unchanged_sources(self, dag_path):
+        first = self._parse(dag_path)
+        assert first.source_fingerprint is not None
+        assert first.unchanged_dag_ids is None
+        assert first.serialized_dags[0].dag_id == "dag_name"
+
+        unchanged = self._parse(dag_path, first.source_fingerprint)
+        assert unchanged.source_fingerprint == first.source_fingerprint
+        assert unchanged.serialized_dags == []
+        assert unchanged.unchanged_dag_ids == ["dag_name"]
+
+        # A change in an imported module of the bundle changes the fingerprint
+        dag_path.parent.joinpath("fingerprint_util.py").write_text("NAME = 'other_name'")
+        changed = self._parse(dag_path, first.source_fingerprint)
+        assert changed.source_fingerprint != first.source_fingerprint
+        assert changed.unchanged_dag_ids is None
+        assert changed.serialized_dags[0].dag_id == "other_name"
+
+
 def test_parse_file_with_task_callbacks(spy_agency):
     called = False
 
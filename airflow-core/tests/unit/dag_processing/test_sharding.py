@@ -0,0 +1,80 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+from collections import Counter
+
+import pytest
+
+from airflow._shared.timezones import timezone
+from airflow.dag_processing.sharding import FileShardRing, get_live_dag_processor_ids
+from airflow.jobs.job import Job
+from airflow.utils.state import State
+
+from tests_common.test_utils.db import clear_db_jobs
+
+FILES = [f"team_{i % 10}/dag_{i}.py" for i in range(3000)]
+
+
+class TestFileShardRing:
+    def test_files_shared_evenly(self):
+        ring = FileShardRing([1, 2, 3])
+
+        owners = Counter(ring.get_owner("bundle", path) for path in FILES)
+
+        assert set(owners) == {1, 2, 3}
+        assert all(count > len(FILES) / 3 * 0.75 for count in owners.values())
+
+    def test_same_owner_on_every_processor(self):
+        assert [FileShardRing([1, 2, 3]).get_owner("bundle", path) for path in FILES] == [
+            FileShardRing([3, 2, 1]).get_owner("bundle", path) for path in FILES
+        ]
+
+    def test_only_files_of_joining_processor_move(self):
+        before = FileShardRing([1, 2, 3])
+        after = FileShardRing([1, 2, 3, 4])
+
+        moved = [
+            path for path in FILES if before.get_owner("bundle", path) != after.get_owner("bundle", path)
+        ]
+
+        assert all(after.get_owner("bundle", path) == 4 for path in moved)
+        assert len(moved) < len(FILES) / 4 * 1.25
+
+    def test_no_member(self):
+        assert FileShardRing([]).get_owner("bundle", "dag.py") is None
+
+
+@pytest.mark.db_test
+class TestGetLiveDagProcessorIds:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_jobs()
+        yield
+        clear_db_jobs()
+
+    def test_get_live_dag_processor_ids(self, session):
+        live = Job(job_type="DagProcessorJob", state=State.RUNNING)
+        late = Job(job_type="DagProcessorJob", state=State.RUNNING)
+        late.latest_heartbeat = timezone.utcnow() - datetime.timedelta(hours=1)
+        stopped = Job(job_type="DagProcessorJob", state=State.SUCCESS)
+        scheduler = Job(job_type="SchedulerJob", state=State.RUNNING)
+        session.add_all([live, late, stopped, scheduler])
+        session.flush()
+
+        assert get_live_dag_processor_ids(session=session) == {live.id}
@@ -49,7 +49,7 @@ from airflow.executors.executor_constants import MOCK_EXECUTOR
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.executors.executor_utils import ExecutorName
 from airflow.jobs.job import Job, run_job
-from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+from airflow.jobs.scheduler_job_runner import ConcurrencyMap, SchedulerJobRunner
 from airflow.models import Deadline
 from airflow.models.asset import (
     AssetActive,
@@ -645,6 +645,29 @@ class TestSchedulerJob:
             for executor in scheduler_job.executors:
                 executor.get_event_buffer.assert_called_once()
 
+    def test_loop_profiling(self, mock_executors, configure_testing_dag_bundle, tmp_path):
+        output_file = tmp_path / "profile.json"
+        with (
+            configure_testing_dag_bundle(os.devnull),
+            conf_vars(
+                {
+                    ("scheduler", "loop_profiling"): "True",
+                    ("scheduler", "loop_profiling_output_file"): str(output_file),
+                }
+            ),
+        ):
+            scheduler_job = Job()
+            self.job_runner = SchedulerJobRunner(job=scheduler_job, num_runs=1)
+            self.job_runner._execute()
+
+        (profile,) = self.job_runner._loop_profiler.profiles
+        phases = [phase.name for phase in profile.phases]
+        assert phases[:3] == ["create_dagruns", "start_queued_dagruns", "schedule_dagruns"]
+        assert {"critical_section", "executor_heartbeat", "executor_events"} <= set(phases)
+        assert sum(phase.statements for phase in profile.phases) > 0
+        # The profiles are written when the scheduler stops
+        assert output_file.exists()
+
     @patch("traceback.extract_stack")
     def test_executor_debug_dump(self, patch_traceback_extract_stack, mock_executors):
         scheduler_job = Job()
@@ -729,6 +752,94 @@ class TestSchedulerJob:
         assert tis[3].key in res_keys
         session.rollback()
 
+    @conf_vars({("scheduler", "critical_section_query_mode"): "windowed"})
+    def test_find_executable_task_instances_pool_windowed(self, dag_maker, session):
+        dag_id = "SchedulerJobTest.test_find_executable_task_instances_pool_windowed"
+        with dag_maker(dag_id=dag_id, max_active_tasks=16, session=session):
+            EmptyOperator(task_id="dummy", pool="a", priority_weight=2)
+            EmptyOperator(task_id="dummydummy", pool="b", priority_weight=1)
+            EmptyOperator(task_id="big", pool="b", pool_slots=100, priority_weight=3)
+
+        scheduler_job = Job()
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        for dr in (dr1, dr2):
+            for ti in dr.get_task_instances(session=session):
+                ti.state = State.SCHEDULED
+                session.merge(ti)
+        session.add(Pool(pool="a", slots=1, description="haha", include_deferred=False))
+        session.add(Pool(pool="b", slots=100, description="haha", include_deferred=False))
+        session.flush()
+
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        # Pool "a" only has room for the first run's TI. In pool "b", the first "big" TI takes all slots.
+        assert sorted((ti.run_id, ti.task_id) for ti in res) == [
+            (dr1.run_id, "big"),
+            (dr1.run_id, "dummy"),
+        ]
+        session.rollback()
+
+    @pytest.mark.parametrize(
+        "query_mode, expected_query_count",
+        [
+            pytest.param("iterative", 2, id="iterative"),
+            pytest.param("windowed", 1, id="windowed"),
+        ],
+    )
+    def test_find_executable_task_instances_starved_dag_run(
+        self, query_mode, expected_query_count, dag_maker, session
+    ):
+        """A DAG run at its max_active_tasks should not hide lower priority TIs from other DAGs."""
+        with dag_maker(dag_id="starved_dag", max_active_tasks=1, session=session):
+            for i in range(4):
+                EmptyOperator(task_id=f"high_{i}", priority_weight=10)
+        dr_starved = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        with dag_maker(dag_id="other_dag", session=session):
+            EmptyOperator(task_id="low", priority_weight=1)
+        dr_other = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+
+        tis = dr_starved.get_task_instances(session=session)
+        tis[0].state = State.RUNNING
+        for ti in [*tis[1:], *dr_other.get_task_instances(session=session)]:
+            ti.state = State.SCHEDULED
+        for ti in [*tis, *dr_other.get_task_instances(session=session)]:
+            session.merge(ti)
+        session.flush()
+
+        with conf_vars({("scheduler", "critical_section_query_mode"): query_mode}):
+            self.job_runner = SchedulerJobRunner(job=Job())
+        with mock.patch(
+            "airflow.jobs.scheduler_job_runner.with_row_locks", side_effect=lambda query, **_: query
+        ) as locked_query:
+            res = self.job_runner._executable_task_instances_to_queued(max_tis=3, session=session)
+
+        assert [(ti.dag_id, ti.task_id) for ti in res] == [("other_dag", "low")]
+        assert locked_query.call_count == expected_query_count
+        session.rollback()
+
+    @pytest.mark.parametrize("query_mode", ["iterative", "windowed"])
+    def test_find_executable_task_instances_starved_task_in_dag_run(self, query_mode, dag_maker, session):
+        """A TI blocked by its task concurrency should not keep the room of its DAG run from other TIs."""
+        with dag_maker(dag_id="starved_task", max_active_tasks=1, session=session):
+            EmptyOperator(task_id="a", priority_weight=10, max_active_tis_per_dag=1)
+            EmptyOperator(task_id="b", priority_weight=1)
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+
+        dr1.get_task_instance("a", session=session).state = State.RUNNING
+        for ti in dr2.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        with conf_vars({("scheduler", "critical_section_query_mode"): query_mode}):
+            self.job_runner = SchedulerJobRunner(job=Job())
+        res = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        assert [(ti.run_id, ti.task_id) for ti in res] == [(dr2.run_id, "b")]
+        session.rollback()
+
     @pytest.mark.parametrize(
         "state, total_executed_ti",
         [
@@ -1201,6 +1312,141 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "300"})
+    def test_find_executable_task_instances_incremental_concurrency_map(self, dag_maker, session):
+        dag_id = "check_MAT_incremental_dag"
+        with dag_maker(dag_id=dag_id, max_active_tasks=2, session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+            EmptyOperator(task_id="task_3")
+
+        executor = MockExecutor(do_update=False)
+        scheduler_job = Job(executor=executor)
+        self.job_runner = SchedulerJobRunner(job=scheduler_job)
+        assert self.job_runner._concurrency_map is not None
+
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED, run_id="run_1", session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.SCHEDULED
+            session.merge(ti)
+        session.flush()
+
+        with mock.patch.object(
+            ConcurrencyMap, "load", autospec=True, side_effect=ConcurrencyMap.load
+        ) as load:
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert len(queued_tis) == 2
+            session.commit()
+
+            # The counts are kept in memory, so nothing more can be queued without reloading them.
+            assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+            assert load.call_count == 1
+
+            # A finished task reported by the executor frees up a slot in the DAG run.
+            finished = queued_tis[0]
+            session.execute(
+                update(TaskInstance).where(TaskInstance.id == finished.id).values(state=State.SUCCESS)
+            )
+            executor.event_buffer[finished.key] = State.SUCCESS, None
+            self.job_runner._process_executor_events(executor=executor, session=session)
+            session.commit()
+
+            queued_tis = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+            assert [ti.task_id for ti in queued_tis] == ["task_3"]
+            assert load.call_count == 1
+
+    def test_concurrency_map_add_remove(self):
+        concurrency_map = ConcurrencyMap(incremental=True)
+        concurrency_map.add("dag", "task", "run", -1)
+        concurrency_map.add("dag", "task", "run", -1)
+        concurrency_map.add("dag", "task", "run", 0)
+        assert concurrency_map.dag_run_active_tasks_map["dag", "run"] == 2
+        assert concurrency_map.task_concurrency_map["dag", "task"] == 2
+        assert concurrency_map.task_dagrun_concurrency_map["dag", "run", "task"] == 2
+
+        concurrency_map.remove("dag", "task", "run", -1)
+        concurrency_map.remove("dag", "task", "run", -1)
+        concurrency_map.remove("dag", "other_task", "run", -1)
+        assert concurrency_map.dag_run_active_tasks_map["dag", "run"] == 1
+
+        concurrency_map.remove("dag", "task", "run", 0)
+        assert not concurrency_map.dag_run_active_tasks_map
+        assert not concurrency_map.task_concurrency_map
+        assert not concurrency_map.task_dagrun_concurrency_map
+
+    def test_concurrency_map_rollback(self):
+        concurrency_map = ConcurrencyMap(incremental=True)
+        concurrency_map.add("dag", "task", "run", 0)
+        concurrency_map.commit()
+        concurrency_map.add("dag", "task", "run", 1)
+        concurrency_map.add("dag", "other_task", "run", -1)
+
+        concurrency_map.rollback()
+
+        assert dict(concurrency_map.dag_run_active_tasks_map) == {("dag", "run"): 1}
+        assert dict(concurrency_map.task_concurrency_map) == {("dag", "task"): 1}
+        assert dict(concurrency_map.task_dagrun_concurrency_map) == {("dag", "run", "task"): 1}
+        # A task instance rolled back can be counted again
+        concurrency_map.add("dag", "task", "run", 1)
+        assert concurrency_map.task_concurrency_map["dag", "task"] == 2
+
+    def test_concurrency_map_remove_loaded(self, dag_maker, session):
+        with dag_maker(dag_id="concurrency_map_remove_loaded", session=session):
+            EmptyOperator(task_id="task_1")
+            EmptyOperator(task_id="task_2")
+        dr = dag_maker.create_dagrun(run_id="run", session=session)
+        for ti in dr.get_task_instances(session=session):
+            ti.state = State.RUNNING
+        session.flush()
+        concurrency_map = ConcurrencyMap(incremental=True)
+        concurrency_map.load(session=session)
+        dag_id = "concurrency_map_remove_loaded"
+        assert concurrency_map.dag_run_active_tasks_map[dag_id, "run"] == 2
+
+        # Finished before the load, so it was not counted by it
+        finished_before_load = concurrency_map._loaded_at_date - datetime.timedelta(seconds=1)
+        concurrency_map.remove(dag_id, "task_1", "run", -1, end_date=finished_before_load)
+        assert concurrency_map.dag_run_active_tasks_map[dag_id, "run"] == 2
+
+        concurrency_map.remove(dag_id, "task_1", "run", -1, end_date=timezone.utcnow())
+        concurrency_map.remove(dag_id, "task_1", "run", -1)
+        assert concurrency_map.dag_run_active_tasks_map[dag_id, "run"] == 1
+        assert (dag_id, "task_1") not in concurrency_map.task_concurrency_map
+        assert concurrency_map.task_concurrency_map[dag_id, "task_2"] == 1
+
+    @pytest.mark.parametrize("lock_not_available", [True, False])
+    @conf_vars({("scheduler", "concurrency_map_reconcile_interval"): "300"})
+    def test_do_scheduling_rolls_back_concurrency_map(self, lock_not_available, session):
+        from sqlalchemy.exc import OperationalError
+
+        self.job_runner = SchedulerJobRunner(job=Job(executor=MockExecutor(do_update=False)))
+        concurrency_map = self.job_runner._concurrency_map
+        concurrency_map.add("dag", "task", "run", 0)
+        concurrency_map.commit()
+
+        def critical_section(session):
+            concurrency_map.add("dag", "task", "run", 1)
+            raise OperationalError("SELECT", {}, RuntimeError("55P03" if lock_not_available else "other"))
+
+        with mock.patch.object(
+            self.job_runner, "_critical_section_enqueue_task_instances", side_effect=critical_section
+        ):
+            if lock_not_available:
+                assert self.job_runner._do_scheduling(session) == 0
+            else:
+                with pytest.raises(OperationalError):
+                    self.job_runner._do_scheduling(session)
+
+        assert dict(concurrency_map.task_concurrency_map) == {("dag", "task"): 1}
+
+    def test_concurrency_map_needs_reload(self):
+        concurrency_map = ConcurrencyMap(incremental=True)
+        assert concurrency_map.needs_reload(30)
+        with mock.patch("airflow.jobs.scheduler_job_runner.time.monotonic", return_value=100.0):
+            concurrency_map.loaded_at = 90.0
+            assert not concurrency_map.needs_reload(30)
+            assert concurrency_map.needs_reload(10)
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = "SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag"
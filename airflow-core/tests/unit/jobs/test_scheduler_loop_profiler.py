@@ -0,0 +1,119 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from airflow.jobs.scheduler_loop_profiler import (
+    LoopProfile,
+    PhaseProfile,
+    SchedulerLoopProfiler,
+    read_profiles,
+    summarize,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def profiler(engine):
+    profiler = SchedulerLoopProfiler(buffer_size=2)
+    profiler.install(engine)
+    yield profiler
+    profiler.uninstall()
+
+
+class TestSchedulerLoopProfiler:
+    def test_records_phases(self, profiler, engine):
+        with profiler.loop(1):
+            with profiler.phase("insert"), engine.begin() as conn:
+                conn.execute(text("INSERT INTO t VALUES (1), (2), (3)"))
+            with profiler.phase("select"), engine.connect() as conn:
+                conn.execute(text("SELECT * FROM t")).all()
+                conn.execute(text("SELECT * FROM t")).all()
+            # Statements outside of a phase are not counted
+            with engine.connect() as conn:
+                conn.execute(text("SELECT * FROM t")).all()
+
+        (profile,) = profiler.profiles
+        assert profile.loop_count == 1
+        assert [(p.name, p.statements) for p in profile.phases] == [("insert", 1), ("select", 2)]
+        assert profile.phases[0].rows == 3
+        assert profile.duration >= sum(p.duration for p in profile.phases)
+
+    def test_nested_and_out_of_loop_phases_are_ignored(self, profiler):
+        with profiler.phase("outside"):
+            pass
+        with profiler.loop(1), profiler.phase("outer"), profiler.phase("inner"):
+            pass
+        assert [p.name for p in profiler.profiles[0].phases] == ["outer"]
+
+    def test_ring_buffer(self, profiler):
+        for loop_count in range(1, 4):
+            with profiler.loop(loop_count):
+                pass
+        assert [p.loop_count for p in profiler.profiles] == [2, 3]
+
+    @mock.patch("airflow.jobs.scheduler_loop_profiler.Stats")
+    def test_metrics(self, mock_stats, profiler):
+        with profiler.loop(1), profiler.phase("critical_section"):
+            pass
+        mock_stats.timing.assert_any_call("scheduler.loop_phase_duration.critical_section", mock.ANY)
+        mock_stats.timing.assert_any_call(
+            "scheduler.loop_phase_duration", mock.ANY, tags={"phase": "critical_section"}
+        )
+
+    def test_write_every_buffer_size_loops(self, tmp_path):
+        output_file = tmp_path / "profile.json"
+        profiler = SchedulerLoopProfiler(buffer_size=2, output_file=str(output_file))
+        with profiler.loop(1), profiler.phase("a"):
+            pass
+        assert not output_file.exists()
+        with profiler.loop(2), profiler.phase("a"):
+            pass
+        assert read_profiles(output_file) == list(profiler.profiles)
+
+
+def test_summarize():
+    profiles = [
+        LoopProfile(1, 0.0, 0.5, [PhaseProfile("a", 0.1, 2, 10), PhaseProfile("b", 0.3, 1, 0)]),
+        LoopProfile(2, 1.0, 0.4, [PhaseProfile("a", 0.3, 4, 20)]),
+    ]
+    summary = summarize(profiles)
+    assert [row["phase"] for row in summary] == ["loop", "a", "b"]
+    assert summary[1] == {
+        "phase": "a",
+        "count": 2,
+        "mean_ms": 200.0,
+        "p95_ms": 300.0,
+        "max_ms": 300.0,
+        "mean_statements": 3.0,
+        "mean_rows": 15.0,
+    }
+    assert summary[0]["mean_statements"] == 3.5
+    assert summarize([]) == []
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import builtins
 import contextlib
 import inspect
 import logging
@@ -31,15 +32,18 @@ from unittest import mock
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from airflow import settings
 from airflow.models.dag import DAG, DagModel
-from airflow.models.dagbag import DagBag, _capture_with_reraise
+from airflow.models.dag_version import DagVersion
+from airflow.models.dagbag import DagBag, DBDagBag, _capture_with_reraise
 from airflow.models.dagwarning import DagWarning, DagWarningType
 from airflow.models.serialized_dag import SerializedDagModel
+from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk import BaseOperator
 from airflow.utils.session import create_session
+from airflow.utils.state import DagRunState
 
 from tests_common.pytest_plugin import AIRFLOW_ROOT_PATH
 from tests_common.test_utils import db
@@ -159,6 +163,58 @@ class TestDagBag:
         assert len(dagbag.dagbag_stats) == 1
         assert dagbag.dagbag_stats[0].file == f"/{path.name}"
 
+    def test_profile_file(self, tmp_path, monkeypatch):
+        """The slowest modules imported by a file are reported, without the time of their own imports."""
+        monkeypatch.syspath_prepend(os.fspath(tmp_path))
+        (tmp_path / "profiled_slow_helper.py").write_text("import time\ntime.sleep(0.2)\n")
+        (tmp_path / "profiled_helper.py").write_text(
+            "import time\nimport profiled_slow_helper\ntime.sleep(0.1)\n"
+        )
+        path = tmp_path / "dags" / "testfile.py"
+        path.parent.mkdir()
+        path.write_text("import profiled_helper\nimport profiled_fast_helper\n")
+        (tmp_path / "profiled_fast_helper.py").write_text("")
+        original_import = builtins.__import__
+
+        with conf_vars({("core", "dagbag_profile_top_imports"): "2"}):
+            dagbag = DagBag(
+                dag_folder=os.fspath(path), include_examples=False, safe_mode=False, profile_parsing=True
+            )
+
+        stat = dagbag.dagbag_stats[0]
+        assert list(stat.top_imports) == ["profiled_slow_helper", "profiled_helper"]
+        assert stat.top_imports["profiled_slow_helper"] >= 0.2
+        assert 0.1 <= stat.top_imports["profiled_helper"] < 0.2
+        assert stat.cpu_time >= 0
+        assert stat.peak_rss > 0
+        assert builtins.__import__ is original_import
+
+    @conf_vars({("core", "dagbag_profile_top_imports"): "0"})
+    def test_profile_file_without_import_times(self, tmp_path):
+        path = tmp_path / "testfile.py"
+        path.write_text("import json\n")
+
+        dagbag = DagBag(
+            dag_folder=os.fspath(path), include_examples=False, safe_mode=False, profile_parsing=True
+        )
+
+        assert dagbag.dagbag_stats[0].top_imports == {}
+
+    @conf_vars({("core", "dagbag_profile_top_imports"): "2"})
+    def test_profile_parsing_disabled_by_default(self, tmp_path):
+        path = tmp_path / "testfile.py"
+        path.write_text("import json\n")
+
+        with (
+            patch("airflow.models.dagbag._reset_peak_rss") as reset_peak_rss,
+            patch("airflow.models.dagbag._time_imports") as time_imports,
+        ):
+            dagbag = DagBag(dag_folder=os.fspath(path), include_examples=False, safe_mode=False)
+
+        reset_peak_rss.assert_not_called()
+        time_imports.assert_not_called()
+        assert dagbag.dagbag_stats[0].top_imports == {}
+
     def test_process_file_that_contains_multi_bytes_char(self, tmp_path):
         """
         test that we're able to parse file that contains multi-byte char
@@ -874,6 +930,184 @@ with airflow.DAG(
             assert "SIGSEGV signal handler registration failed. Not in the main thread" in caplog.text
 
 
+class TestDBDagBagCache:
+    @staticmethod
+    def _serdag(version_id: str, payload_size: int = 10):
+        serdag = mock.MagicMock(spec=SerializedDagModel)
+        serdag.dag_version_id = version_id
+        serdag.stored_size = payload_size
+        serdag.dag = mock.Mock(name=f"dag-{version_id}")
+        return serdag
+
+    def test_unbounded_by_default(self):
+        dag_bag = DBDagBag()
+        for i in range(50):
+            dag_bag._read_dag(self._serdag(str(i)))
+        assert len(dag_bag._dags) == 50
+
+    def test_evicts_least_recently_used_by_count(self):
+        dag_bag = DBDagBag(cache_size=2)
+        serdags = [self._serdag(str(i)) for i in range(3)]
+        dag_bag._read_dag(serdags[0])
+        dag_bag._read_dag(serdags[1])
+        # Touch "0" so that "1" becomes the least recently used entry.
+        assert dag_bag._get_dag("0", session=mock.MagicMock()) is serdags[0].dag
+        dag_bag._read_dag(serdags[2])
+        assert list(dag_bag._dags) == ["0", "2"]
+
+    def test_evicts_by_bytes(self):
+        dag_bag = DBDagBag(cache_max_bytes=250)
+        for i in range(3):
+            dag_bag._read_dag(self._serdag(str(i), payload_size=100))
+        assert list(dag_bag._dags) == ["1", "2"]
+        assert dag_bag._total_bytes == sum(dag_bag._dag_sizes.values())
+
+    def test_keeps_single_dag_larger_than_budget(self):
+        dag_bag = DBDagBag(cache_max_bytes=10)
+        dag_bag._read_dag(self._serdag("big", payload_size=1000))
+        assert list(dag_bag._dags) == ["big"]
+
+    @mock.patch("airflow.models.dagbag.Stats")
+    def test_metrics(self, mock_stats):
+        dag_bag = DBDagBag(cache_size=1)
+        session = mock.MagicMock()
+        session.get.return_value.serialized_dag = self._serdag("a")
+        dag_bag._get_dag("a", session=session)
+        dag_bag._get_dag("a", session=session)
+        dag_bag._read_dag(self._serdag("b"))
+
+        incr_calls = [c.args[0] for c in mock_stats.incr.call_args_list]
+        assert incr_calls == ["dag_bag.cache.miss", "dag_bag.cache.hit", "dag_bag.cache.evict"]
+        mock_stats.gauge.assert_any_call("dag_bag.cache.size", 1)
+
+    def test_clear_cache(self):
+        dag_bag = DBDagBag(cache_max_bytes=1000)
+        dag_bag._read_dag(self._serdag("a"))
+        dag_bag.clear_cache()
+        assert not dag_bag._dags
+        assert dag_bag._total_bytes == 0
+
+
+class TestDBDagBagPrewarm:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        db_clean_up()
+        yield
+        db_clean_up()
+
+    @staticmethod
+    def _create_dags(dag_maker, session, num_dags):
+        for i in range(num_dags):
+            with dag_maker(f"prewarm_{i}", session=session):
+                EmptyOperator(task_id="task")
+        session.commit()
+
+    def test_prewarm_loads_active_unpaused_dags_in_batches(self, dag_maker, session):
+        self._create_dags(dag_maker, session, 5)
+        session.execute(update(DagModel).where(DagModel.dag_id == "prewarm_0").values(is_paused=True))
+        session.execute(update(DagModel).where(DagModel.dag_id == "prewarm_1").values(is_stale=True))
+        session.commit()
+
+        dag_bag = DBDagBag()
+        with mock.patch.object(
+            SerializedDagModel,
+            "get_latest_serialized_dags",
+            wraps=SerializedDagModel.get_latest_serialized_dags,
+        ) as get_latest:
+            assert dag_bag.prewarm(batch_size=2, session=session) == 3
+        assert get_latest.call_count == 2
+        assert sorted(dag.dag_id for dag in dag_bag._dags.values()) == ["prewarm_2", "prewarm_3", "prewarm_4"]
+
+        dag_run = dag_maker.create_dagrun(session=session)
+        with mock.patch.object(session, "get", wraps=session.get) as session_get:
+            assert dag_bag.get_dag_for_run(dag_run, session=session).dag_id == "prewarm_4"
+        assert not any(c.args[0] is DagVersion for c in session_get.call_args_list)
+
+    def test_prewarm_loads_dags_needed_first(self, dag_maker, session):
+        self._create_dags(dag_maker, session, 4)
+        now = datetime.now(timezone.utc)
+        for dag_id, next_dagrun_create_after in [
+            ("prewarm_0", None),
+            ("prewarm_1", now + timedelta(hours=1)),
+            ("prewarm_2", now),
+            ("prewarm_3", None),
+        ]:
+            session.execute(
+                update(DagModel)
+                .where(DagModel.dag_id == dag_id)
+                .values(next_dagrun_create_after=next_dagrun_create_after)
+            )
+        dag_maker.create_dagrun(state=DagRunState.RUNNING, session=session)
+        session.commit()
+
+        dag_bag = DBDagBag(cache_size=3)
+        assert dag_bag.prewarm(batch_size=1, session=session) == 3
+        # The DAG with a running dag run, then the DAGs whose next dag run is due first
+        assert [dag.dag_id for dag in dag_bag._dags.values()] == ["prewarm_3", "prewarm_2", "prewarm_1"]
+
+    def test_prewarm_respects_cache_size(self, dag_maker, session):
+        self._create_dags(dag_maker, session, 3)
+        dag_bag = DBDagBag(cache_size=2)
+        assert dag_bag.prewarm(session=session) == 2
+        assert len(dag_bag._dags) == 2
+
+    @mock.patch("airflow.models.dagbag.Stats")
+    def test_prewarm_metrics(self, mock_stats, dag_maker, session):
+        self._create_dags(dag_maker, session, 2)
+        DBDagBag().prewarm(batch_size=1, session=session)
+
+        assert [c.args for c in mock_stats.gauge.call_args_list if c.args[0] == "dag_bag.prewarm.loaded"] == [
+            ("dag_bag.prewarm.loaded", 1),
+            ("dag_bag.prewarm.loaded", 2),
+        ]
+        mock_stats.timing.assert_called_once_with("dag_bag.prewarm.duration", mock.ANY)
+
+    @pytest.mark.parametrize(
+        "storage_format, compress",
+        [
+            pytest.param("json", True, id="compressed"),
+            pytest.param("segmented", False, id="segmented"),
+        ],
+    )
+    def test_prewarm_decodes_in_process_pool(self, storage_format, compress, dag_maker, session):
+        with (
+            mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", storage_format),
+            mock.patch("airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS", compress),
+        ):
+            self._create_dags(dag_maker, session, 3)
+        dag_bag = DBDagBag()
+        decode_binary_data_in_pool = SerializedDagModel.decode_binary_data_in_pool
+        decoded_dag_ids = []
+
+        def decode_in_pool(serdags, pool):
+            decode_binary_data_in_pool(serdags, pool)
+            decoded_dag_ids.extend(
+                serdag.dag_id for serdag in serdags if serdag._SerializedDagModel__data_cache is not None
+            )
+
+        with mock.patch.object(SerializedDagModel, "decode_binary_data_in_pool", side_effect=decode_in_pool):
+            assert dag_bag.prewarm(batch_size=2, processes=2, session=session) == 3
+
+        # Every DAG was decoded by the pool before being deserialized
+        assert sorted(decoded_dag_ids) == ["prewarm_0", "prewarm_1", "prewarm_2"]
+        assert sorted(dag.dag_id for dag in dag_bag._dags.values()) == ["prewarm_0", "prewarm_1", "prewarm_2"]
+        assert all(dag.task_dict.keys() == {"task"} for dag in dag_bag._dags.values())
+
+    def test_prewarm_skips_dags_that_fail_to_deserialize(self, dag_maker, session, caplog):
+        self._create_dags(dag_maker, session, 2)
+        dag_bag = DBDagBag()
+        read_dag = dag_bag._read_dag
+
+        def _read_dag(serdag):
+            if serdag.dag_id == "prewarm_0":
+                raise ValueError("broken")
+            return read_dag(serdag)
+
+        with mock.patch.object(dag_bag, "_read_dag", side_effect=_read_dag):
+            assert dag_bag.prewarm(session=session) == 1
+        assert "Failed to pre-warm the DAG cache with DAG prewarm_0" in caplog.text
+
+
 class TestCaptureWithReraise:
     @staticmethod
     def raise_warnings():
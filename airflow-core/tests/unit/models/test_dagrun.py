@@ -35,7 +35,7 @@ from airflow._shared.timezones import timezone
 from airflow.callbacks.callback_requests import DagCallbackRequest, DagRunContext
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dag_version import DagVersion
-from airflow.models.dagrun import DagRun, DagRunNote
+from airflow.models.dagrun import DagRun, DagRunNote, TIProjection
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance, TaskInstanceNote, clear_task_instances
 from airflow.models.taskmap import TaskMap
@@ -1911,6 +1911,55 @@ def test_ti_scheduling_mapped_zero_length(dag_maker, session):
     assert indices == [(-1, TaskInstanceState.SKIPPED)]
 
 
+@mock.patch.object(DagRun, "COMPACT_TASK_INSTANCE_LOADING", True)
+def test_ti_scheduling_decisions_compact_loading(dag_maker, session):
+    with dag_maker(session=session):
+        task_1 = EmptyOperator(task_id="task_1")
+        task_2 = EmptyOperator(task_id="task_2")
+        task_3 = EmptyOperator(task_id="task_3")
+        task_1 >> task_2 >> task_3
+
+    dr: DagRun = dag_maker.create_dagrun()
+    ti1, ti2, ti3 = sorted(dr.get_task_instances(session=session), key=lambda ti: ti.task_id)
+    ti1.state = TaskInstanceState.SUCCESS
+    session.flush()
+    session.expunge_all()
+
+    decision = dr.task_instance_scheduling_decisions(session=session)
+
+    (finished,) = decision.finished_tis
+    assert isinstance(finished, TIProjection)
+    assert (finished.task_id, finished.state) == ("task_1", TaskInstanceState.SUCCESS)
+    assert finished.task.task_id == "task_1"
+    assert all(isinstance(ti, TaskInstance) for ti in decision.unfinished_tis)
+    assert [ti.task_id for ti in decision.schedulable_tis] == ["task_2"]
+    # The finished ti was never loaded as an ORM object.
+    assert not any(isinstance(obj, TaskInstance) and obj.task_id == "task_1" for obj in session)
+
+
+@mock.patch.object(DagRun, "COMPACT_TASK_INSTANCE_LOADING", True)
+def test_update_state_compact_loading_upstream_failed(dag_maker, session):
+    with dag_maker(session=session):
+        task_1 = EmptyOperator(task_id="task_1")
+        task_2 = EmptyOperator(task_id="task_2")
+        task_1 >> task_2
+
+    dr: DagRun = dag_maker.create_dagrun()
+    ti1, ti2 = sorted(dr.get_task_instances(session=session), key=lambda ti: ti.task_id)
+    ti1.state = TaskInstanceState.FAILED
+    session.flush()
+
+    schedulable_tis, _ = dr.update_state(session=session)
+
+    assert schedulable_tis == []
+    assert session.scalar(select(TaskInstance.state).where(TaskInstance.id == ti2.id)) == (
+        TaskInstanceState.UPSTREAM_FAILED
+    )
+
+    dr.update_state(session=session)
+    assert dr.state == DagRunState.FAILED
+
+
 @pytest.mark.parametrize("trigger_rule", [TriggerRule.ALL_DONE, TriggerRule.ALL_SUCCESS])
 def test_mapped_task_upstream_failed(dag_maker, session, trigger_rule):
     from airflow.providers.standard.operators.python import PythonOperator
@@ -36,6 +36,7 @@ from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.providers.standard.operators.python import PythonOperator
 from airflow.sdk import DAG, Asset, AssetAlias, task as task_decorator
 from airflow.serialization.dag_dependency import DagDependency
+from airflow.serialization.segmented import SegmentedDagData
 from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedDAG
 from airflow.settings import json
 from airflow.utils.hashlib_wrapper import md5
@@ -550,3 +551,65 @@ class TestSerializedDagModel:
         # Verify that the original data still has fileloc (method shouldn't modify original)
         assert "fileloc" in test_data["dag"]
         assert test_data["dag"]["fileloc"] == "/different/path/to/dag.py"
+
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "segmented")
+    def test_write_dag_segmented(self, dag_maker, session):
+        with dag_maker("test_write_dag_segmented") as dag:
+            start = EmptyOperator(task_id="start")
+            start >> [EmptyOperator(task_id="a"), EmptyOperator(task_id="b")]
+        expected = json.loads(json.dumps(SerializedDAG.to_dict(dag)))
+
+        sdm = session.scalar(select(SDM).where(SDM.dag_id == dag.dag_id))
+        assert sdm._data is None
+        assert sdm._data_compressed is None
+        assert sdm._data_segmented is not None
+        session.expire(sdm)
+        assert sdm.data == expected
+        assert sdm.dag.get_task("start").downstream_task_ids == {"a", "b"}
+
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "segmented")
+    def test_get_serialized_dag_segmented_decodes_single_task(self, dag_maker, session):
+        with dag_maker("test_get_serialized_dag_segmented") as dag:
+            start = EmptyOperator(task_id="start")
+            middle = BashOperator(task_id="middle", bash_command="echo 1")
+            start >> middle >> EmptyOperator(task_id="end")
+        session.commit()
+
+        with mock.patch.object(SegmentedDagData, "data", new_callable=mock.PropertyMock) as full_decode:
+            task = SDM.get_serialized_dag(dag_id=dag.dag_id, task_id="middle", session=session)
+        full_decode.assert_not_called()
+
+        assert task.task_id == "middle"
+        assert task.bash_command == "echo 1"
+        assert task.upstream_task_ids == {"start"}
+        assert task.downstream_task_ids == {"end"}
+        assert SDM.get_serialized_dag(dag_id=dag.dag_id, task_id="missing", session=session) is None
+
+    @mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "segmented")
+    def test_get_dependencies_segmented(self, session):
+        self._write_example_dags()
+        dependencies = SDM.get_dag_dependencies(session=session)
+        assert "consumes_asset_decorator" in dependencies
+
+    def test_get_dependencies_segmented_read_as_json(self, session):
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "segmented"):
+            self._write_example_dags()
+            expected = SDM.get_dag_dependencies(session=session)
+        assert "consumes_asset_decorator" in expected
+
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", "json"):
+            assert SDM.get_dag_dependencies(session=session) == expected
+
+    @pytest.mark.parametrize("storage_format", ["json", "segmented"])
+    def test_stored_size(self, storage_format, dag_maker, session):
+        with mock.patch("airflow.models.serialized_dag.SERIALIZED_DAG_STORAGE_FORMAT", storage_format):
+            with dag_maker("test_stored_size"):
+                EmptyOperator(task_id="task")
+            session.commit()
+        sdm = session.scalar(select(SDM).where(SDM.dag_id == "test_stored_size"))
+
+        with mock.patch.object(SDM, "data", new_callable=mock.PropertyMock) as data:
+            stored_size = sdm.stored_size
+        data.assert_not_called()
+        blob = sdm._data_segmented or sdm._data_compressed
+        assert stored_size == (len(blob) if blob else len(json.dumps(sdm.data)))
@@ -0,0 +1,62 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pendulum
+import pytest
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG
+from airflow.serialization.segmented import SegmentedDagData, encode_segmented
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.settings import json
+
+
+@pytest.fixture
+def dag_data():
+    with DAG("test_segmented", schedule=None, start_date=pendulum.datetime(2025, 1, 1, tz="UTC")) as dag:
+        start = EmptyOperator(task_id="start")
+        start >> [EmptyOperator(task_id="a"), EmptyOperator(task_id="b")]
+    return json.loads(json.dumps(SerializedDAG.to_dict(dag)))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(dag_data, compress):
+    segmented = SegmentedDagData(encode_segmented(dag_data, compress=compress))
+
+    assert segmented.data == dag_data
+    assert segmented.task_ids == [task["__var"]["task_id"] for task in dag_data["dag"]["tasks"]]
+    assert "tasks" not in segmented.header_data["dag"]
+    assert segmented.header_data["dag"]["dag_id"] == "test_segmented"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_get_task(dag_data, compress):
+    segmented = SegmentedDagData(encode_segmented(dag_data, compress=compress))
+
+    for task in dag_data["dag"]["tasks"]:
+        assert segmented.get_task(task["__var"]["task_id"]) == task
+    assert sorted(segmented.get_upstream_task_ids("a")) == ["start"]
+    assert segmented.get_upstream_task_ids("start") == []
+    with pytest.raises(KeyError):
+        segmented.get_task("missing")
+
+
+def test_invalid_data(dag_data):
+    with pytest.raises(ValueError, match="not in the segmented format"):
+        SegmentedDagData(json.dumps(dag_data).encode())
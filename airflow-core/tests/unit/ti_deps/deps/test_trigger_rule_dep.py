@@ -31,7 +31,7 @@ from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk import task, task_group
 from airflow.sdk.bases.operator import BaseOperator
 from airflow.ti_deps.dep_context import DepContext
-from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
+from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamStateCounts, _UpstreamTIStates
 from airflow.utils.state import DagRunState, TaskInstanceState
 from airflow.utils.trigger_rule import TriggerRule
 
@@ -1217,6 +1217,39 @@ class TestTriggerRuleDep:
         dr.update_state(session=session)
         assert dr.state == DagRunState.SUCCESS
 
+    def test_UpstreamTIStates_from_task_states(self, session, dag_maker):
+        """Summing the per-task counts of the dep context gives the same states as counting the tis."""
+        with dag_maker(session=session):
+            setup = EmptyOperator(task_id="setup").as_setup()
+            op1 = EmptyOperator(task_id="op1")
+            op2 = EmptyOperator(task_id="op2")
+            op3 = EmptyOperator(task_id="op3", trigger_rule=TriggerRule.ALL_DONE)
+            setup >> (op1, op2) >> op3
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        tis["setup"].state = SUCCESS
+        tis["op1"].state = FAILED
+        tis["op2"].state = SKIPPED
+        for ti in tis.values():
+            ti.task = dr.dag.get_task(ti.task_id)
+        finished_tis = [tis["setup"], tis["op1"]]
+        dep_context = DepContext(finished_tis=finished_tis)
+
+        task_states = dep_context.ensure_finished_ti_states(dr, session)
+        assert task_states == {"setup": {SUCCESS: 1}, "op1": {FAILED: 1}}
+        assert dep_context.ensure_finished_ti_states(dr, session) is task_states
+
+        # finished_tis is extended when tis get finished while scheduling; the counts must follow.
+        finished_tis.append(tis["op2"])
+        task_states = dep_context.ensure_finished_ti_states(dr, session)
+        assert task_states["op2"] == {SKIPPED: 1}
+
+        upstream_ids = ("setup", "op1", "op2")
+        counts = _UpstreamStateCounts.from_task_states(task_states, upstream_ids, setup_ids={"setup"})
+        assert _UpstreamTIStates.calculate(counts) == _UpstreamTIStates.calculate(iter(finished_tis))
+        assert _UpstreamTIStates.calculate(counts) == (1, 1, 1, 0, 0, 3, 1, 0)
+
     @pytest.mark.parametrize("flag_upstream_failed, expected_ti_state", [(True, REMOVED), (False, None)])
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self,
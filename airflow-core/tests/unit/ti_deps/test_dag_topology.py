@@ -0,0 +1,112 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gc
+
+import pendulum
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, task_group
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.ti_deps import dag_topology
+from airflow.ti_deps.dag_topology import TaskTopology, get_task_topology
+
+DEFAULT_DATE = pendulum.datetime(2025, 1, 1, tz="UTC")
+
+
+def _serialized(dag: DAG) -> SerializedDAG:
+    return SerializedDAG.deserialize_dag(SerializedDAG.serialize_dag(dag))
+
+
+def _setup_teardown_dag() -> DAG:
+    with DAG("test_dag_topology", schedule=None, start_date=DEFAULT_DATE) as dag:
+        s1 = EmptyOperator(task_id="s1").as_setup()
+        w1 = EmptyOperator(task_id="w1")
+        w2 = EmptyOperator(task_id="w2")
+        t1 = EmptyOperator(task_id="t1").as_teardown(setups=s1)
+        s1 >> w1 >> w2 >> t1
+    return dag
+
+
+def test_compute_setup_constraints():
+    dag = _serialized(_setup_teardown_dag())
+
+    w1 = TaskTopology.compute(dag.get_task("w1"))
+    assert w1.upstream_task_ids == {"s1"}
+    assert w1.upstream_setup_ids == {"s1"}
+    assert w1.relevant_setup_ids == ("s1",)
+    assert w1.indirect_setup_ids == ()
+    assert not w1.upstream_needs_expansion
+    assert not w1.in_mapped_task_group
+
+    w2 = TaskTopology.compute(dag.get_task("w2"))
+    assert w2.upstream_task_ids == {"w1"}
+    assert w2.upstream_setup_ids == frozenset()
+    assert w2.indirect_setup_ids == ("s1",)
+
+    # a teardown cannot have any indirect setups
+    t1 = TaskTopology.compute(dag.get_task("t1"))
+    assert t1.relevant_setup_ids == ()
+    assert t1.upstream_task_ids == {"s1", "w2"}
+
+
+def test_compute_mapped_task_group():
+    with DAG("test_dag_topology_mapped", schedule=None, start_date=DEFAULT_DATE) as dag:
+        start = EmptyOperator(task_id="start")
+
+        @task_group
+        def tg(value):
+            EmptyOperator(task_id="inner")
+
+        start >> tg.expand(value=[1, 2, 3])
+    dag = _serialized(dag)
+
+    start = TaskTopology.compute(dag.get_task("start"))
+    assert not start.in_mapped_task_group
+    assert start.expansion_dependencies == frozenset()
+
+    inner = TaskTopology.compute(dag.get_task("tg.inner"))
+    assert inner.in_mapped_task_group
+    assert inner.upstream_task_ids == {"start"}
+    assert not inner.upstream_needs_expansion
+
+
+def test_topology_cached_per_serialized_dag():
+    dag = _serialized(_setup_teardown_dag())
+    task = dag.get_task("w2")
+
+    assert get_task_topology(task) is get_task_topology(task)
+
+    other_version = _serialized(_setup_teardown_dag())
+    assert get_task_topology(other_version.get_task("w2")) is not get_task_topology(task)
+
+    dag_key = id(dag)
+    assert dag_key in dag_topology._dag_indexes
+    del dag, task
+    gc.collect()
+    assert dag_key not in dag_topology._dag_indexes
+
+
+def test_topology_not_cached_for_sdk_dag():
+    dag = _setup_teardown_dag()
+    task = dag.get_task("w2")
+
+    assert get_task_topology(task) is not get_task_topology(task)
+    assert get_task_topology(task) == TaskTopology.compute(task)
+    assert id(dag) not in dag_topology._dag_indexes
@@ -173,6 +173,28 @@ class TestListPyFilesPath:
         with pytest.raises(RuntimeError, match=error_message):
             list(find_path_from_directory(test_dir, ignore_list_file, ignore_file_syntax="glob"))
 
+    def test_find_path_from_directory_reads_ignore_files_again_when_changed(self, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        for name in ("dag_1.py", "dag_2.py", "subdir/dag_3.py"):
+            (tmp_path / name).write_text("")
+        ignore_file = tmp_path / ".airflowignore"
+        ignore_file.write_text("dag_1.py")
+        file_utils._read_ignore_file.cache_clear()
+
+        def find():
+            return {
+                os.path.relpath(path, tmp_path)
+                for path in find_path_from_directory(tmp_path, ".airflowignore", "glob")
+            }
+
+        assert find() == {"dag_2.py", "subdir/dag_3.py"}
+        assert find() == {"dag_2.py", "subdir/dag_3.py"}
+        assert file_utils._read_ignore_file.cache_info().misses == 1
+
+        ignore_file.write_text("!dag_3.py\ndag_*.py")
+        assert find() == {"subdir/dag_3.py"}
+        assert file_utils._read_ignore_file.cache_info().misses == 2
+
     def test_might_contain_dag_with_default_callable(self):
         file_path_with_dag = os.path.join(TEST_DAGS_FOLDER, "test_scheduler_dags.py")
 
@@ -246,6 +268,47 @@ class TestListPyFilesPath:
         assert detected_files == expected_files
 
 
+@pytest.mark.parametrize(
+    "ignore_rule_type, patterns",
+    [
+        pytest.param(
+            file_utils._GlobIgnoreRule,
+            ["*.pyc", "build/", "/top_level_*.py", "!keep_*", "dags/**/tmp_*", "!dags/*/tmp_keep.py", "logs"],
+            id="glob",
+        ),
+        pytest.param(
+            file_utils._RegexpIgnoreRule,
+            [r"\.pyc$", "^build/", r"(tmp|temp)_\w+", r"(?i)^LOGS", r"(.)\1_repeated"],
+            id="regexp",
+        ),
+    ],
+)
+def test_ignore_matcher_matches_like_rules(tmp_path, ignore_rule_type, patterns):
+    ignore_file = tmp_path / ".airflowignore"
+    rules = [ignore_rule_type.compile(pattern, tmp_path, ignore_file) for pattern in patterns]
+    matcher = file_utils._IgnoreMatcher(rules)
+
+    for rel_path in (
+        "dag.py",
+        "dag.pyc",
+        "build",
+        "build/dag.py",
+        "dags/build",
+        "top_level_dag.py",
+        "dags/top_level_dag.py",
+        "keep_dag.pyc",
+        "dags/team/tmp_dag.py",
+        "dags/team/tmp_keep.py",
+        "dags/team/temp_dag.py",
+        "logs",
+        "dags/logs/dag.py",
+        "aa_repeated.py",
+        "ab_repeated.py",
+    ):
+        path = tmp_path / rel_path
+        assert matcher.match(path) == ignore_rule_type.match(path, rules), rel_path
+
+
 @pytest.mark.parametrize(
     "edge_filename, expected_modification",
     [
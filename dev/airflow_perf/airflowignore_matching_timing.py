@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import rich_click as click
+
+GLOB_RULES = ["*_{i}.pyc", "tmp_{i}/", "/generated_{i}_*.py", "**/scratch_{i}/**", "!keep_{i}_*.py"]
+REGEXP_RULES = [r"_{i}\.pyc$", "tmp_{i}/", "^generated_{i}_", r"scratch_{i}/.*", r"backup_{i}\.py$"]
+
+
+def create_tree(root: Path, depth: int, dirs_per_level: int, files_per_dir: int, rules: list[str]) -> int:
+    """Create a tree of DAG files with an ignore file in every directory, and return its number of files."""
+    (root / ".airflowignore").write_text("\n".join(rules))
+    for i in range(files_per_dir):
+        (root / f"dag_{i}.py").write_text("")
+    num_files = files_per_dir
+    if depth > 0:
+        for i in range(dirs_per_level):
+            subdir = root / f"team_{i}"
+            subdir.mkdir()
+            num_files += create_tree(subdir, depth - 1, dirs_per_level, files_per_dir, rules)
+    return num_files
+
+
+def find_path_evaluating_each_rule(base_dir_path, ignore_file_name, ignore_rule_type):
+    """Walk the tree like ``find_path_from_directory`` did before ignore rules were compiled and cached."""
+    import re
+
+    patterns_by_dir = {}
+    for root, dirs, files in os.walk(base_dir_path, followlinks=True):
+        patterns = patterns_by_dir.get(Path(root).resolve(), [])
+        ignore_file_path = Path(root) / ignore_file_name
+        if ignore_file_path.is_file():
+            with open(ignore_file_path) as ifile:
+                lines = [re.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")]
+            rules = (
+                ignore_rule_type.compile(line, Path(base_dir_path), ignore_file_path)
+                for line in lines
+                if line
+            )
+            patterns += [rule for rule in rules if rule is not None]
+        dirs[:] = [subdir for subdir in dirs if not ignore_rule_type.match(Path(root) / subdir, patterns)]
+        for subdir in dirs:
+            patterns_by_dir[(Path(root) / subdir).resolve()] = patterns.copy()
+        for file in files:
+            if file != ignore_file_name and not ignore_rule_type.match(Path(root) / file, patterns):
+                yield str(Path(root) / file)
+
+
+def time_it(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    if len(times) > 1:
+        return f"{statistics.mean(times):.4f}s (±{statistics.stdev(times):.3f}s)"
+    return f"{times[0]:.4f}s"
+
+
+@click.command()
+@click.option("--depth", default=4, help="number of levels of directories below the bundle root")
+@click.option("--dirs-per-level", default=4, help="number of subdirectories of each directory")
+@click.option("--files-per-dir", default=10, help="number of DAG files in each directory")
+@click.option("--rules-per-file", default=20, help="number of rules in each ignore file")
+@click.option("--syntax", type=click.Choice(["glob", "regexp"]), default="glob", help="ignore file syntax")
+@click.option("--repeat", default=5, help="number of times to run each step, to reduce variance")
+def main(depth, dirs_per_level, files_per_dir, rules_per_file, syntax, repeat):
+    """
+    Time listing the files of a deep bundle, with an ``.airflowignore`` file in every directory.
+
+    Rules of nested ignore files accumulate, so evaluating each rule against each path grows with the
+    depth of the tree. The benchmark compares that to the compiled ignore matcher, when the ignore files
+    are read for the first time, and when they are unchanged since the previous listing.
+    """
+    os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+
+    from airflow.utils import file as file_utils
+
+    templates = GLOB_RULES if syntax == "glob" else REGEXP_RULES
+    rules = [templates[i % len(templates)].format(i=i) for i in range(rules_per_file)]
+    ignore_rule_type = file_utils._GlobIgnoreRule if syntax == "glob" else file_utils._RegexpIgnoreRule
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        num_files = create_tree(Path(tmp_dir), depth, dirs_per_level, files_per_dir, rules)
+
+        def list_compiled_cold():
+            file_utils._read_ignore_file.cache_clear()
+            file_utils._get_ignore_matcher.cache_clear()
+            return list(file_utils.find_path_from_directory(tmp_dir, ".airflowignore", syntax))
+
+        def list_compiled_warm():
+            return list(file_utils.find_path_from_directory(tmp_dir, ".airflowignore", syntax))
+
+        def list_each_rule():
+            return list(find_path_evaluating_each_rule(tmp_dir, ".airflowignore", ignore_rule_type))
+
+        if sorted(list_compiled_cold()) != sorted(list_each_rule()):
+            raise click.ClickException("The compiled ignore matcher does not list the same files")
+
+        print()
+        print(f"{num_files} files, depth {depth}, {rules_per_file} {syntax} rules per ignore file")
+        for name, func in (
+            ("each rule", list_each_rule),
+            ("compiled (cold)", list_compiled_cold),
+            ("compiled (warm)", list_compiled_warm),
+        ):
+            print(f"{name:>16}  {time_it(func, repeat):>22}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+import rich_click as click
+
+DAG_ID_PREFIX = "critical_section_benchmark_"
+
+
+def create_pools(num_pools, pool_slots, session):
+    """
+    Create the pools used by the benchmark DAGs.
+    """
+    from airflow.models.pool import Pool
+
+    for i in range(num_pools):
+        pool_name = f"{DAG_ID_PREFIX}pool_{i}"
+        session.merge(Pool(pool=pool_name, slots=pool_slots, description="benchmark", include_deferred=False))
+
+
+def create_dags(num_dags, tasks_per_dag, num_pools, max_active_tasks, session):
+    """
+    Write ``num_dags`` DAGs of ``tasks_per_dag`` independent tasks to the DB, spreading tasks across pools.
+    """
+    from sqlalchemy import update
+
+    from airflow._shared.timezones import timezone
+    from airflow.dag_processing.bundles.manager import DagBundlesManager
+    from airflow.dag_processing.collection import update_dag_parsing_results_in_db
+    from airflow.models.dag import DagModel
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedDAG
+
+    DagBundlesManager().sync_bundles_to_db(session=session)
+    session.flush()
+    dags = []
+    for dag_index in range(num_dags):
+        with DAG(
+            f"{DAG_ID_PREFIX}{dag_index}",
+            schedule=None,
+            start_date=timezone.datetime(2025, 1, 1),
+            max_active_tasks=max_active_tasks,
+        ) as dag:
+            for task_index in range(tasks_per_dag):
+                EmptyOperator(
+                    task_id=f"task_{task_index}",
+                    pool=f"{DAG_ID_PREFIX}pool_{(dag_index + task_index) % num_pools}",
+                    priority_weight=num_dags - dag_index,
+                )
+        dag.relative_fileloc = os.path.basename(__file__)
+        dags.append(LazyDeserializedDAG(data=SerializedDAG.to_dict(dag)))
+    update_dag_parsing_results_in_db("dags-folder", None, dags, {}, set(), session=session)
+    session.execute(update(DagModel).where(DagModel.dag_id.like(f"{DAG_ID_PREFIX}%")).values(is_paused=False))
+
+
+def create_dag_runs(num_dags, runs_per_dag, running_per_run, session):
+    """
+    Create running DAG runs whose TIs are all scheduled, except ``running_per_run`` TIs already running.
+    """
+    from airflow._shared.timezones import timezone
+    from airflow.models.dagbag import DBDagBag
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    dag_bag = DBDagBag(load_op_links=False)
+    for dag_index in range(num_dags):
+        dag = dag_bag.get_latest_version_of_dag(f"{DAG_ID_PREFIX}{dag_index}", session=session)
+        for run_index in range(runs_per_dag):
+            logical_date = timezone.datetime(2025, 1, 1 + run_index)
+            dag_run = dag.create_dagrun(
+                run_id=f"benchmark__{run_index}",
+                logical_date=logical_date,
+                data_interval=(logical_date, logical_date),
+                run_after=logical_date,
+                run_type=DagRunType.MANUAL,
+                triggered_by=DagRunTriggeredByType.TEST,
+                state=DagRunState.RUNNING,
+                start_date=timezone.utcnow(),
+                session=session,
+            )
+            for ti_index, ti in enumerate(dag_run.get_task_instances(session=session)):
+                ti.state = (
+                    TaskInstanceState.RUNNING if ti_index < running_per_run else TaskInstanceState.SCHEDULED
+                )
+        session.flush()
+
+
+def reset_benchmark_data(session):
+    """
+    Delete everything created by a previous run of the benchmark.
+    """
+    from sqlalchemy import delete
+
+    from airflow.models.dag import DagModel
+    from airflow.models.dag_version import DagVersion
+    from airflow.models.dagrun import DagRun
+    from airflow.models.pool import Pool
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.models.taskinstance import TaskInstance
+
+    dag_id_filter = f"{DAG_ID_PREFIX}%"
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id.like(dag_id_filter)))
+    session.execute(delete(DagRun).where(DagRun.dag_id.like(dag_id_filter)))
+    session.execute(delete(SerializedDagModel).where(SerializedDagModel.dag_id.like(dag_id_filter)))
+    session.execute(delete(DagVersion).where(DagVersion.dag_id.like(dag_id_filter)))
+    session.execute(delete(DagModel).where(DagModel.dag_id.like(dag_id_filter)))
+    session.execute(delete(Pool).where(Pool.pool.like(dag_id_filter)))
+
+
+def time_query_mode(query_mode, max_tis, repeat):
+    """
+    Run the critical section query ``repeat`` times, rolling back after each run.
+
+    Returns the timings, the number of SQL statements and the number of TIs queued by the last run.
+    """
+    from sqlalchemy import event
+
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.utils.session import create_session
+
+    os.environ["AIRFLOW__SCHEDULER__CRITICAL_SECTION_QUERY_MODE"] = query_mode
+    job_runner = SchedulerJobRunner(job=Job())
+    times = []
+    statements = 0
+    num_queued = 0
+    for _ in range(repeat):
+        with create_session() as session:
+            statements = 0
+
+            def count_statement(*args, **kwargs):
+                nonlocal statements
+                statements += 1
+
+            engine = session.get_bind()
+            event.listen(engine, "before_cursor_execute", count_statement)
+            try:
+                start = time.perf_counter()
+                num_queued = len(job_runner._executable_task_instances_to_queued(max_tis, session=session))
+                times.append(time.perf_counter() - start)
+            finally:
+                event.remove(engine, "before_cursor_execute", count_statement)
+                session.rollback()
+    return times, statements, num_queued
+
+
+@click.command()
+@click.option("--num-dags", default=200, help="number of DAGs to create")
+@click.option("--tasks-per-dag", default=50, help="number of tasks in each DAG")
+@click.option("--runs-per-dag", default=2, help="number of running DagRuns per DAG")
+@click.option("--num-pools", default=20, help="number of pools the tasks are spread across")
+@click.option("--pool-slots", default=16, help="number of slots in each pool")
+@click.option("--max-active-tasks", default=4, help="max_active_tasks of each DAG")
+@click.option("--running-per-run", default=3, help="number of TIs already running in each DagRun")
+@click.option("--max-tis", default=32, help="max number of TIs to queue in one critical section")
+@click.option("--repeat", default=5, help="number of times to run each query mode, to reduce variance")
+def main(
+    num_dags,
+    tasks_per_dag,
+    runs_per_dag,
+    num_pools,
+    pool_slots,
+    max_active_tasks,
+    running_per_run,
+    max_tis,
+    repeat,
+):
+    """
+    Compare the ``iterative`` and ``windowed`` critical section query modes of the scheduler.
+
+    The benchmark creates DAGs whose runs are mostly starved by ``max_active_tasks`` and pool limits
+    in the database configured by ``[database] sql_alchemy_conn``, then times
+    ``SchedulerJobRunner._executable_task_instances_to_queued`` in both modes. Each run is rolled back,
+    so both modes see the same data.
+
+    Run it once per database backend to compare them, for example in Breeze with
+    ``--backend postgres`` and ``--backend mysql``.
+    """
+    os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+    # The critical section logs every TI it examines, which would dominate the timings
+    os.environ["AIRFLOW__LOGGING__LOGGING_LEVEL"] = "WARNING"
+
+    from airflow.utils.session import create_session
+
+    with create_session() as session:
+        reset_benchmark_data(session)
+        create_pools(num_pools, pool_slots, session)
+        create_dags(num_dags, tasks_per_dag, num_pools, max_active_tasks, session)
+        create_dag_runs(num_dags, runs_per_dag, running_per_run, session)
+
+    with create_session() as session:
+        dialect = session.get_bind().dialect.name
+
+    print()
+    print(
+        f"{dialect}: {num_dags} DAGs x {runs_per_dag} runs x {tasks_per_dag} tasks, "
+        f"{num_pools} pools of {pool_slots} slots, max_active_tasks={max_active_tasks}"
+    )
+    for query_mode in ("iterative", "windowed"):
+        times, statements, num_queued = time_query_mode(query_mode, max_tis, repeat)
+        if len(times) > 1:
+            timing = f"{statistics.mean(times):.4f}s (±{statistics.stdev(times):.3f}s)"
+        else:
+            timing = f"{times[0]:.4f}s"
+        print(f"{query_mode:>10}: {timing}, {statements} SQL statements, {num_queued} TIs queued")
+
+    with create_session() as session:
+        reset_benchmark_data(session)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import statistics
+import time
+import zlib
+
+import rich_click as click
+
+
+def create_dag_data(num_tasks, fan_out):
+    """
+    Serialize a DAG of ``num_tasks`` tasks, where each task has up to ``fan_out`` downstream tasks.
+    """
+    from airflow._shared.timezones import timezone
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG
+    from airflow.serialization.serialized_objects import SerializedDAG
+    from airflow.settings import json
+
+    with DAG(
+        "serialized_dag_format_benchmark", schedule=None, start_date=timezone.datetime(2025, 1, 1)
+    ) as dag:
+        tasks = [
+            BashOperator(task_id=f"task_{i}", bash_command=f"echo {i}", retries=i % 3, doc_md=f"Task {i}")
+            for i in range(num_tasks)
+        ]
+        for i, task in enumerate(tasks):
+            task >> tasks[i + 1 : i + 1 + fan_out]
+    # Round trip through JSON, so both formats encode what is read back from the DB
+    return json.loads(json.dumps(SerializedDAG.to_dict(dag)))
+
+
+def time_it(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    if len(times) > 1:
+        return f"{statistics.mean(times):.4f}s (±{statistics.stdev(times):.3f}s)"
+    return f"{times[0]:.4f}s"
+
+
+@click.command()
+@click.option("--num-tasks", default=5000, help="number of tasks in the DAG")
+@click.option("--fan-out", default=3, help="number of downstream tasks of each task")
+@click.option(
+    "--compress/--no-compress", default=False, help="compress the data, as compress_serialized_dags"
+)
+@click.option("--repeat", default=5, help="number of times to run each step, to reduce variance")
+def main(num_tasks, fan_out, compress, repeat):
+    """
+    Compare the ``json`` and ``segmented`` values of ``[core] serialized_dag_storage_format``.
+
+    For both formats, the benchmark times encoding a large serialized DAG, decoding and deserializing the
+    whole DAG, and reading a single task of it, which is what e.g. the API server does to render a task.
+    It also prints the size of the data stored in the DB.
+    """
+    os.environ["AIRFLOW__CORE__LOAD_EXAMPLES"] = "False"
+
+    from airflow.serialization.segmented import SegmentedDagData, encode_segmented
+    from airflow.serialization.serialized_objects import SerializedBaseOperator, SerializedDAG
+    from airflow.settings import json
+
+    dag_data = create_dag_data(num_tasks, fan_out)
+    task_id = f"task_{num_tasks // 2}"
+
+    def encode_json():
+        encoded = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+        return zlib.compress(encoded) if compress else encoded
+
+    def decode_json(blob):
+        return json.loads(zlib.decompress(blob) if compress else blob)
+
+    json_blob = encode_json()
+    segmented_blob = encode_segmented(dag_data, compress=compress)
+
+    def read_task_segmented():
+        encoded_task = SegmentedDagData(segmented_blob).get_task(task_id)
+        SerializedBaseOperator.deserialize_operator(encoded_task["__var"])
+
+    print()
+    print(f"{num_tasks} tasks, fan out {fan_out}, {'compressed' if compress else 'uncompressed'}")
+    print(f"{'':>10}  {'size':>10}  {'encode':>22}  {'decode DAG':>22}  {'read 1 task':>22}")
+    for name, blob, encode, decode, read_task in (
+        (
+            "json",
+            json_blob,
+            encode_json,
+            lambda: SerializedDAG.from_dict(decode_json(json_blob)),
+            lambda: SerializedDAG.from_dict(decode_json(json_blob)).get_task(task_id),
+        ),
+        (
+            "segmented",
+            segmented_blob,
+            lambda: encode_segmented(dag_data, compress=compress),
+            lambda: SerializedDAG.from_dict(SegmentedDagData(segmented_blob).data),
+            read_task_segmented,
+        ),
+    ):
+        print(
+            f"{name:>10}  {len(blob):>10}  {time_it(encode, repeat):>22}  "
+            f"{time_it(decode, repeat):>22}  {time_it(read_task, repeat):>22}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -18,12 +18,16 @@
 from __future__ import annotations
 
 import logging
+import os
 import ssl
 import sys
+import threading
+import time
 import uuid
+from collections import deque
 from functools import cache
 from http import HTTPStatus
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 
 import certifi
 import httpx
@@ -31,7 +35,8 @@ import msgspec
 import structlog
 from pydantic import BaseModel
 from retryhttp import retry, wait_retry_after
-from tenacity import before_log, wait_random_exponential
+from tenacity import RetryCallState, before_log, stop_after_attempt, wait_random_exponential
+from tenacity.stop import stop_base
 from uuid6 import uuid7
 
 from airflow.configuration import conf
@@ -51,6 +56,9 @@ from airflow.sdk.api.datamodels._generated import (
     TerminalStateNonSuccess,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
+    TIHeartbeatBatchItem,
+    TIHeartbeatBatchPayload,
+    TIHeartbeatBatchResponse,
     TIHeartbeatInfo,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
@@ -78,9 +86,12 @@ from airflow.sdk.execution_time.comms import (
     TaskRescheduleStartDate,
     TICount,
     UpdateHITLDetail,
+    encode_xcom_value,
 )
+from airflow.stats import Stats
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from datetime import datetime
     from typing import ParamSpec
 
@@ -251,6 +262,22 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def heartbeat_batch(self, tis: Iterable[tuple[uuid.UUID, int, str]]) -> TIHeartbeatBatchResponse:
+        """
+        Send the heartbeats of many TIs in one request.
+
+        :param tis: The ``(id, pid, token)`` of each TI, the token of a TI being the one it uses to talk to
+            the API server.
+        """
+        hostname = get_hostname()
+        body = TIHeartbeatBatchPayload(
+            task_instances=[
+                TIHeartbeatBatchItem(id=id, pid=pid, token=token, hostname=hostname) for id, pid, token in tis
+            ]
+        )
+        resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIHeartbeatBatchResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -408,6 +435,20 @@ class VariableOperations:
         return OKResponse(ok=True)
 
 
+class _FileContent:
+    """The content of a request read from a file in chunks, from the start on each attempt of the request."""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.file.seek(0)
+        while chunk := self.file.read(self.CHUNK_SIZE):
+            yield chunk
+
+
 class XComOperations:
     __slots__ = ("client",)
 
@@ -474,6 +515,45 @@ class XComOperations:
         mapped_length: int | None = None,
     ) -> OKResponse:
         """Set a XCom value via the API server."""
+        params = self._get_set_params(map_index, mapped_length)
+        self.client.post(
+            f"xcoms/{dag_id}/{run_id}/{task_id}/{key}",
+            params=params,
+            content=encode_xcom_value(value),
+            headers={"Content-Type": "application/json"},
+        )
+        # Any error from the server will anyway be propagated down to the supervisor,
+        # so we choose to send a generic response to the supervisor over the server response to
+        # decouple from the server response string
+        return OKResponse(ok=True)
+
+    def set_from_file(
+        self,
+        dag_id: str,
+        run_id: str,
+        task_id: str,
+        key: str,
+        file: IO[bytes],
+        map_index: int | None = None,
+        mapped_length: int | None = None,
+    ) -> OKResponse:
+        """
+        Set a XCom value via the API server, from a file holding the JSON-encoded value.
+
+        The file is streamed to the API server in chunks, so that the value is never held in memory. It is
+        read again from the start if the request is retried.
+        """
+        params = self._get_set_params(map_index, mapped_length)
+        self.client.post(
+            f"xcoms/{dag_id}/{run_id}/{task_id}/{key}",
+            params=params,
+            content=_FileContent(file),
+            headers={"Content-Type": "application/json"},
+        )
+        return OKResponse(ok=True)
+
+    @staticmethod
+    def _get_set_params(map_index: int | None, mapped_length: int | None) -> dict[str, int]:
         # TODO: check if we need to use map_index as params in the uri
         # ref: https://github.com/apache/airflow/blob/v2-10-stable/airflow/api_connexion/openapi/v1.yaml#L1785C1-L1785C81
         params = {}
@@ -481,11 +561,7 @@ class XComOperations:
             params = {"map_index": map_index}
         if mapped_length is not None and mapped_length >= 0:
             params["mapped_length"] = mapped_length
-        self.client.post(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}", params=params, json=value)
-        # Any error from the server will anyway be propagated down to the supervisor,
-        # so we choose to send a generic response to the supervisor over the server response to
-        # decouple from the server response string
-        return OKResponse(ok=True)
+        return params
 
     def delete(
         self,
@@ -806,6 +882,143 @@ API_RETRIES = conf.getint("workers", "execution_api_retries")
 API_RETRY_WAIT_MIN = conf.getfloat("workers", "execution_api_retry_wait_min")
 API_RETRY_WAIT_MAX = conf.getfloat("workers", "execution_api_retry_wait_max")
 API_SSL_CERT_PATH = conf.get("api", "ssl_cert")
+API_RETRY_BUDGET_RATIO = conf.getfloat("workers", "execution_api_retry_budget_ratio", fallback=0.2)
+API_RETRY_BUDGET_MIN_PER_SECOND = conf.getfloat(
+    "workers", "execution_api_retry_budget_min_per_second", fallback=1.0
+)
+
+
+class RetryBudget:
+    """
+    Limit the retries of the Execution API calls of the process to a share of the calls.
+
+    Over the last ``window`` seconds, a retry is allowed as long as the number of retries stays below
+    ``ratio`` times the number of calls, plus ``min_per_second`` retries per second. When the API server is
+    down, this keeps all the tasks of a worker process from retrying every call in lockstep, while a few
+    failures among many successful calls are still retried.
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: int = 10):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.window = window
+        # The [second, calls, retries] counters of each second of the window
+        self._counters: deque[list[int]] = deque()
+        self._lock = threading.Lock()
+
+    def _current_counters(self) -> list[int]:
+        now = int(time.monotonic())
+        while self._counters and self._counters[0][0] <= now - self.window:
+            self._counters.popleft()
+        if not self._counters or self._counters[-1][0] != now:
+            self._counters.append([now, 0, 0])
+        return self._counters[-1]
+
+    def record_call(self):
+        with self._lock:
+            self._current_counters()[1] += 1
+
+    def try_retry(self) -> bool:
+        """Take a retry from the budget, if there is one left."""
+        with self._lock:
+            counters = self._current_counters()
+            calls = sum(c[1] for c in self._counters)
+            retries = sum(c[2] for c in self._counters)
+            if retries >= self.min_per_second * self.window + self.ratio * calls:
+                return False
+            counters[2] += 1
+            return True
+
+
+@cache
+def get_retry_budget() -> RetryBudget:
+    """Return the retry budget shared by all the clients of the process."""
+    return RetryBudget(ratio=API_RETRY_BUDGET_RATIO, min_per_second=API_RETRY_BUDGET_MIN_PER_SECOND)
+
+
+def record_first_attempt(retry_state: RetryCallState) -> None:
+    """Count a call in the retry budget of the process, but not its retries, so they can't grow the budget."""
+    if retry_state.attempt_number == 1:
+        get_retry_budget().record_call()
+
+
+class stop_when_retry_budget_exhausted(stop_base):
+    """Stop retrying when the retry budget of the process is exhausted."""
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if get_retry_budget().try_retry():
+            return False
+        log.warning("Execution API retry budget exhausted, not retrying", attempt=retry_state.attempt_number)
+        Stats.incr("execution_api.retry_budget_exhausted")
+        return True
+
+
+class _SharedTransport(httpx.HTTPTransport):
+    """A transport shared by all the clients of the process, whose connections outlive each client."""
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@cache
+def get_shared_transport() -> httpx.HTTPTransport:
+    """
+    Return the pooled transport used by all the clients of the process to talk to the Execution API.
+
+    The tasks supervised by a worker process one after another, or at the same time by its threads, reuse the
+    connections of the pool instead of each opening their own. With ``[workers] execution_api_http2``, the
+    requests are multiplexed over one HTTP/2 connection to servers that support it.
+    """
+    ctx = ssl.create_default_context(cafile=certifi.where())
+    if API_SSL_CERT_PATH:
+        ctx.load_verify_locations(API_SSL_CERT_PATH)
+    limits = httpx.Limits(
+        max_connections=conf.getint("workers", "execution_api_max_connections", fallback=10),
+        max_keepalive_connections=conf.getint(
+            "workers", "execution_api_max_keepalive_connections", fallback=10
+        ),
+    )
+    return _SharedTransport(
+        verify=ctx,
+        http2=conf.getboolean("workers", "execution_api_http2", fallback=False),
+        limits=limits,
+    )
+
+
+def _reset_after_fork():
+    # The child process must not use the connections or the counters of the parent process
+    get_shared_transport.cache_clear()
+    get_retry_budget.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def trace_connection(request: httpx.Request):
+    """Record whether the request is sent over a new connection, for the connection reuse metrics."""
+
+    def trace(event_name: str, info: dict[str, Any]):
+        # Only the transports that open connections, and not e.g. the in-process ones, send these events
+        if event_name == "connection.connect_tcp.complete":
+            request.extensions["airflow_new_connection"] = True
+        else:
+            request.extensions.setdefault("airflow_new_connection", False)
+
+    request.extensions["trace"] = trace
+
+
+def emit_connection_metrics(response: httpx.Response):
+    new_connection = response.request.extensions.get("airflow_new_connection")
+    if new_connection is None:
+        return
+    tags = {"http_version": response.http_version}
+    if new_connection:
+        Stats.incr("execution_api.connections_opened", tags=tags)
+    else:
+        Stats.incr("execution_api.connections_reused", tags=tags)
 
 
 class Client(httpx.Client):
@@ -821,10 +1034,8 @@ class Client(httpx.Client):
             kwargs.setdefault("base_url", "dry-run://server")
         else:
             kwargs["base_url"] = base_url
-            ctx = ssl.create_default_context(cafile=certifi.where())
-            if API_SSL_CERT_PATH:
-                ctx.load_verify_locations(API_SSL_CERT_PATH)
-            kwargs["verify"] = ctx
+            if "transport" not in kwargs:
+                kwargs["transport"] = get_shared_transport()
         pyver = f"{'.'.join(map(str, sys.version_info[:3]))}"
         super().__init__(
             auth=auth,
@@ -832,7 +1043,10 @@ class Client(httpx.Client):
                 "user-agent": f"apache-airflow-task-sdk/{__version__} (Python/{pyver})",
                 "airflow-api-version": API_VERSION,
             },
-            event_hooks={"response": [self._update_auth, raise_on_4xx_5xx], "request": [add_correlation_id]},
+            event_hooks={
+                "response": [self._update_auth, emit_connection_metrics, raise_on_4xx_5xx],
+                "request": [add_correlation_id, trace_connection],
+            },
             **kwargs,
         )
 
@@ -845,11 +1059,12 @@ class Client(httpx.Client):
 
     @retry(
         reraise=True,
-        max_attempt_number=API_RETRIES,
+        stop=stop_after_attempt(API_RETRIES) | stop_when_retry_budget_exhausted(),
         wait_server_errors=_default_wait,
         wait_network_errors=_default_wait,
         wait_timeouts=_default_wait,
         wait_rate_limited=wait_retry_after(fallback=_default_wait),  # No infinite timeout on HTTP 429
+        before=record_first_attempt,
         before_sleep=before_log(log, logging.WARNING),
     )
     def request(self, *args, **kwargs):
@@ -27,7 +27,7 @@ from uuid import UUID
 
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, RootModel
 
-API_VERSION: Final[str] = "2025-09-23"
+API_VERSION: Final[str] = "2025-10-13"
 
 
 class AssetAliasReferenceAssetEventDagRun(BaseModel):
@@ -244,6 +244,31 @@ class TIEnterRunningPayload(BaseModel):
     start_date: Annotated[AwareDatetime, Field(title="Start Date")]
 
 
+class TIHeartbeatBatchItem(BaseModel):
+    """
+    Schema for the heartbeat of one TaskInstance in the batched heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    pid: Annotated[int, Field(title="Pid")]
+    id: Annotated[UUID, Field(title="Id")]
+    token: Annotated[str, Field(title="Token")]
+
+
+class TIHeartbeatBatchResult(BaseModel):
+    """
+    Result of the heartbeat of one TaskInstance in the batched heartbeat endpoint.
+    """
+
+    id: Annotated[UUID, Field(title="Id")]
+    status_code: Annotated[int, Field(title="Status Code")]
+    detail: Annotated[dict[str, Any] | str | None, Field(title="Detail")] = None
+    refreshed_token: Annotated[str | None, Field(title="Refreshed Token")] = None
+
+
 class TIHeartbeatInfo(BaseModel):
     """
     Schema for TaskInstance heartbeat endpoint.
@@ -537,6 +562,25 @@ class DagRun(BaseModel):
     consumed_asset_events: Annotated[list[AssetEventDagRunReference], Field(title="Consumed Asset Events")]
 
 
+class TIHeartbeatBatchPayload(BaseModel):
+    """
+    Schema for the batched TaskInstance heartbeat endpoint.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    task_instances: Annotated[list[TIHeartbeatBatchItem], Field(title="Task Instances")]
+
+
+class TIHeartbeatBatchResponse(BaseModel):
+    """
+    Response of the batched TaskInstance heartbeat endpoint.
+    """
+
+    results: Annotated[list[TIHeartbeatBatchResult], Field(title="Results")]
+
+
 class HTTPValidationError(BaseModel):
     detail: Annotated[list[ValidationError] | None, Field(title="Detail")] = None
 
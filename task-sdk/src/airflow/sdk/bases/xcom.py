@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import collections
+import threading
 from typing import Any, Protocol
 
 import structlog
@@ -27,8 +28,10 @@ from airflow.sdk.execution_time.comms import (
     GetXCom,
     GetXComSequenceSlice,
     SetXCom,
+    SetXComChunk,
     XComResult,
     XComSequenceSliceResult,
+    encode_xcom_value,
 )
 
 # Lightweight wrapper for XCom values
@@ -36,6 +39,9 @@ _XComValueWrapper = collections.namedtuple("_XComValueWrapper", "value")
 
 log = structlog.get_logger(logger_name="task")
 
+# The chunks of a value must not interleave with the chunks of a value pushed by another thread
+_chunked_xcom_lock = threading.Lock()
+
 
 class TIKeyProtocol(Protocol):
     dag_id: str
@@ -72,8 +78,6 @@ class BaseXCom:
         :param map_index: Optional map index to assign XCom for a mapped task.
             The default is ``-1`` (set for a non-mapped task).
         """
-        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
-
         value = cls.serialize_value(
             value=value,
             key=key,
@@ -83,7 +87,7 @@ class BaseXCom:
             map_index=map_index,
         )
 
-        SUPERVISOR_COMMS.send(
+        cls._send_set_xcom(
             SetXCom(
                 key=key,
                 value=value,
@@ -117,9 +121,7 @@ class BaseXCom:
         :param map_index: Optional map index to assign XCom for a mapped task.
             The default is ``-1`` (set for a non-mapped task).
         """
-        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
-
-        SUPERVISOR_COMMS.send(
+        cls._send_set_xcom(
             SetXCom(
                 key=key,
                 value=value,
@@ -130,6 +132,29 @@ class BaseXCom:
             ),
         )
 
+    @staticmethod
+    def _send_set_xcom(msg: SetXCom) -> None:
+        """Send a SetXCom message to the supervisor, splitting large values in chunks when it supports them."""
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        # Not set for the in-process comms, or for the mocked ones of the tests
+        chunk_size = getattr(SUPERVISOR_COMMS, "xcom_chunk_size", None)
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            SUPERVISOR_COMMS.send(msg)
+            return
+
+        # Encoded once, and the way the API client would, so the supervisor sends these bytes as they are
+        encoded = encode_xcom_value(msg.value)
+        if len(encoded) <= chunk_size:
+            SUPERVISOR_COMMS.send(msg.model_copy(update={"value": None, "encoded_value": encoded}))
+            return
+
+        data = memoryview(encoded)
+        with _chunked_xcom_lock:
+            for start in range(0, len(data), chunk_size):
+                SUPERVISOR_COMMS.send(SetXComChunk(data=bytes(data[start : start + chunk_size])))
+            SUPERVISOR_COMMS.send(msg.model_copy(update={"value": None, "chunked": True}))
+
     @classmethod
     def get_value(
         cls,
@@ -49,6 +49,8 @@ Execution API server is because:
 from __future__ import annotations
 
 import itertools
+import json
+import threading
 from collections.abc import Iterator
 from datetime import datetime
 from functools import cached_property
@@ -125,6 +127,16 @@ def _msgpack_enc_hook(obj: Any) -> Any:
     raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
 
 
+def encode_xcom_value(value: Any) -> bytes:
+    """
+    Encode an XCom value to the JSON body sent to the API server.
+
+    This matches how httpx encodes ``json=`` request bodies, so NaN and infinity are refused whichever way
+    the value reaches the API server.
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+
 def _new_encoder() -> msgspec.msgpack.Encoder:
     return msgspec.msgpack.Encoder(enc_hook=_msgpack_enc_hook)
 
@@ -184,27 +196,40 @@ class CommsDecoder(Generic[ReceiveMsgType, SendMsgType]):
 
     err_decoder: TypeAdapter[ErrorResponse] = attrs.field(factory=lambda: TypeAdapter(ToTask), repr=False)
 
+    xcom_chunk_size: int = attrs.field(default=0, repr=False)
+    """
+    Send the XCom values whose JSON encoding is larger than this in ``SetXComChunk`` messages of this size.
+
+    Only the supervisors that handle these messages set it, 0 sends all the values in one message.
+    """
+
+    # Requests can be sent from several threads, e.g. to prefetch XCom values, but the response to a request
+    # must be read before the next request is sent
+    _send_lock: threading.Lock = attrs.field(factory=threading.Lock, repr=False, init=False)
+
     def send(self, msg: SendMsgType) -> ReceiveMsgType | None:
         """Send a request to the parent and block until the response is received."""
-        frame = _RequestFrame(id=next(self.id_counter), body=msg.model_dump())
-        frame_bytes = frame.as_bytes()
-
-        self.socket.sendall(frame_bytes)
-        if isinstance(msg, ResendLoggingFD):
-            if recv_fds is None:
-                return None
-            # We need special handling here! The server can't send us the fd number, as the number on the
-            # supervisor will be different to in this process, so we have to mutate the message ourselves here.
-            frame, fds = self._read_frame(maxfds=1)
-            resp = self._from_frame(frame)
-            if TYPE_CHECKING:
-                assert isinstance(resp, SentFDs)
-            resp.fds = fds
-            # Since we know this is an expliclt SendFDs, and since this class is generic SendFDs might not
-            # always be in the return type union
-            return resp  # type: ignore[return-value]
-
-        return self._get_response()
+        with self._send_lock:
+            frame = _RequestFrame(id=next(self.id_counter), body=msg.model_dump())
+            frame_bytes = frame.as_bytes()
+
+            self.socket.sendall(frame_bytes)
+            if isinstance(msg, ResendLoggingFD):
+                if recv_fds is None:
+                    return None
+                # We need special handling here! The server can't send us the fd number, as the number on the
+                # supervisor will be different to in this process, so we have to mutate the message ourselves
+                # here.
+                frame, fds = self._read_frame(maxfds=1)
+                resp = self._from_frame(frame)
+                if TYPE_CHECKING:
+                    assert isinstance(resp, SentFDs)
+                resp.fds = fds
+                # Since we know this is an expliclt SendFDs, and since this class is generic SendFDs might not
+                # always be in the return type union
+                return resp  # type: ignore[return-value]
+
+            return self._get_response()
 
     @overload
     def _read_frame(self, maxfds: None = None) -> _ResponseFrame: ...
@@ -740,9 +765,25 @@ class SetXCom(BaseModel):
     task_id: str
     map_index: int | None = None
     mapped_length: int | None = None
+    chunked: bool = False
+    """The JSON-encoded value was sent in ``SetXComChunk`` messages ahead of this one, instead of in ``value``."""
+    encoded_value: bytes | None = None
+    """The JSON-encoded value, sent instead of ``value`` when the task process encoded it already."""
     type: Literal["SetXCom"] = "SetXCom"
 
 
+class SetXComChunk(BaseModel):
+    """
+    Part of the JSON-encoded value of a large XCom, sent ahead of the ``SetXCom`` message storing it.
+
+    The supervisor spools the chunks to a temporary file and streams it to the API server, so that it never
+    holds the whole value in memory.
+    """
+
+    data: bytes
+    type: Literal["SetXComChunk"] = "SetXComChunk"
+
+
 class DeleteXCom(BaseModel):
     key: str
     dag_id: str
@@ -911,6 +952,7 @@ ToSupervisor = Annotated[
     | RetryTask
     | SetRenderedFields
     | SetXCom
+    | SetXComChunk
     | SkipDownstreamTasks
     | SucceedTask
     | ValidateInletsAndOutlets
@@ -0,0 +1,214 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Worker-local cache of parsed DAG files.
+
+The supervisor of a task runs in a long-lived worker process, e.g. a worker of the LocalExecutor or of a
+Celery worker, and forks a new process for each task. When the cache is enabled, the worker process parses
+the DAG file of a task before forking its process, and keeps the parsed DAGs: the task process inherits them,
+and the next tasks of the same DAG file do not need to parse it again.
+
+The modules of the bundle imported by a DAG file, e.g. its helper modules, are kept with its parsed DAGs
+rather than in the ``sys.modules`` of the worker process, so that the processes of the other tasks, which
+may use another version of the bundle, do not inherit them. The parsed DAGs are used as long as neither
+the DAG file nor these modules changed, since unversioned bundles, e.g. local ones, change in place.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, NamedTuple
+
+import structlog
+
+from airflow.configuration import conf
+from airflow.sdk.definitions._internal.dag_parsing_context import _airflow_parsing_context_manager
+
+if TYPE_CHECKING:
+    from airflow.models.dagbag import DagBag
+    from airflow.sdk.api.datamodels._generated import BundleInfo
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+class _ParsedDagKey(NamedTuple):
+    bundle_name: str
+    bundle_version: str | None
+    rel_path: str
+    file_hash: str
+
+
+class _ParsedDagFile(NamedTuple):
+    bag: DagBag
+    modules: dict[str, ModuleType]
+    """The modules of the bundle imported while parsing the file, which are not left in ``sys.modules``."""
+    module_mtimes: dict[str, int]
+    """Modification times, in nanoseconds, of the files of ``modules`` when the file was parsed."""
+
+    def is_current(self) -> bool:
+        """Whether the modules of the bundle imported by the file are unchanged since it was parsed."""
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in self.module_mtimes.items())
+        except OSError:
+            return False
+
+
+class ParsedDagCache:
+    """A static class to manage the cache of parsed DAG files of the worker process."""
+
+    _files: OrderedDict[_ParsedDagKey, _ParsedDagFile] = OrderedDict()
+
+    @staticmethod
+    def get_size() -> int:
+        """Return the maximum number of DAG files in the cache, the cache is disabled if 0."""
+        return conf.getint("workers", "parsed_dag_cache_size", fallback=0)
+
+    @staticmethod
+    def _get_key(
+        bundle_info: BundleInfo, dag_rel_path: str | os.PathLike[str], dag_path: str
+    ) -> _ParsedDagKey:
+        file_hash = hashlib.md5(Path(dag_path).read_bytes(), usedforsecurity=False).hexdigest()
+        return _ParsedDagKey(bundle_info.name, bundle_info.version, os.fspath(dag_rel_path), file_hash)
+
+    @classmethod
+    def preload(
+        cls,
+        bundle_info: BundleInfo,
+        dag_rel_path: str | os.PathLike[str],
+        *,
+        dag_id: str,
+        task_id: str,
+    ) -> None:
+        """
+        Parse the DAG file of a task in the worker process, ahead of forking the process of the task.
+
+        The file is not parsed again if it is already in the cache. Files with import errors are not cached,
+        their tasks parse them again. This never raises, the task process parses the file itself if it cannot
+        be parsed ahead. The ``sys.path`` and ``sys.modules`` of the worker process are left as they were.
+        """
+        if (size := cls.get_size()) <= 0:
+            return
+        from airflow.dag_processing.bundles.manager import DagBundlesManager
+        from airflow.models.dagbag import DagBag
+
+        sys_path = list(sys.path)
+        sys_modules = dict(sys.modules)
+        bundle_root = None
+        try:
+            bundle_instance = DagBundlesManager().get_bundle(
+                name=bundle_info.name, version=bundle_info.version
+            )
+            bundle_instance.initialize()
+            if (bundle_root := os.fspath(bundle_instance.path)) not in sys.path:
+                sys.path.append(bundle_root)
+            dag_path = os.fspath(Path(bundle_instance.path, dag_rel_path))
+
+            key = cls._get_key(bundle_info, dag_rel_path, dag_path)
+            if (parsed := cls._files.get(key)) is not None and parsed.is_current():
+                cls._files.move_to_end(key)
+                return
+            with _airflow_parsing_context_manager(dag_id=dag_id, task_id=task_id):
+                bag = DagBag(
+                    dag_folder=dag_path, include_examples=False, safe_mode=False, load_op_links=False
+                )
+        except Exception:
+            log.warning("Failed to parse the DAG file ahead of the task", path=dag_rel_path, exc_info=True)
+            return
+        finally:
+            modules = _restore_imports(sys_path, sys_modules, bundle_root)
+
+        if bag.import_errors:
+            cls._files.pop(key, None)
+            return
+        try:
+            module_mtimes = {
+                module.__file__: os.stat(module.__file__).st_mtime_ns
+                for module in modules.values()
+                if module.__file__
+            }
+        except OSError:
+            cls._files.pop(key, None)
+            return
+        cls._files[key] = _ParsedDagFile(bag, modules, module_mtimes)
+        cls._files.move_to_end(key)
+        while len(cls._files) > size:
+            cls._files.popitem(last=False)
+
+    @classmethod
+    def get(
+        cls, bundle_info: BundleInfo, dag_rel_path: str | os.PathLike[str], dag_path: str
+    ) -> DagBag | None:
+        """
+        Return the parsed DAGs of a file, if the current content of the file and of its modules is cached.
+
+        The modules of the bundle imported while parsing the file are put back in ``sys.modules``, unless
+        already imported, so that the task uses the same modules as its DAG.
+        """
+        if not cls._files:
+            return None
+        try:
+            key = cls._get_key(bundle_info, dag_rel_path, dag_path)
+        except OSError:
+            return None
+        if (parsed := cls._files.get(key)) is None:
+            return None
+        if not parsed.is_current():
+            del cls._files[key]
+            return None
+        for name, module in parsed.modules.items():
+            sys.modules.setdefault(name, module)
+        return parsed.bag
+
+    @classmethod
+    def reset(cls):
+        """Use for test purposes only."""
+        cls._files.clear()
+
+
+def _restore_imports(
+    sys_path: list[str], sys_modules: dict[str, ModuleType], bundle_root: str | None
+) -> dict[str, ModuleType]:
+    """
+    Restore ``sys.path``, and the modules of a bundle in ``sys.modules``, to what they were when saved.
+
+    Only the modules loaded from the files of the bundle are restored: other modules, e.g. those of Airflow
+    and of the installed libraries, do not depend on the bundle version and stay imported.
+
+    :return: the modules of the bundle imported since ``sys.modules`` was saved
+    """
+    sys.path[:] = sys_path
+    if bundle_root is None:
+        return {}
+    root = Path(bundle_root).resolve()
+    imported = {
+        name: module
+        for name, module in list(sys.modules.items())
+        if sys_modules.get(name) is not module
+        and (module_file := getattr(module, "__file__", None))
+        and Path(module_file).resolve().is_relative_to(root)
+    }
+    for name in imported:
+        if name in sys_modules:
+            sys.modules[name] = sys_modules[name]
+        else:
+            del sys.modules[name]
+    return imported
@@ -18,9 +18,11 @@
 from __future__ import annotations
 
 import collections
+import functools
 import itertools
 from collections.abc import Iterator, Sequence
-from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar, overload
 
 import attrs
 import structlog
@@ -41,24 +43,82 @@ log = structlog.get_logger(logger_name=__name__)
 
 @attrs.define
 class LazyXComIterator(Iterator[T]):
+    """
+    Iterator over a ``LazyXComSequence``, fetching its values in chunks.
+
+    Rather than one request per value, the values are fetched by slices, whose size doubles from
+    ``MIN_CHUNK_SIZE`` up to ``max_chunk_size``, so a short iteration does not fetch many values it does not
+    use, while a full scan only takes a few requests. With ``prefetch``, the next chunk is fetched in a
+    background thread while the values of the current one are consumed.
+    """
+
+    MIN_CHUNK_SIZE: ClassVar[int] = 16
+
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    max_chunk_size: int = 1000
+    prefetch: bool = False
+    _buffer: collections.deque[T] = attrs.field(init=False, factory=collections.deque)
+    _fetch_index: int = attrs.field(init=False)
+    _chunk_size: int = attrs.field(init=False)
+    _exhausted: bool = attrs.field(init=False, default=False)
+    _next_chunk: tuple[Future[list[T]], int] | None = attrs.field(init=False, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        self._fetch_index = self.index
+        self._chunk_size = max(min(self.MIN_CHUNK_SIZE, self.max_chunk_size), 1)
 
     def __next__(self) -> T:
-        if self.index < 0:
-            # When iterating backwards, avoid extra HTTP request
+        if not self._buffer:
+            self._fill_buffer()
+        if not self._buffer:
             raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
         self.index += self.dir
-        return val
+        return self._buffer.popleft()
 
     def __iter__(self) -> Iterator[T]:
         return self
 
+    def _fill_buffer(self) -> None:
+        if self._exhausted:
+            return
+        if self._next_chunk is not None:
+            future, size = self._next_chunk
+            self._next_chunk = None
+            chunk = future.result()
+        else:
+            start, size = self._next_slice()
+            chunk = self._get_chunk(start, size)
+        if len(chunk) < size:
+            self._exhausted = True
+        elif self.prefetch:
+            start, next_size = self._next_slice()
+            self._next_chunk = (_get_prefetch_executor().submit(self._get_chunk, start, next_size), next_size)
+        self._buffer.extend(chunk)
+
+    def _next_slice(self) -> tuple[int, int]:
+        """Return the index of the first value of the next chunk to fetch, and its size."""
+        start, size = self._fetch_index, self._chunk_size
+        self._fetch_index += size * self.dir
+        self._chunk_size = max(min(size * 2, self.max_chunk_size), 1)
+        return start, size
+
+    def _get_chunk(self, start: int, size: int) -> list[T]:
+        if self.dir == 1:
+            return list(self.seq[start : start + size])
+        if start < 0:
+            # When iterating backwards, avoid extra HTTP request
+            return []
+        # Values before the first one of the sequence are not fetched, so the chunk is shorter than size
+        return list(self.seq[max(start - size + 1, 0) : start + 1])[::-1]
+
+
+@functools.cache
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    # A single thread is enough, requests to the supervisor are sent one at a time
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="xcom-sequence-prefetch")
+
 
 @attrs.define
 class LazyXComSequence(Sequence[T]):
@@ -82,7 +142,17 @@ class LazyXComSequence(Sequence[T]):
         return all(x == y for x, y in z)
 
     def __iter__(self) -> Iterator[T]:
-        return LazyXComIterator(seq=self)
+        from airflow.configuration import conf
+        from airflow.sdk.execution_time.comms import CommsDecoder
+        from airflow.sdk.execution_time.task_runner import SUPERVISOR_COMMS
+
+        return LazyXComIterator(
+            seq=self,
+            max_chunk_size=conf.getint("workers", "xcom_sequence_chunk_size", fallback=1000),
+            # The in-process supervisor of ``dag.test()`` cannot serve requests sent from another thread
+            prefetch=conf.getboolean("workers", "xcom_sequence_prefetch", fallback=False)
+            and isinstance(SUPERVISOR_COMMS, CommsDecoder),
+        )
 
     def __len__(self) -> int:
         if self._len is None:
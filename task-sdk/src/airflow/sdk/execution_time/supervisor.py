@@ -27,6 +27,8 @@ import os
 import selectors
 import signal
 import sys
+import tempfile
+import threading
 import time
 import weakref
 from collections import deque
@@ -36,6 +38,7 @@ from datetime import datetime, timezone
 from http import HTTPStatus
 from socket import socket, socketpair
 from typing import (
+    IO,
     TYPE_CHECKING,
     BinaryIO,
     ClassVar,
@@ -54,7 +57,7 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.configuration import conf
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import BearerAuth, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
@@ -102,6 +105,7 @@ from airflow.sdk.execution_time.comms import (
     SentFDs,
     SetRenderedFields,
     SetXCom,
+    SetXComChunk,
     SkipDownstreamTasks,
     StartupDetails,
     SucceedTask,
@@ -143,6 +147,7 @@ HEARTBEAT_TIMEOUT: int = conf.getint("scheduler", "task_instance_heartbeat_timeo
 # Don't heartbeat more often than this
 MIN_HEARTBEAT_INTERVAL: int = conf.getint("workers", "min_heartbeat_interval")
 MAX_FAILED_HEARTBEATS: int = conf.getint("workers", "max_failed_heartbeats")
+BATCH_HEARTBEATS: bool = conf.getboolean("workers", "batch_heartbeats", fallback=False)
 
 SOCKET_CLEANUP_TIMEOUT: float = conf.getfloat("workers", "socket_cleanup_timeout")
 
@@ -814,6 +819,82 @@ class WatchedSubprocess:
         return self._exit_code
 
 
+@attrs.define
+class _PendingHeartbeat:
+    proc: ActivitySubprocess
+    sent: bool = False
+    error: Exception | None = None
+
+
+class HeartbeatBatchError(Exception):
+    """The request sending a batch of heartbeats failed, rather than the heartbeat of a task."""
+
+
+class HeartbeatBatcher:
+    """
+    Send the heartbeats of the tasks supervised by this process together.
+
+    When several tasks are supervised by the same process, e.g. by the threads of a Celery worker, the first
+    heartbeat due sends right away, and the heartbeats due while it is in flight are queued, and go out in one
+    request to the batched heartbeat endpoint as soon as it is done. Each caller blocks until its own heartbeat
+    has been sent, and gets the error the single heartbeat endpoint would have given it, if any. If the whole
+    request fails, each caller gets a ``HeartbeatBatchError`` instead.
+
+    Only the tasks of one process are batched: the worker processes of the LocalExecutor, or of a Celery
+    worker using the ``prefork`` pool, each supervise a single task at a time and gain nothing from it.
+    """
+
+    def __init__(self):
+        self._pending: list[_PendingHeartbeat] = []
+        self._pending_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+
+    def heartbeat(self, proc: ActivitySubprocess):
+        pending = _PendingHeartbeat(proc)
+        with self._pending_lock:
+            self._pending.append(pending)
+        with self._send_lock:
+            # Another thread may have sent our heartbeat along with its own while we were waiting
+            if not pending.sent:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                self._send(proc.client, batch)
+        if pending.error:
+            raise pending.error
+
+    @staticmethod
+    def _send(client: Client, batch: list[_PendingHeartbeat]):
+        try:
+            resp = client.task_instances.heartbeat_batch(
+                (pending.proc.id, pending.proc.pid, pending.proc.client.auth.token) for pending in batch
+            )
+            results = {result.id: result for result in resp.results}
+        except Exception as e:
+            # Not an error about the tasks themselves, e.g. a 404 from a server without the batched endpoint
+            error = HeartbeatBatchError(f"Failed to send a batch of {len(batch)} heartbeats: {e}")
+            error.__cause__ = e
+            for pending in batch:
+                pending.sent = True
+                pending.error = error
+            return
+
+        for pending in batch:
+            pending.sent = True
+            if not (result := results.get(pending.proc.id)):
+                pending.error = RuntimeError("The API server did not return the result of the heartbeat")
+                continue
+            if result.refreshed_token:
+                pending.proc.client.auth = BearerAuth(result.refreshed_token)
+            if result.status_code >= 400:
+                # Raise the same error as the single heartbeat endpoint would have
+                request = client.build_request("PUT", f"task-instances/{pending.proc.id}/heartbeat")
+                response = httpx.Response(result.status_code, json={"detail": result.detail}, request=request)
+                pending.error = ServerResponseError.from_response(response)
+
+
+_heartbeat_batcher = HeartbeatBatcher()
+
+
 @attrs.define(kw_only=True)
 class ActivitySubprocess(WatchedSubprocess):
     client: Client
@@ -832,6 +913,8 @@ class ActivitySubprocess(WatchedSubprocess):
 
     _task_end_time_monotonic: float | None = attrs.field(default=None, init=False)
     _rendered_map_index: str | None = attrs.field(default=None, init=False)
+    # The chunks of the large XCom value being received from the task
+    _xcom_chunks: IO[bytes] | None = attrs.field(default=None, init=False)
 
     decoder: ClassVar[TypeAdapter[ToSupervisor]] = TypeAdapter(ToSupervisor)
 
@@ -1002,7 +1085,10 @@ class ActivitySubprocess(WatchedSubprocess):
 
         self._last_heartbeat_attempt = time.monotonic()
         try:
-            self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
+            if BATCH_HEARTBEATS:
+                _heartbeat_batcher.heartbeat(self)
+            else:
+                self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
             # Update the last heartbeat time on success
             self._last_successful_heartbeat = time.monotonic()
 
@@ -1151,6 +1237,36 @@ class ActivitySubprocess(WatchedSubprocess):
             self.client.task_instances.reschedule(self.id, msg)
         elif isinstance(msg, SkipDownstreamTasks):
             self.client.task_instances.skip_downstream_tasks(self.id, msg)
+        elif isinstance(msg, SetXComChunk):
+            if self._xcom_chunks is None:
+                self._xcom_chunks = tempfile.TemporaryFile()
+            self._xcom_chunks.write(msg.data)
+        elif isinstance(msg, SetXCom) and msg.chunked:
+            chunks, self._xcom_chunks = self._xcom_chunks, None
+            if chunks is None:
+                self.send_msg(
+                    None,
+                    request_id=req_id,
+                    error=ErrorResponse(
+                        error=ErrorType.GENERIC_ERROR,
+                        detail={"message": "Received a chunked XCom without its chunks"},
+                    ),
+                )
+                return
+            with chunks:
+                self.client.xcoms.set_from_file(
+                    msg.dag_id, msg.run_id, msg.task_id, msg.key, chunks, msg.map_index, msg.mapped_length
+                )
+        elif isinstance(msg, SetXCom) and msg.encoded_value is not None:
+            self.client.xcoms.set_from_file(
+                msg.dag_id,
+                msg.run_id,
+                msg.task_id,
+                msg.key,
+                io.BytesIO(msg.encoded_value),
+                msg.map_index,
+                msg.mapped_length,
+            )
         elif isinstance(msg, SetXCom):
             self.client.xcoms.set(
                 msg.dag_id, msg.run_id, msg.task_id, msg.key, msg.value, msg.map_index, msg.mapped_length
@@ -1759,6 +1875,7 @@ def supervise(
     :raises ValueError: If server URL is empty or invalid.
     """
     # One or the other
+    from airflow.sdk.execution_time.dag_cache import ParsedDagCache
     from airflow.sdk.execution_time.secrets_masker import reset_secrets_masker
 
     if not client:
@@ -1797,8 +1914,7 @@ def supervise(
         raise ValueError("dag_path is required")
 
     if not client:
-        limits = httpx.Limits(max_keepalive_connections=1, max_connections=10)
-        client = Client(base_url=server or "", limits=limits, dry_run=dry_run, token=token)
+        client = Client(base_url=server or "", dry_run=dry_run, token=token)
 
     start = time.monotonic()
 
@@ -1817,6 +1933,9 @@ def supervise(
 
     reset_secrets_masker()
 
+    # Parse the DAG file before forking the task process, so that it inherits the parsed DAGs
+    ParsedDagCache.preload(bundle_info, dag_rel_path, dag_id=ti.dag_id, task_id=ti.task_id)
+
     process = ActivitySubprocess.start(
         dag_rel_path=dag_rel_path,
         what=ti,
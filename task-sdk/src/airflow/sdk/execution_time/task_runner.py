@@ -103,6 +103,7 @@ from airflow.sdk.execution_time.context import (
     get_previous_dagrun_success,
     set_current_context,
 )
+from airflow.sdk.execution_time.dag_cache import ParsedDagCache
 from airflow.sdk.execution_time.xcom import XCom
 from airflow.sdk.timezone import coerce_datetime
 
@@ -617,15 +618,21 @@ def parse(what: StartupDetails, log: Logger) -> RuntimeTaskInstance:
         sys.path.append(bundle_root)
 
     dag_absolute_path = os.fspath(Path(bundle_instance.path, what.dag_rel_path))
-    bag = DagBag(
-        dag_folder=dag_absolute_path,
-        include_examples=False,
-        safe_mode=False,
-        load_op_links=False,
-    )
     if TYPE_CHECKING:
         assert what.ti.dag_id
 
+    # The file may have been parsed by the worker process before forking this one
+    bag = ParsedDagCache.get(bundle_info, what.dag_rel_path, dag_absolute_path)
+    cached_dag = bag.dags.get(what.ti.dag_id) if bag else None
+    if cached_dag is None or what.ti.task_id not in cached_dag.task_dict:
+        # Not in the cache, or the DAGs of the file depend on the parsing context and lack this task
+        bag = DagBag(
+            dag_folder=dag_absolute_path,
+            include_examples=False,
+            safe_mode=False,
+            load_op_links=False,
+        )
+
     try:
         dag = bag.dags[what.ti.dag_id]
     except KeyError:
@@ -1419,7 +1426,9 @@ def main():
     log = structlog.get_logger(logger_name="task")
 
     global SUPERVISOR_COMMS
-    SUPERVISOR_COMMS = CommsDecoder[ToTask, ToSupervisor](log=log)
+    SUPERVISOR_COMMS = CommsDecoder[ToTask, ToSupervisor](
+        log=log, xcom_chunk_size=conf.getint("workers", "xcom_chunk_size", fallback=0)
+    )
 
     try:
         ti, context, log = startup()
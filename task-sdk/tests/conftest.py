@@ -156,6 +156,14 @@ def _disable_ol_plugin():
     airflow.plugins_manager.plugins = None
 
 
+@pytest.fixture(autouse=True)
+def _reset_retry_budget():
+    # The retry budget is shared by the whole process, don't let the retries of a test eat it for the next ones
+    from airflow.sdk.api.client import get_retry_budget
+
+    get_retry_budget.cache_clear()
+
+
 class MakeTIContextCallable(Protocol):
     def __call__(
         self,
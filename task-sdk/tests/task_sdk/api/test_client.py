@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import json
 import pickle
+import threading
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import TYPE_CHECKING
 from unittest import mock
 
@@ -30,7 +32,13 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import RemoteValidationError, ServerResponseError
+from airflow.sdk.api.client import (
+    Client,
+    RemoteValidationError,
+    RetryBudget,
+    ServerResponseError,
+    get_shared_transport,
+)
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -90,11 +98,10 @@ class TestClient:
 
     @mock.patch("airflow.sdk.api.client.API_SSL_CERT_PATH", "/capath/does/not/exist/")
     def test_add_capath(self):
-        def handle_request(request: httpx.Request) -> httpx.Response:
-            return httpx.Response(status_code=200)
+        get_shared_transport.cache_clear()
 
         with pytest.raises(FileNotFoundError) as err:
-            make_client(httpx.MockTransport(handle_request))
+            Client(base_url="https://server", token="")
 
         assert isinstance(err.value, FileNotFoundError)
 
@@ -224,6 +231,91 @@ class TestClient:
         assert len(responses) == 1
         assert mock_sleep.call_count == 0
 
+    @mock.patch("time.sleep", return_value=None)
+    def test_retry_handling_budget_exhausted(self, mock_sleep):
+        responses: list[httpx.Response] = [
+            *[httpx.Response(500, text="Internal Server Error")] * 3,
+            httpx.Response(200, json={"detail": "Recovered from error - but the budget is exhausted"}),
+        ]
+        client = make_client_w_responses(responses)
+
+        with mock.patch(
+            "airflow.sdk.api.client.get_retry_budget", return_value=RetryBudget(ratio=0, min_per_second=0.2)
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                client.get("http://error")
+        # The budget allows 2 retries over the 10s window
+        assert len(responses) == 1
+        assert mock_sleep.call_count == 2
+
+    @mock.patch("time.sleep", return_value=None)
+    def test_retry_budget_counts_first_attempts(self, mock_sleep):
+        responses: list[httpx.Response] = [
+            *[httpx.Response(500, text="Internal Server Error")] * 2,
+            httpx.Response(200, json={"detail": "Recovered from error"}),
+            httpx.Response(200, json={"detail": "No error"}),
+        ]
+        client = make_client_w_responses(responses)
+        budget = RetryBudget(ratio=0.5, min_per_second=0.1)
+
+        with mock.patch("airflow.sdk.api.client.get_retry_budget", return_value=budget):
+            client.get("http://error")
+            client.get("http://ok")
+
+        # The retries are not counted as calls, and don't raise the budget
+        assert sum(c[1] for c in budget._counters) == 2
+        assert sum(c[2] for c in budget._counters) == 2
+
+    def test_shared_transport(self):
+        client = Client(base_url="https://server", token="")
+        other_client = Client(base_url="https://server", token="")
+
+        assert client._transport is other_client._transport is get_shared_transport()
+        # Closing a client keeps the connections of the pool open for the other clients
+        with mock.patch.object(get_shared_transport()._pool, "close") as mock_close:
+            client.close()
+        mock_close.assert_not_called()
+
+    def test_connection_metrics(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        get_shared_transport.cache_clear()
+        try:
+            client = Client(base_url=f"http://127.0.0.1:{server.server_port}", token="")
+            with mock.patch("airflow.sdk.api.client.Stats") as mock_stats:
+                client.get("/")
+                Client(base_url=f"http://127.0.0.1:{server.server_port}", token="").get("/")
+        finally:
+            # The shared transport never closes its connections itself
+            httpx.HTTPTransport.close(get_shared_transport())
+            get_shared_transport.cache_clear()
+            server.shutdown()
+
+        assert mock_stats.incr.mock_calls == [
+            mock.call("execution_api.connections_opened", tags={"http_version": "HTTP/1.1"}),
+            mock.call("execution_api.connections_reused", tags={"http_version": "HTTP/1.1"}),
+        ]
+
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.5, min_per_second=0.1)
+        for _ in range(4):
+            budget.record_call()
+
+        # One retry per 10s, and one per two calls
+        assert [budget.try_retry() for _ in range(4)] == [True, True, True, False]
+
     def test_token_renewal(self):
         responses: list[httpx.Response] = [
             httpx.Response(200, json={"ok": "1"}),
@@ -342,6 +434,37 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_heartbeat_batch(self):
+        ti_ids = [uuid6.uuid7(), uuid6.uuid7()]
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats":
+                actual_body = json.loads(request.read())
+                assert [(ti["id"], ti["pid"], ti["token"]) for ti in actual_body["task_instances"]] == [
+                    (str(ti_ids[0]), 100, "token-0"),
+                    (str(ti_ids[1]), 101, "token-1"),
+                ]
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": [
+                            {"id": str(ti_ids[0]), "status_code": 204},
+                            {"id": str(ti_ids[1]), "status_code": 404, "detail": {"reason": "not_found"}},
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        resp = client.task_instances.heartbeat_batch(
+            [(ti_ids[0], 100, "token-0"), (ti_ids[1], 101, "token-1")]
+        )
+
+        assert [(result.id, result.status_code, result.detail) for result in resp.results] == [
+            (ti_ids[0], 204, None),
+            (ti_ids[1], 404, {"reason": "not_found"}),
+        ]
+
     def test_task_instance_defer(self):
         # Simulate a successful response from the server that defers a task
         ti_id = uuid6.uuid7()
@@ -779,6 +902,9 @@ class TestXCOMOperations:
         def handle_request(request: httpx.Request) -> httpx.Response:
             if request.url.path == "/xcoms/dag_id/run_id/task_id/key":
                 assert json.loads(request.read()) == values
+                # Encoded like httpx encodes ``json=``, as the chunked values are
+                assert request.read() == httpx.Request("POST", request.url, json=values).read()
+                assert request.headers["Content-Type"] == "application/json"
                 return httpx.Response(
                     status_code=201,
                     json={"message": "XCom successfully set"},
@@ -795,6 +921,32 @@ class TestXCOMOperations:
         )
         assert result == OKResponse(ok=True)
 
+    @mock.patch("time.sleep", return_value=None)
+    def test_xcom_set_from_file(self, mock_sleep, tmp_path):
+        bodies = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/xcoms/dag_id/run_id/task_id/key"
+            assert request.url.params["map_index"] == "2"
+            assert request.headers["content-type"] == "application/json"
+            bodies.append(request.read())
+            if len(bodies) == 1:
+                return httpx.Response(status_code=500, text="Internal Server Error")
+            return httpx.Response(status_code=201, json={"message": "XCom successfully set"})
+
+        value = {"key": "x" * 200_000}
+        with open(tmp_path / "value.json", "w+b") as file:
+            file.write(json.dumps(value).encode())
+
+            client = make_client(transport=httpx.MockTransport(handle_request))
+            result = client.xcoms.set_from_file(
+                dag_id="dag_id", run_id="run_id", task_id="task_id", key="key", file=file, map_index=2
+            )
+
+        assert result == OKResponse(ok=True)
+        # The retry sends the whole file again
+        assert [json.loads(body) for body in bodies] == [value, value]
+
     def test_xcom_set_with_map_index(self):
         # Simulate a successful response from the server when setting an xcom with map_index passed
         def handle_request(request: httpx.Request) -> httpx.Response:
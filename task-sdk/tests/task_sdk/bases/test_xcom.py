@@ -0,0 +1,79 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+
+from airflow.sdk.bases.xcom import BaseXCom
+from airflow.sdk.execution_time import task_runner
+from airflow.sdk.execution_time.comms import CommsDecoder, SetXCom, SetXComChunk
+
+
+@pytest.fixture
+def comms(monkeypatch):
+    comms = CommsDecoder(socket=None, xcom_chunk_size=8)
+    monkeypatch.setattr(task_runner, "SUPERVISOR_COMMS", comms, raising=False)
+    with mock.patch.object(CommsDecoder, "send") as mock_send:
+        yield mock_send
+
+
+class TestBaseXCom:
+    def test_set_small_value(self, comms):
+        BaseXCom.set(key="key", value="small", dag_id="dag", task_id="task", run_id="run")
+
+        comms.assert_called_once_with(
+            SetXCom(
+                key="key",
+                value=None,
+                dag_id="dag",
+                task_id="task",
+                run_id="run",
+                map_index=-1,
+                encoded_value=b'"small"',
+            )
+        )
+
+    def test_set_value_without_chunk_size(self, comms, monkeypatch):
+        monkeypatch.setattr(task_runner.SUPERVISOR_COMMS, "xcom_chunk_size", 0)
+
+        BaseXCom.set(key="key", value="small", dag_id="dag", task_id="task", run_id="run")
+
+        comms.assert_called_once_with(
+            SetXCom(key="key", value="small", dag_id="dag", task_id="task", run_id="run", map_index=-1)
+        )
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), ["a large value", float("-inf")]])
+    def test_set_value_not_json_compliant(self, comms, value):
+        with pytest.raises(ValueError, match="not JSON compliant"):
+            BaseXCom.set(key="key", value=value, dag_id="dag", task_id="task", run_id="run")
+
+        comms.assert_not_called()
+
+    def test_set_large_value_in_chunks(self, comms):
+        value = {"key": "a large value"}
+
+        BaseXCom.set(key="key", value=value, dag_id="dag", task_id="task", run_id="run", map_index=2)
+
+        *chunks, set_xcom = [call.args[0] for call in comms.call_args_list]
+        assert all(isinstance(chunk, SetXComChunk) and len(chunk.data) <= 8 for chunk in chunks)
+        assert json.loads(b"".join(chunk.data for chunk in chunks)) == value
+        assert set_xcom == SetXCom(
+            key="key", value=None, dag_id="dag", task_id="task", run_id="run", map_index=2, chunked=True
+        )
@@ -0,0 +1,199 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import sys
+import textwrap
+from unittest import mock
+
+import pytest
+from uuid6 import uuid7
+
+from airflow.sdk import timezone
+from airflow.sdk.api.datamodels._generated import BundleInfo, TaskInstance
+from airflow.sdk.execution_time.comms import StartupDetails
+from airflow.sdk.execution_time.dag_cache import ParsedDagCache
+from airflow.sdk.execution_time.task_runner import parse
+
+from tests_common.test_utils.config import conf_vars
+
+BUNDLE_INFO = BundleInfo(name="my-bundle", version=None)
+
+DAG_CODE = """
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+with DAG("{dag_id}"):
+    BaseOperator(task_id="a")
+"""
+
+DAG_WITH_HELPER_CODE = """
+import dag_cache_helper
+from airflow.sdk import DAG
+from airflow.sdk.bases.operator import BaseOperator
+
+with DAG("dag_1"):
+    BaseOperator(task_id=dag_cache_helper.TASK_ID)
+"""
+
+
+@pytest.fixture(autouse=True)
+def bundle_path(tmp_path, monkeypatch):
+    monkeypatch.setenv(
+        "AIRFLOW__DAG_PROCESSOR__DAG_BUNDLE_CONFIG_LIST",
+        json.dumps(
+            [
+                {
+                    "name": "my-bundle",
+                    "classpath": "airflow.dag_processing.bundles.local.LocalDagBundle",
+                    "kwargs": {"path": str(tmp_path), "refresh_interval": 1},
+                }
+            ]
+        ),
+    )
+    ParsedDagCache.reset()
+    sys_path = list(sys.path)
+    yield tmp_path
+    ParsedDagCache.reset()
+    sys.path[:] = sys_path
+    for name, module in list(sys.modules.items()):
+        if str(getattr(module, "__file__", None)).startswith(str(tmp_path)):
+            del sys.modules[name]
+
+
+def write_dag(path, dag_id):
+    path.write_text(textwrap.dedent(DAG_CODE.format(dag_id=dag_id)))
+    return os.fspath(path)
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_preload(bundle_path):
+    dag_path = write_dag(bundle_path / "dag_1.py", "dag_1")
+
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+
+    bag = ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", dag_path)
+    assert list(bag.dags) == ["dag_1"]
+    # The file is not parsed again
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", dag_path) is bag
+    # The cache does not apply to other versions of the bundle, or to a changed file
+    assert ParsedDagCache.get(BundleInfo(name="my-bundle", version="v2"), "dag_1.py", dag_path) is None
+    write_dag(bundle_path / "dag_1.py", "dag_1_changed")
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", dag_path) is None
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_preload_evicts_least_recently_used(bundle_path):
+    paths = [write_dag(bundle_path / f"dag_{i}.py", f"dag_{i}") for i in range(3)]
+
+    for i in (0, 1, 0, 2):
+        ParsedDagCache.preload(BUNDLE_INFO, f"dag_{i}.py", dag_id=f"dag_{i}", task_id="a")
+
+    assert [ParsedDagCache.get(BUNDLE_INFO, f"dag_{i}.py", paths[i]) is not None for i in range(3)] == [
+        True,
+        False,
+        True,
+    ]
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_preload_skips_import_errors(bundle_path):
+    dag_path = bundle_path / "dag_1.py"
+    dag_path.write_text("raise RuntimeError('oops')")
+
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(dag_path)) is None
+
+
+def test_preload_disabled_by_default(bundle_path):
+    dag_path = write_dag(bundle_path / "dag_1.py", "dag_1")
+
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", dag_path) is None
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_preload_keeps_bundle_imports_out_of_worker(bundle_path):
+    (bundle_path / "dag_cache_helper.py").write_text("TASK_ID = 'a'")
+    (bundle_path / "dag_1.py").write_text(DAG_WITH_HELPER_CODE)
+    sys_path = list(sys.path)
+
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+
+    # Tasks of other versions of the bundle do not inherit its modules
+    assert sys.path == sys_path
+    assert "dag_cache_helper" not in sys.modules
+    # They are imported back by the tasks using the cached DAGs
+    bag = ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(bundle_path / "dag_1.py"))
+    assert list(bag.dags["dag_1"].task_dict) == ["a"]
+    assert sys.modules["dag_cache_helper"].TASK_ID == "a"
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_preload_parses_again_when_bundle_imports_change(bundle_path):
+    helper_path = bundle_path / "dag_cache_helper.py"
+    helper_path.write_text("TASK_ID = 'a'")
+    dag_path = bundle_path / "dag_1.py"
+    dag_path.write_text(DAG_WITH_HELPER_CODE)
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(dag_path)) is not None
+    sys.modules.pop("dag_cache_helper")
+
+    # The DAG file is unchanged, but the unversioned bundle changed the module it imports
+    helper_path.write_text("TASK_ID = 'b'")
+    mtime_ns = helper_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(helper_path, ns=(mtime_ns, mtime_ns))
+    assert ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(dag_path)) is None
+
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+    bag = ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(dag_path))
+    assert list(bag.dags["dag_1"].task_dict) == ["b"]
+    assert sys.modules["dag_cache_helper"].TASK_ID == "b"
+
+
+@conf_vars({("workers", "parsed_dag_cache_size"): "2"})
+def test_parse_uses_cached_dags(bundle_path, make_ti_context):
+    (bundle_path / "dag_cache_helper.py").write_text("TASK_ID = 'a'")
+    (bundle_path / "dag_1.py").write_text(DAG_WITH_HELPER_CODE)
+    ParsedDagCache.preload(BUNDLE_INFO, "dag_1.py", dag_id="dag_1", task_id="a")
+    what = StartupDetails(
+        ti=TaskInstance(
+            id=uuid7(),
+            task_id="a",
+            dag_id="dag_1",
+            run_id="c",
+            try_number=1,
+            dag_version_id=uuid7(),
+        ),
+        dag_rel_path="dag_1.py",
+        bundle_info=BUNDLE_INFO,
+        ti_context=make_ti_context(),
+        start_date=timezone.utcnow(),
+    )
+
+    with mock.patch("airflow.models.dagbag.DagBag") as dag_bag:
+        ti = parse(what, mock.Mock())
+
+    dag_bag.assert_not_called()
+    cached_bag = ParsedDagCache.get(BUNDLE_INFO, "dag_1.py", os.fspath(bundle_path / "dag_1.py"))
+    assert ti.task is cached_bag.dags["dag_1"].task_dict["a"]
+    assert "dag_cache_helper" in sys.modules
@@ -73,36 +73,63 @@ def test_len(mock_supervisor_comms, lazy_sequence):
     )
 
 
+def _slice_request(start, stop):
+    return GetXComSequenceSlice(
+        key=BaseXCom.XCOM_RETURN_KEY,
+        dag_id="dag",
+        task_id="task",
+        run_id="run",
+        start=start,
+        stop=stop,
+        step=None,
+    )
+
+
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
-    mock_supervisor_comms.send.side_effect = [
-        XComSequenceIndexResult(root="f"),
-        ErrorResponse(error=ErrorType.XCOM_NOT_FOUND, detail={"oops": "sorry!"}),
-    ]
+    mock_supervisor_comms.send.return_value = XComSequenceSliceResult(root=["f"])
     assert list(it) == ["f"]
-    mock_supervisor_comms.send.assert_has_calls(
-        [
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=0,
-                ),
-            ),
-            call(
-                msg=GetXComSequenceItem(
-                    key=BaseXCom.XCOM_RETURN_KEY,
-                    dag_id="dag",
-                    task_id="task",
-                    run_id="run",
-                    offset=1,
-                ),
-            ),
-        ]
-    )
+    # The chunk is shorter than requested, so there are no more values to fetch
+    mock_supervisor_comms.send.assert_called_once_with(_slice_request(0, 16))
+
+
+@conf_vars({("workers", "xcom_sequence_chunk_size"): "40"})
+def test_iter_chunks(mock_supervisor_comms, lazy_sequence):
+    values = list(range(100))
+
+    def send(msg):
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop])
+
+    mock_supervisor_comms.send.side_effect = send
+    assert list(iter(lazy_sequence)) == values
+    # The chunks grow up to the maximum chunk size
+    assert mock_supervisor_comms.send.call_args_list == [
+        call(_slice_request(0, 16)),
+        call(_slice_request(16, 48)),
+        call(_slice_request(48, 88)),
+        call(_slice_request(88, 128)),
+    ]
+
+
+@conf_vars({("workers", "xcom_sequence_prefetch"): "True"})
+def test_iter_prefetch(mock_supervisor_comms, lazy_sequence):
+    values = list(range(20))
+
+    def send(msg):
+        return XComSequenceSliceResult(root=values[msg.start : msg.stop])
+
+    mock_supervisor_comms.send.side_effect = send
+    it = iter(lazy_sequence)
+    assert next(it) == 0
+    # The next chunk is fetched in the background while the first one is consumed
+    it._next_chunk[0].result()
+    assert mock_supervisor_comms.send.call_args_list == [
+        call(_slice_request(0, 16)),
+        call(_slice_request(16, 48)),
+    ]
+    assert list(it) == values[1:]
+    assert mock_supervisor_comms.send.call_count == 2
 
 
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
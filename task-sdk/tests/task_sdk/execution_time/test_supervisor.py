@@ -26,6 +26,7 @@ import selectors
 import signal
 import socket
 import sys
+import threading
 import time
 from contextlib import nullcontext
 from operator import attrgetter
@@ -99,6 +100,7 @@ from airflow.sdk.execution_time.comms import (
     SentFDs,
     SetRenderedFields,
     SetXCom,
+    SetXComChunk,
     SucceedTask,
     TaskRescheduleStartDate,
     TaskState,
@@ -115,6 +117,7 @@ from airflow.sdk.execution_time.comms import (
 )
 from airflow.sdk.execution_time.supervisor import (
     ActivitySubprocess,
+    HeartbeatBatcher,
     InProcessSupervisorComms,
     InProcessTestSupervisor,
     _remote_logging_conn,
@@ -854,6 +857,91 @@ class TestWatchedSubprocess:
             "timestamp": mocker.ANY,
         } in captured_logs
 
+    def test_batched_heartbeats(self, monkeypatch, mocker):
+        """Test that the heartbeats due while one is in flight are sent together in one request."""
+        batcher = HeartbeatBatcher()
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.BATCH_HEARTBEATS", True)
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor._heartbeat_batcher", batcher)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+
+        ti_ids = [uuid7() for _ in range(3)]
+        batches = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/task-instances/heartbeats"
+            tis = json.loads(request.read())["task_instances"]
+            batches.append({ti["id"] for ti in tis})
+            if len(batches) == 1:
+                # Keep the first heartbeat in flight until the other ones are due
+                deadline = time.monotonic() + 10
+                while len(batcher._pending) < 2 and time.monotonic() < deadline:
+                    sleep(0.01)
+            results = [
+                {"id": ti["id"], "status_code": 409, "detail": {"reason": "not_running"}}
+                if ti["id"] == str(ti_ids[2])
+                else {"id": ti["id"], "status_code": 204, "refreshed_token": f"new-{ti['token']}"}
+                for ti in tis
+            ]
+            return httpx.Response(200, json={"results": results})
+
+        procs = []
+        for i, ti_id in enumerate(ti_ids):
+            client = make_client(transport=httpx.MockTransport(handle_request))
+            client.auth = sdk_client.BearerAuth(f"token-{i}")
+            procs.append(
+                ActivitySubprocess(
+                    process_log=mocker.MagicMock(),
+                    id=ti_id,
+                    pid=100 + i,
+                    stdin=mocker.MagicMock(),
+                    client=client,
+                    process=mocker.Mock(pid=100 + i),
+                )
+            )
+
+        threads = [threading.Thread(target=proc._send_heartbeat_if_needed) for proc in procs]
+        threads[0].start()
+        while not batches:
+            sleep(0.01)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert batches == [{str(ti_ids[0])}, {str(ti_ids[1]), str(ti_ids[2])}]
+        assert [proc.client.auth.token for proc in procs[:2]] == ["new-token-0", "new-token-1"]
+        assert [proc.failed_heartbeats for proc in procs] == [0, 0, 0]
+        # The TI the server rejected is terminated, like with the single heartbeat endpoint
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+        assert procs[2]._terminal_state == "SERVER_TERMINATED"
+
+    @pytest.mark.parametrize("status_code", [404, 409])
+    def test_batched_heartbeats_request_failure(self, status_code, monkeypatch, mocker, captured_logs):
+        """Test that a failure of the whole batch request is not taken as the server rejecting the tasks."""
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.BATCH_HEARTBEATS", True)
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor._heartbeat_batcher", HeartbeatBatcher())
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        client = make_client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(status_code, json={"detail": "oops"})
+            )
+        )
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=uuid7(),
+            pid=100,
+            stdin=mocker.MagicMock(),
+            client=client,
+            process=mocker.Mock(pid=100),
+        )
+
+        proc._send_heartbeat_if_needed()
+
+        assert proc.failed_heartbeats == 1
+        assert proc._terminal_state is None
+        mock_kill.assert_not_called()
+        assert [log["event"] for log in captured_logs] == ["Failed to send heartbeat. Will be retried"]
+
     @pytest.mark.parametrize(
         ["terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"],
         [
@@ -2095,6 +2183,73 @@ class TestHandleRequest:
             decoder = CommsDecoder(socket=None).body_decoder
             assert decoder.validate_python(frame.body) == mock_response
 
+    def test_handle_requests_chunked_xcom(self, watched_subprocess, mocker):
+        """Test that the chunks of a large XCom are streamed to the API server from a temporary file."""
+        watched_subprocess, read_socket = watched_subprocess
+        sent = []
+
+        def set_from_file(dag_id, run_id, task_id, key, file, *args):
+            # The client reads the file from its start
+            file.seek(0)
+            sent.append((dag_id, run_id, task_id, key, file.read(), *args))
+
+        watched_subprocess.client.xcoms.set_from_file.side_effect = set_from_file
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        messages = [
+            SetXComChunk(data=b'{"key": '),
+            SetXComChunk(data=b'"value"}'),
+            SetXCom(
+                dag_id="test_dag",
+                run_id="test_run",
+                task_id="test_task",
+                key="test_key",
+                value=None,
+                map_index=2,
+                chunked=True,
+            ),
+        ]
+        for i, message in enumerate(messages):
+            generator.send(_RequestFrame(id=i, body=message.model_dump()))
+
+        assert sent == [("test_dag", "test_run", "test_task", "test_key", b'{"key": "value"}', 2, None)]
+        watched_subprocess.client.xcoms.set.assert_not_called()
+        assert watched_subprocess._xcom_chunks is None
+        # Each message got its response
+        read_socket.settimeout(0.1)
+        decoder = msgspec.msgpack.Decoder(_ResponseFrame)
+        frames = [
+            decoder.decode(read_socket.recv(int.from_bytes(read_socket.recv(4), "big"))) for _ in messages
+        ]
+        assert [(frame.id, frame.error) for frame in frames] == [(0, None), (1, None), (2, None)]
+
+    def test_handle_requests_encoded_xcom(self, watched_subprocess, mocker):
+        """Test that an XCom value encoded by the task is sent to the API server as it is."""
+        watched_subprocess, read_socket = watched_subprocess
+        sent = []
+
+        def set_from_file(dag_id, run_id, task_id, key, file, *args):
+            sent.append((dag_id, run_id, task_id, key, file.read(), *args))
+
+        watched_subprocess.client.xcoms.set_from_file.side_effect = set_from_file
+
+        generator = watched_subprocess.handle_requests(log=mocker.Mock())
+        next(generator)
+        message = SetXCom(
+            dag_id="test_dag",
+            run_id="test_run",
+            task_id="test_task",
+            key="test_key",
+            value=None,
+            map_index=2,
+            encoded_value=b'{"key":"value"}',
+        )
+        generator.send(_RequestFrame(id=0, body=message.model_dump()))
+
+        assert sent == [("test_dag", "test_run", "test_task", "test_key", b'{"key":"value"}', 2, None)]
+        watched_subprocess.client.xcoms.set.assert_not_called()
+
     def test_handle_requests_api_server_error(self, watched_subprocess, mocker):
         """Test that API server errors are properly handled and sent back to the task."""
 